@@ -738,19 +738,27 @@ class OneButtonArtify:
     RETURN_TYPES = ("STRING",)
     RETURN_NAMES = ("artified_prompt",)
 
+    # a list of prompts is artified in one go, instead of running the node for every prompt
+    INPUT_IS_LIST = True
+    OUTPUT_IS_LIST = (True,)
+
     FUNCTION = "Comfy_OBP_Artify"
 
     #OUTPUT_NODE = False
 
     CATEGORY = "OneButtonPrompt"
     
-    def Comfy_OBP_Artify(self, prompt, artist, amount_of_artists,artify_mode, seed):
+    def Comfy_OBP_Artify(self, prompt, artist, amount_of_artists,artify_mode, seed=None):
         # artify here
-        artified_prompt = artify_prompt(prompt=prompt, artists=artist, amountofartists=amount_of_artists, mode=artify_mode, seed=seed)
+        # every input is a list, with a value per prompt or a single value for all of them
+        if(seed is None):
+            seed = [0]
+        artified_prompts = artify_prompts(prompt, artists=artist, amountofartists=amount_of_artists, mode=artify_mode, seed=seed)
         
-        print("Artified prompt: " + artified_prompt)
+        for artified_prompt in artified_prompts:
+            print("Artified prompt: " + artified_prompt)
         
-        return (artified_prompt,)
+        return (artified_prompts,)
 
 class OneButtonFlufferize:
 
@@ -1,3 +1,10 @@
+import collections
+import contextlib
+import inspect
+import io
+import multiprocessing
+import threading
+import time
 import random
 import re
 
@@ -21,11 +28,401 @@ OBPresets = OneButtonPresets()
 
 
 
+# Prompt cache
+# Opt in, with enable_prompt_cache() or PromptGenerator.enable_cache().
+# Keeps the prompts that were made with a seed above 0, keyed on every parameter (defaults filled in), the seed and the corpus version.
+# Asking for the same prompt again returns it straight away, until it is pushed out by newer prompts or is older than ttl seconds.
+# Calls without a seed, or with their own rng, are never cached.
+class PromptCache:
+    def __init__(self, maxsize=256, ttl=3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "bypassed": 0, "expired": 0, "evicted": 0}
+
+    def get(self, key):
+        # returns (True, prompt) on a hit, (False, None) otherwise
+        with self._lock:
+            entry = self._entries.get(key)
+            if(entry is not None and self.ttl is not None and time.monotonic() - entry[0] > self.ttl):
+                del self._entries[key]
+                self._stats["expired"] += 1
+                entry = None
+            if(entry is None):
+                self._stats["misses"] += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return True, entry[1]
+
+    def put(self, key, prompt):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), prompt)
+            self._entries.move_to_end(key)
+            while(len(self._entries) > self.maxsize):
+                self._entries.popitem(last=False)
+                self._stats["evicted"] += 1
+
+    def bypass(self):
+        with self._lock:
+            self._stats["bypassed"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            for stat in self._stats:
+                self._stats[stat] = 0
+
+    def stats(self):
+        # hitrate: hits out of the calls that could use the cache, bypassed calls don't count
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hitrate"] = stats["hits"] / lookups if lookups > 0 else 0.0
+        return stats
+
+_prompt_parameter_defaults = None
+
+def _prompt_cache_key(corpusversion, params):
+    # None when the parameters can't be used as a key
+    global _prompt_parameter_defaults
+    if(_prompt_parameter_defaults is None):
+        _prompt_parameter_defaults = {name: parameter.default for name, parameter in inspect.signature(_build_dynamic_prompt).parameters.items() if parameter.default is not inspect.Parameter.empty}
+    values = dict(_prompt_parameter_defaults)
+    values.update(params)
+    key = (corpusversion, tuple(sorted(values.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+# Prompt generator
+# Holds everything build_dynamic_prompt needs that stays the same from prompt to prompt:
+# the config per suffix, the antilist per antivalues, the artist categories and the style suffixes.
+# Keep one around and call generate() with the parameters of build_dynamic_prompt, build_dynamic_prompt itself uses a shared one.
+# All of it is rebuilt when a list in csvfiles/ or userfiles/ changes.
+# Looking for changes stats every list, so it is done at most once every _CORPUS_CHECK_INTERVAL seconds, refresh(force=True) looks right away.
+#
+# Thread safety: build_dynamic_prompt, createpromptvariant and artify_prompt can run from multiple threads at once,
+# for example from a ThreadPoolExecutor, as long as every call gets its own seed above 0 (or its own rng).
+# Every call then draws from its own random.Random, and every list it changes is its own copy.
+# The corpus, the caches and this generator are shared, and are only ever replaced, not changed, once they are built.
+# Without a seed, calls share the global random generator, which is safe but not reproducible.
+#
+# Everything is kept per kind (config, antilist, templates, ...) and per key, like the antivalues or the gender.
+# A kind keeps at most _GENERATOR_STATE_MAX keys, the oldest one is dropped first, so a server that gets new antivalues all the time doesn't keep growing.
+_GENERATOR_STATE_MAX = 32
+# kinds that are too big to keep that many of, the lists of createpromptvariant are about 130 lists per antilist, gender and artists
+_GENERATOR_STATE_LIMITS = {"variantlists": 8}
+_CORPUS_CHECK_INTERVAL = 1.0
+
+class PromptGenerator:
+    def __init__(self):
+        self.corpusversion = None
+        self.corpuschecked = 0.0
+        self._state = {}
+        self._lock = threading.RLock()
+        self.cache = None
+
+    def refresh(self, force=False):
+        now = time.monotonic()
+        if(force == False and self.corpusversion is not None and now - self.corpuschecked < _CORPUS_CHECK_INTERVAL):
+            return
+        corpusversion = get_corpus_version()
+        self.corpuschecked = now
+        if(corpusversion != self.corpusversion):
+            with self._lock:
+                self._state = {}
+                self.corpusversion = corpusversion
+
+    def _cached(self, key, build):
+        # key: (kind, ...)
+        state = self._state
+        entries = state.get(key[0])
+        value = entries.get(key) if entries is not None else None
+        if(value is None):
+            # built once, even when threads ask for it at the same moment
+            with self._lock:
+                entries = state.setdefault(key[0], {})
+                value = entries.get(key)
+                if(value is None):
+                    value = build()
+                    while(len(entries) >= _GENERATOR_STATE_LIMITS.get(key[0], _GENERATOR_STATE_MAX)):
+                        del entries[next(iter(entries))]
+                    entries[key] = value
+        return value
+
+    def config(self, suffix=""):
+        return self._cached(("config", suffix), lambda: load_config(suffix))
+
+    def antilist(self, antivalues=""):
+        return self._cached(("antilist", antivalues), lambda: build_antilist(antivalues))
+
+    def artist_category(self, category):
+        # a new list every time, prompts take the artists they use out of it
+        return list(self._cached(("artistcategory", category), lambda: tuple(artist_category_csv_to_list("artists_and_category", category))))
+
+    def templates(self, antilist):
+        # templates.csv and styles.csv without the antilist values, split and indexed once
+        return self._cached(("templates", antilist), lambda: TemplateStore(csv_to_list("templates", antilist,"./csvfiles/templates/",1,";",True), csv_to_list("styles", antilist,"./csvfiles/templates/",0,"?")))
+
+    def style_suffixes(self, antilist):
+        # every part after -subject- of the styles, plus every part of the artist descriptions
+        def build():
+            allstylessuffixlist = list(self.templates(antilist).stylesuffixes)
+
+            artistsuffix = artist_descriptions_csv_to_list("artists_and_category")
+            breakartiststylessuffix = [item.split(',') for item in artistsuffix]
+            artiststylessuffixlist = [value for sublist in breakartiststylessuffix for value in sublist]
+            artiststylessuffixlist = list(dict.fromkeys(artiststylessuffixlist))
+            allstylessuffixlist += artiststylessuffixlist
+            return tuple(allstylessuffixlist)
+        return list(self._cached(("stylesuffixes", antilist), build))
+
+    def enable_cache(self, maxsize=256, ttl=3600):
+        # see PromptCache, ttl=None keeps prompts until they are pushed out
+        self.cache = PromptCache(maxsize, ttl)
+        return self.cache
+
+    def disable_cache(self):
+        self.cache = None
+
+    # The lists that build_dynamic_prompt puts together out of other lists, made once per antilist (and gender)
+    def descriptors(self, antilist):
+        # descriptors.csv plus all the other descriptor lists, without the values that are already in there in another casing
+        def build():
+            descriptortotallist = []
+            for csvfilename in ["descriptors", "outfitdescriptors", "hairdescriptors", "humandescriptors", "locationdescriptors", "basicbitchdescriptors", "animaldescriptors"]:
+                descriptortotallist += csv_to_list(csvfilename, antilist)
+            # Deduplicate the list while preserving casings
+            descriptorlist = []
+            seen_items = set()
+            for item in descriptortotallist:
+                # Convert the item to lowercase to ignore casing
+                item_lower = item.lower()
+                if item_lower not in seen_items:
+                    seen_items.add(item_lower)
+                    descriptorlist.append(item)
+            return tuple(descriptorlist)
+        return list(self._cached(("descriptors", antilist), build))
+
+    def humans(self, antilist, gender):
+        def build():
+            humanlist = csv_to_list(csvfilename="fictional characters",antilist=antilist,skipheader=True,gender=gender)
+            humanlist += csv_to_list(csvfilename="nonfictional characters",antilist=antilist,skipheader=True,gender=gender)
+            humanlist += csv_to_list("humanoids",antilist)
+            return tuple(humanlist)
+        return list(self._cached(("humans", antilist, gender), build))
+
+    def objects(self, antilist):
+        def build():
+            objecttotallist = []
+            for csvfilename in ["objects", "buildings", "vehicles", "foods", "space", "flora", "containers", "occult"]:
+                objecttotallist += csv_to_list(csvfilename, antilist)
+            return tuple(objecttotallist)
+        return list(self._cached(("objects", antilist), build))
+
+    def outfit_prints(self, antilist):
+        # every object, plus the lists that can be printed on an outfit as well
+        def build():
+            outfitprinttotallist = self.objects(antilist)
+            for csvfilename in ["locations", "colors", "musicgenres", "seasons", "animals", "patterns"]:
+                outfitprinttotallist += csv_to_list(csvfilename, antilist)
+            return tuple(outfitprinttotallist)
+        return list(self._cached(("outfitprints", antilist), build))
+
+    def anime_vomit(self, antilist, vomitlist):
+        # the vomit list for anime mode, where the style and artist descriptions become face parts
+        # vomitlist is the list from csv_to_list, which of the vomit files it is comes from its name
+        def build():
+            replacements = {
+            "-allstylessuffix-": "-buildfacepart-",
+            "-artistdescription-": "-buildfacepart-"
+            }
+            animevomitlist = []
+            for item in vomitlist:
+                for old, new in replacements.items():
+                    item = item.replace(old, new)
+                animevomitlist.append(item)
+            return tuple(animevomitlist)
+        return list(self._cached(("animevomit", antilist, vomitlist.name), build))
+
+    def generate(self, **params):
+        self.refresh()
+        cache = self.cache
+        if(cache is None):
+            return _build_dynamic_prompt(self, **params)
+        key = None
+        if(params.get("seed", -1) > 0 and params.get("rng") is None):
+            key = _prompt_cache_key(self.corpusversion, params)
+        if(key is None):
+            cache.bypass()
+            return _build_dynamic_prompt(self, **params)
+        hit, prompt = cache.get(key)
+        if(hit):
+            return prompt
+        prompt = _build_dynamic_prompt(self, **params)
+        cache.put(key, prompt)
+        return prompt
+
+    def variant_lists(self, antilist, gender="all", artists="all"):
+        # the lists of createpromptvariant, see _build_variant_lists
+        return self._cached(("variantlists", antilist, gender, artists), lambda: _build_variant_lists(self, antilist, gender, artists))
+
+    def create_variant(self, **params):
+        # takes the parameters of createpromptvariant
+        self.refresh()
+        return _createpromptvariant(self, **params)
+
+    def create_variants(self, prompt="", amount=1, seed=-1, **params):
+        # amount of variants of the same prompt, with seed, seed + 1, ... or a random starting seed when seed is 0 or lower
+        # the lists are made once and the corpus is checked once for all of them
+        self.refresh()
+        if(seed <= 0):
+            seed = random.randint(1, 2**32)
+        results = []
+        with frozen_corpus():
+            for i in range(int(amount)):
+                results.append(_createpromptvariant(self, prompt=prompt, seed=seed + i, **params))
+        return results
+
+    def artify_artists(self, antilist, artists="all"):
+        # a new list every time, like artist_category
+        return list(self._cached(("artifyartists", antilist, artists), lambda: tuple(_build_artify_artists(antilist, artists))))
+
+    def artist_descriptions(self):
+        return list(self._cached(("artistdescriptions",), lambda: tuple(artist_descriptions_csv_to_list("artists_and_category"))))
+
+    def artify(self, **params):
+        # takes the parameters of artify_prompt
+        self.refresh()
+        return _artify_prompt(self, **params)
+
+    def artify_batch(self, prompts, seed=-1, **params):
+        # artifies every prompt, the corpus is checked once for all of them
+        # seed: the seed of the first prompt, the next ones get seed + 1, ... (a random start when 0 or lower)
+        # or a list of seeds, a list that is shorter than the prompts goes on from its last seed the same way
+        # the other parameters of artify_prompt can be a list as well, with one value for all prompts or a value per prompt
+        self.refresh()
+        prompts = list(prompts)
+        seeds = list(seed) if isinstance(seed, (list, tuple)) else [seed]
+        if(len(seeds) == 0 or len(seeds) > max(1, len(prompts))):
+            raise ValueError("artify_batch: got " + str(len(seeds)) + " seeds for " + str(len(prompts)) + " prompts")
+        startseed = seeds.pop()
+        if(startseed <= 0):
+            startseed = random.randint(1, 2**32)
+        seeds += [startseed + i for i in range(max(1, len(prompts) - len(seeds)))]
+        for name, value in params.items():
+            if(isinstance(value, (list, tuple)) and len(value) != 1 and len(value) != len(prompts)):
+                raise ValueError("artify_batch: " + name + " has " + str(len(value)) + " values for " + str(len(prompts)) + " prompts, give 1 or one per prompt")
+        results = []
+        with frozen_corpus():
+            for i, prompt in enumerate(prompts):
+                promptparams = {}
+                for name, value in params.items():
+                    if(isinstance(value, (list, tuple))):
+                        value = value[i if len(value) > 1 else 0]
+                    promptparams[name] = value
+                results.append(_artify_prompt(self, prompt=prompt, seed=seeds[i], **promptparams))
+        return results
+
+    def generate_batch(self, amount=1, seed=-1, **params):
+        # amount of prompts, with seed, seed + 1, ... or a random starting seed when seed is 0 or lower
+        # the corpus is checked once for the whole batch
+        # returns a list of (prompt, prompt_g, prompt_l, subject, seed)
+        self.refresh()
+        if(seed <= 0):
+            seed = random.randint(1, 2**32)
+        results = []
+        with frozen_corpus():
+            for i in range(int(amount)):
+                results.append(_build_dynamic_prompt(self, seed=seed + i, returndetails=True, **params))
+        return results
+
+    def generate_parallel(self, amount=1, seed=-1, workers=None, chunksize=16, **params):
+        # like generate_batch, but spread over a pool of worker processes, workers defaults to the amount of cores
+        # every prompt only depends on its own seed, so the output is the same for any amount of workers
+        # the seeds go out in chunks of seed, seed + 1, ... and the results come back one by one, in order
+        # with the spawn start method (Windows, macOS) call this from under if __name__ == "__main__":
+        if(seed <= 0):
+            seed = random.randint(1, 2**32)
+        amount = int(amount)
+        if(workers == 1):
+            self.refresh()
+            with frozen_corpus():
+                for i in range(amount):
+                    yield _build_dynamic_prompt(self, seed=seed + i, returndetails=True, **params)
+            return
+        chunks = [(seed + i, min(chunksize, amount - i)) for i in range(0, amount, chunksize)]
+        with multiprocessing.Pool(workers, _parallel_worker_init, (params,)) as pool:
+            for results in pool.imap(_parallel_worker_run, chunks):
+                for result in results:
+                    yield result
+
+# the parameters of the prompts of this worker process, set by _parallel_worker_init
+_parallel_params = {}
+
+def _parallel_worker_init(params):
+    global _parallel_params
+    _parallel_params = params
+    # one throwaway prompt reads and caches the files these parameters use, before the first chunk comes in
+    generator = get_prompt_generator()
+    generator.refresh()
+    with contextlib.redirect_stdout(io.StringIO()):
+        _build_dynamic_prompt(generator, seed=1, **params)
+
+def _parallel_worker_run(chunk):
+    start, count = chunk
+    generator = get_prompt_generator()
+    generator.refresh()
+    with frozen_corpus():
+        return [_build_dynamic_prompt(generator, seed=seed, returndetails=True, **_parallel_params) for seed in range(start, start + count)]
+
+_prompt_generator = None
+_prompt_generator_lock = threading.Lock()
+
+def get_prompt_generator():
+    global _prompt_generator
+    if(_prompt_generator is None):
+        with _prompt_generator_lock:
+            # another thread may have made it while this one waited
+            if(_prompt_generator is None):
+                _prompt_generator = PromptGenerator()
+    return _prompt_generator
+
+# the prompt cache of build_dynamic_prompt, see PromptCache
+def enable_prompt_cache(maxsize = 256, ttl = 3600):
+    return get_prompt_generator().enable_cache(maxsize, ttl)
+
+def disable_prompt_cache():
+    get_prompt_generator().disable_cache()
+
+def get_prompt_cache_stats():
+    # None when the cache is off
+    cache = get_prompt_generator().cache
+    if(cache is None):
+        return None
+    return cache.stats()
+
+# builds an amount of prompts in one go, see PromptGenerator.generate_batch
+def build_dynamic_prompts(amount = 1, seed = -1, **params):
+    return get_prompt_generator().generate_batch(amount, seed, **params)
+
+# builds an amount of prompts over multiple processes, see PromptGenerator.generate_parallel
+def build_dynamic_prompts_parallel(amount = 1, seed = -1, workers = None, **params):
+    return get_prompt_generator().generate_parallel(amount, seed, workers, **params)
+
 #builds a prompt dynamically
 # insanity level controls randomness of propmt 0-10
 # forcesubject van be used to force a certain type of subject
 # Set artistmode to none, to exclude artists 
-def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all", imagetype = "all", onlyartists = False, antivalues = "", prefixprompt = "", suffixprompt ="",promptcompounderlevel ="1", seperator = "comma", givensubject="",smartsubject = True,giventypeofimage="", imagemodechance = 20, gender = "all", subtypeobject="all", subtypehumanoid="all", subtypeconcept="all", advancedprompting=True, hardturnoffemojis=False, seed=-1, overrideoutfit="", prompt_g_and_l = False, base_model = "SD1.5", OBP_preset = "", prompt_enhancer = "none", subtypeanimal="all", subtypelocation="all", preset_prefix = "", preset_suffix = ""):
+def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all", imagetype = "all", onlyartists = False, antivalues = "", prefixprompt = "", suffixprompt ="",promptcompounderlevel ="1", seperator = "comma", givensubject="",smartsubject = True,giventypeofimage="", imagemodechance = 20, gender = "all", subtypeobject="all", subtypehumanoid="all", subtypeconcept="all", advancedprompting=True, hardturnoffemojis=False, seed=-1, overrideoutfit="", prompt_g_and_l = False, base_model = "SD1.5", OBP_preset = "", prompt_enhancer = "none", subtypeanimal="all", subtypelocation="all", preset_prefix = "", preset_suffix = "", rng = None):
+    return get_prompt_generator().generate(insanitylevel=insanitylevel, forcesubject=forcesubject, artists=artists, imagetype=imagetype, onlyartists=onlyartists, antivalues=antivalues, prefixprompt=prefixprompt, suffixprompt=suffixprompt, promptcompounderlevel=promptcompounderlevel, seperator=seperator, givensubject=givensubject, smartsubject=smartsubject, giventypeofimage=giventypeofimage, imagemodechance=imagemodechance, gender=gender, subtypeobject=subtypeobject, subtypehumanoid=subtypehumanoid, subtypeconcept=subtypeconcept, advancedprompting=advancedprompting, hardturnoffemojis=hardturnoffemojis, seed=seed, overrideoutfit=overrideoutfit, prompt_g_and_l=prompt_g_and_l, base_model=base_model, OBP_preset=OBP_preset, prompt_enhancer=prompt_enhancer, subtypeanimal=subtypeanimal, subtypelocation=subtypelocation, preset_prefix=preset_prefix, preset_suffix=preset_suffix, rng=rng)
+
+def _build_dynamic_prompt(generator, insanitylevel = 5, forcesubject = "all", artists = "all", imagetype = "all", onlyartists = False, antivalues = "", prefixprompt = "", suffixprompt ="",promptcompounderlevel ="1", seperator = "comma", givensubject="",smartsubject = True,giventypeofimage="", imagemodechance = 20, gender = "all", subtypeobject="all", subtypehumanoid="all", subtypeconcept="all", advancedprompting=True, hardturnoffemojis=False, seed=-1, overrideoutfit="", prompt_g_and_l = False, base_model = "SD1.5", OBP_preset = "", prompt_enhancer = "none", subtypeanimal="all", subtypelocation="all", preset_prefix = "", preset_suffix = "", returndetails = False, rng = None):
 
     remove_weights = False
     less_verbose = False
@@ -64,17 +461,17 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
     # For use in ComfyUI (might bring to Automatic1111 as well)
     # lets do it when its larger than 0
     # Otherwise, just do nothing and it will keep on working based on an earlier set seed
-    if(seed > 0):
-        random.seed(seed)
+    # Everything is drawn from rng, so parallel prompts with their own seed don't get in each others way
+    rng = get_rng(seed, rng)
 
     originalinsanitylevel = insanitylevel
-    if(advancedprompting != False and random.randint(0,max(0, insanitylevel - 2)) <= 0):
+    if(advancedprompting != False and rng.randint(0,max(0, insanitylevel - 2)) <= 0):
         advancedprompting == False
 
     original_OBP_preset = OBP_preset
     if(OBP_preset == OBPresets.RANDOM_PRESET_OBP):
         obp_options = OBPresets.load_obp_presets()
-        random_preset = random.choice(list(obp_options.keys()))
+        random_preset = rng.choice(list(obp_options.keys()))
         print("Engaging randomized presets, locking on to: " + random_preset)
 
         selected_opb_preset = OBPresets.get_obp_preset(random_preset)
@@ -171,33 +568,25 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
         configfilesuffix = "anime"
     
     # Hard overwrite some stuff because people dont config this themselves
-    if((anime_mode or imagetype == "all - anime") and (artists == "all" or normal_dist(insanitylevel))):
+    if((anime_mode or imagetype == "all - anime") and (artists == "all" or normal_dist(insanitylevel, rng))):
         artists = "none"
 
 
-    # load the config file
+    # load the config file, compiled once and only reloaded when it changes
 
-    config = load_config_csv(configfilesuffix)
+    config = generator.config(configfilesuffix)
 
        
     # first build up a complete anti list. Those values are removing during list building
     # this uses the antivalues string AND the antilist.csv
-    emptylist = []
-    antilist = csv_to_list("antilist",emptylist , "./userfiles/",1)
-    
-    antivaluelist = antivalues.split(",")
-
-    antilist += antivaluelist
-
-    # clean up antivalue list:
-    antilist = [s.strip().lower() for s in antilist]
+    antilist = generator.antilist(antivalues)
 
     
 
     # Some tricks for gender to make sure we can choose Him/Her/It etc on the right time.
     if(gender=="all"):
         genderchoicelist = ["male", "female"]
-        gender = random.choice(genderchoicelist)
+        gender = rng.choice(genderchoicelist)
     heshelist = ["it"]
     hisherlist = ["its"]
     himherlist = ["it"]
@@ -207,155 +596,138 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
         oppositegender = "female"
 
     # build all lists here
-
-    colorlist = csv_to_list("colors",antilist)
-    animallist = csv_to_list("animals",antilist)    
-    materiallist = csv_to_list("materials",antilist)
-    objectlist = csv_to_list("objects",antilist)
-    fictionallist = csv_to_list(csvfilename="fictional characters",antilist=antilist,skipheader=True,gender=gender)
-    nonfictionallist = csv_to_list(csvfilename="nonfictional characters",antilist=antilist,skipheader=True,gender=gender)
-    oppositefictionallist = csv_to_list(csvfilename="fictional characters",antilist=antilist,skipheader=True,gender=oppositegender)
-    oppositenonfictionallist = csv_to_list(csvfilename="nonfictional characters",antilist=antilist,skipheader=True,gender=oppositegender)
-    conceptsuffixlist = csv_to_list("concept_suffix",antilist)
-    buildinglist = csv_to_list("buildings",antilist)
-    vehiclelist = csv_to_list("vehicles",antilist)
-    outfitlist = csv_to_list("outfits",antilist)
-    locationlist = csv_to_list("locations",antilist)
-    backgroundlist = csv_to_list("backgrounds",antilist)
-
-    accessorielist = csv_to_list("accessories",antilist,"./csvfiles/",0,"?",False,False,gender)
-    artmovementlist = csv_to_list("artmovements",antilist)
-    bodytypelist = csv_to_list("body_types",antilist=antilist,skipheader=True,gender=gender)
-    cameralist = csv_to_list("cameras",antilist)
-    colorschemelist = csv_to_list("colorscheme",antilist)
-    conceptprefixlist = csv_to_list("concept_prefix",antilist)
-    culturelist = csv_to_list("cultures",antilist)
-    descriptorlist = csv_to_list("descriptors",antilist)
-    devmessagelist = csv_to_list("devmessages",antilist)
-    directionlist = csv_to_list(csvfilename="directions",antilist=antilist,insanitylevel=insanitylevel)
-    emojilist = csv_to_list("emojis",antilist)
-    eventlist = csv_to_list("events",antilist)
-    focuslist = csv_to_list(csvfilename="focus",antilist=antilist, insanitylevel=insanitylevel)
-    greatworklist = csv_to_list("greatworks",antilist)
-    haircolorlist = csv_to_list("haircolors",antilist)
-    hairstylelist = csv_to_list("hairstyles",antilist)
-    hairvomitlist = csv_to_list("hairvomit",antilist,"./csvfiles/",0,"?",False,False)
+    # they are only loaded when they are used, get_lazy_list_stats() tells how many were needed for this prompt
+    reset_lazy_list_stats()
+
+    colorlist = csv_to_list("colors",antilist, lazy=True)
+    animallist = csv_to_list("animals",antilist, lazy=True)    
+    materiallist = csv_to_list("materials",antilist, lazy=True)
+    objectlist = csv_to_list("objects",antilist, lazy=True)
+    fictionallist = csv_to_list(csvfilename="fictional characters",antilist=antilist,skipheader=True,gender=gender, lazy=True)
+    nonfictionallist = csv_to_list(csvfilename="nonfictional characters",antilist=antilist,skipheader=True,gender=gender, lazy=True)
+    oppositefictionallist = csv_to_list(csvfilename="fictional characters",antilist=antilist,skipheader=True,gender=oppositegender, lazy=True)
+    oppositenonfictionallist = csv_to_list(csvfilename="nonfictional characters",antilist=antilist,skipheader=True,gender=oppositegender, lazy=True)
+    conceptsuffixlist = csv_to_list("concept_suffix",antilist, lazy=True)
+    buildinglist = csv_to_list("buildings",antilist, lazy=True)
+    vehiclelist = csv_to_list("vehicles",antilist, lazy=True)
+    outfitlist = csv_to_list("outfits",antilist, lazy=True)
+    locationlist = csv_to_list("locations",antilist, lazy=True)
+    backgroundlist = csv_to_list("backgrounds",antilist, lazy=True)
+
+    accessorielist = csv_to_list("accessories",antilist,"./csvfiles/",0,"?",False,False,gender, lazy=True)
+    artmovementlist = csv_to_list("artmovements",antilist, lazy=True)
+    bodytypelist = csv_to_list("body_types",antilist=antilist,skipheader=True,gender=gender, lazy=True)
+    cameralist = csv_to_list("cameras",antilist, lazy=True)
+    colorschemelist = csv_to_list("colorscheme",antilist, lazy=True)
+    conceptprefixlist = csv_to_list("concept_prefix",antilist, lazy=True)
+    culturelist = csv_to_list("cultures",antilist, lazy=True)
+    descriptorlist = csv_to_list("descriptors",antilist, lazy=True)
+    devmessagelist = csv_to_list("devmessages",antilist, lazy=True)
+    directionlist = csv_to_list(csvfilename="directions",antilist=antilist,insanitylevel=insanitylevel, lazy=True, rng=rng)
+    emojilist = csv_to_list("emojis",antilist, lazy=True)
+    eventlist = csv_to_list("events",antilist, lazy=True)
+    focuslist = csv_to_list(csvfilename="focus",antilist=antilist, insanitylevel=insanitylevel, lazy=True, rng=rng)
+    greatworklist = csv_to_list("greatworks",antilist, lazy=True)
+    haircolorlist = csv_to_list("haircolors",antilist, lazy=True)
+    hairstylelist = csv_to_list("hairstyles",antilist, lazy=True)
+    hairvomitlist = csv_to_list("hairvomit",antilist,"./csvfiles/",0,"?",False,False, lazy=True)
     
-    humanoidlist = csv_to_list("humanoids",antilist)
+    humanoidlist = csv_to_list("humanoids",antilist, lazy=True)
     if(anime_mode or imagetype=="all - anime"):
         if(imagetype == "all"):
             imagetype = "all - anime"
-        imagetypelist = csv_to_list(csvfilename="imagetypes_anime",antilist=antilist, insanitylevel=insanitylevel, delimiter="?")
+        imagetypelist = csv_to_list(csvfilename="imagetypes_anime",antilist=antilist, insanitylevel=insanitylevel, delimiter="?", lazy=True, rng=rng)
     else:
-        imagetypelist = csv_to_list(csvfilename="imagetypes",antilist=antilist, insanitylevel=insanitylevel, delimiter="?")
-
-    joblist = csv_to_list(csvfilename="jobs",antilist=antilist,skipheader=True,gender=gender)
-    lenslist = csv_to_list(csvfilename="lenses",antilist=antilist, insanitylevel=insanitylevel)
-    lightinglist = csv_to_list(csvfilename="lighting",antilist=antilist, insanitylevel=insanitylevel)
-    malefemalelist = csv_to_list(csvfilename="malefemale",antilist=antilist,skipheader=True,gender=gender)
-    manwomanlist = csv_to_list(csvfilename="manwoman",antilist=antilist,skipheader=True,gender=gender)
-    moodlist = csv_to_list(csvfilename="moods",antilist=antilist, insanitylevel=insanitylevel)
-    othertypelist = csv_to_list("othertypes",antilist)
-    poselist = csv_to_list("poses",antilist)
-    qualitylist = csv_to_list("quality",antilist)
-    shotsizelist = csv_to_list(csvfilename="shotsizes",antilist=antilist, insanitylevel=insanitylevel)
-    timeperiodlist = csv_to_list("timeperiods",antilist)
-    vomitlist = csv_to_list(csvfilename="vomit",antilist=antilist, insanitylevel=insanitylevel)
+        imagetypelist = csv_to_list(csvfilename="imagetypes",antilist=antilist, insanitylevel=insanitylevel, delimiter="?", lazy=True, rng=rng)
+
+    joblist = csv_to_list(csvfilename="jobs",antilist=antilist,skipheader=True,gender=gender, lazy=True)
+    lenslist = csv_to_list(csvfilename="lenses",antilist=antilist, insanitylevel=insanitylevel, lazy=True, rng=rng)
+    lightinglist = csv_to_list(csvfilename="lighting",antilist=antilist, insanitylevel=insanitylevel, lazy=True, rng=rng)
+    malefemalelist = csv_to_list(csvfilename="malefemale",antilist=antilist,skipheader=True,gender=gender, lazy=True)
+    manwomanlist = csv_to_list(csvfilename="manwoman",antilist=antilist,skipheader=True,gender=gender, lazy=True)
+    moodlist = csv_to_list(csvfilename="moods",antilist=antilist, insanitylevel=insanitylevel, lazy=True, rng=rng)
+    othertypelist = csv_to_list("othertypes",antilist, lazy=True)
+    poselist = csv_to_list("poses",antilist, lazy=True)
+    qualitylist = csv_to_list("quality",antilist, lazy=True)
+    shotsizelist = csv_to_list(csvfilename="shotsizes",antilist=antilist, insanitylevel=insanitylevel, lazy=True, rng=rng)
+    timeperiodlist = csv_to_list("timeperiods",antilist, lazy=True)
+    vomitlist = csv_to_list(csvfilename="vomit",antilist=antilist, insanitylevel=insanitylevel, lazy=True, rng=rng)
     if(anime_mode):
-        replacements = {
-        "-allstylessuffix-": "-buildfacepart-",
-        "-artistdescription-": "-buildfacepart-"
-        }
-
-        for i, item in enumerate(vomitlist):
-            for old, new in replacements.items():
-                item = item.replace(old, new)
-            vomitlist[i] = item
+        vomitlist = generator.anime_vomit(antilist, vomitlist)
         
 
-    foodlist = csv_to_list("foods", antilist)
-    genderdescriptionlist = csv_to_list(csvfilename="genderdescription",antilist=antilist,skipheader=True,gender=gender)
-    minilocationlist = csv_to_list("minilocations", antilist)
-    minioutfitlist = csv_to_list("minioutfits",antilist,"./csvfiles/",0,"?",False,False,gender)
-    seasonlist = csv_to_list("seasons", antilist)
-    elaborateoutfitlist = csv_to_list("elaborateoutfits", antilist)
-    minivomitlist = csv_to_list("minivomit", antilist)
-    imagetypequalitylist = csv_to_list("imagetypequality", antilist)
-    rpgclasslist = csv_to_list("rpgclasses", antilist)
-    brandlist = csv_to_list("brands", antilist)
-    spacelist = csv_to_list("space", antilist)
-    poemlinelist = csv_to_list("poemlines", antilist)
-    songlinelist = csv_to_list("songlines", antilist)
-    musicgenrelist = csv_to_list("musicgenres", antilist)
-    manwomanrelationlist = csv_to_list(csvfilename="manwomanrelations",antilist=antilist,skipheader=True,gender=gender)
-    manwomanmultiplelist = csv_to_list(csvfilename="manwomanmultiples",antilist=antilist,skipheader=True,gender=gender,delimiter="?")
-    waterlocationlist = csv_to_list("waterlocations", antilist)
-    containerlist = csv_to_list("containers", antilist)
-    firstnamelist = csv_to_list(csvfilename="firstnames",antilist=antilist,skipheader=True,gender=gender)
-    floralist = csv_to_list("flora", antilist)
-    printlist = csv_to_list("prints", antilist)
-    patternlist = csv_to_list("patterns", antilist)
-    chairlist = csv_to_list("chairs", antilist)
-    cardnamelist = csv_to_list("card_names", antilist)
-    coveringlist = csv_to_list("coverings", antilist)
-    facepartlist = csv_to_list("faceparts", antilist)
-    outfitvomitlist = csv_to_list(csvfilename="outfitvomit",antilist=antilist,delimiter="?")
-    humanvomitlist = csv_to_list("humanvomit", antilist)
-    eyecolorlist = csv_to_list("eyecolors", antilist)
-    fashiondesignerlist = csv_to_list("fashiondesigners", antilist)
-    colorcombinationlist = csv_to_list("colorcombinations", antilist)
-    materialcombinationlist = csv_to_list("materialcombinations", antilist)
-    agelist = csv_to_list("ages", antilist)
-    agecalculatorlist = csv_to_list("agecalculator", antilist)
-    elementlist = csv_to_list("elements", antilist)
-    settinglist = csv_to_list("settings", antilist)
-    charactertypelist = csv_to_list("charactertypes", antilist)
-    objectstoholdlist = csv_to_list("objectstohold", antilist)
-    episodetitlelist = csv_to_list(csvfilename="episodetitles",antilist=antilist,skipheader=True)
-    flufferlist = csv_to_list("fluff", antilist)
+    foodlist = csv_to_list("foods", antilist, lazy=True)
+    genderdescriptionlist = csv_to_list(csvfilename="genderdescription",antilist=antilist,skipheader=True,gender=gender, lazy=True)
+    minilocationlist = csv_to_list("minilocations", antilist, lazy=True)
+    minioutfitlist = csv_to_list("minioutfits",antilist,"./csvfiles/",0,"?",False,False,gender, lazy=True)
+    seasonlist = csv_to_list("seasons", antilist, lazy=True)
+    elaborateoutfitlist = csv_to_list("elaborateoutfits", antilist, lazy=True)
+    minivomitlist = csv_to_list("minivomit", antilist, lazy=True)
+    imagetypequalitylist = csv_to_list("imagetypequality", antilist, lazy=True)
+    rpgclasslist = csv_to_list("rpgclasses", antilist, lazy=True)
+    brandlist = csv_to_list("brands", antilist, lazy=True)
+    spacelist = csv_to_list("space", antilist, lazy=True)
+    poemlinelist = csv_to_list("poemlines", antilist, lazy=True)
+    songlinelist = csv_to_list("songlines", antilist, lazy=True)
+    musicgenrelist = csv_to_list("musicgenres", antilist, lazy=True)
+    manwomanrelationlist = csv_to_list(csvfilename="manwomanrelations",antilist=antilist,skipheader=True,gender=gender, lazy=True)
+    manwomanmultiplelist = csv_to_list(csvfilename="manwomanmultiples",antilist=antilist,skipheader=True,gender=gender,delimiter="?", lazy=True)
+    waterlocationlist = csv_to_list("waterlocations", antilist, lazy=True)
+    containerlist = csv_to_list("containers", antilist, lazy=True)
+    firstnamelist = csv_to_list(csvfilename="firstnames",antilist=antilist,skipheader=True,gender=gender, lazy=True)
+    floralist = csv_to_list("flora", antilist, lazy=True)
+    printlist = csv_to_list("prints", antilist, lazy=True)
+    patternlist = csv_to_list("patterns", antilist, lazy=True)
+    chairlist = csv_to_list("chairs", antilist, lazy=True)
+    cardnamelist = csv_to_list("card_names", antilist, lazy=True)
+    coveringlist = csv_to_list("coverings", antilist, lazy=True)
+    facepartlist = csv_to_list("faceparts", antilist, lazy=True)
+    outfitvomitlist = csv_to_list(csvfilename="outfitvomit",antilist=antilist,delimiter="?", lazy=True)
+    humanvomitlist = csv_to_list("humanvomit", antilist, lazy=True)
+    eyecolorlist = csv_to_list("eyecolors", antilist, lazy=True)
+    fashiondesignerlist = csv_to_list("fashiondesigners", antilist, lazy=True)
+    colorcombinationlist = csv_to_list("colorcombinations", antilist, lazy=True)
+    materialcombinationlist = csv_to_list("materialcombinations", antilist, lazy=True)
+    agelist = csv_to_list("ages", antilist, lazy=True)
+    agecalculatorlist = csv_to_list("agecalculator", antilist, lazy=True)
+    elementlist = csv_to_list("elements", antilist, lazy=True)
+    settinglist = csv_to_list("settings", antilist, lazy=True)
+    charactertypelist = csv_to_list("charactertypes", antilist, lazy=True)
+    objectstoholdlist = csv_to_list("objectstohold", antilist, lazy=True)
+    episodetitlelist = csv_to_list(csvfilename="episodetitles",antilist=antilist,skipheader=True, lazy=True)
+    flufferlist = csv_to_list("fluff", antilist, lazy=True)
     tokenlist = []
     
     # New set of lists
-    locationfantasylist = csv_to_list("locationsfantasy", antilist)
-    locationscifilist = csv_to_list("locationsscifi", antilist)
-    locationvideogamelist = csv_to_list("locationsvideogame", antilist)
-    locationbiomelist = csv_to_list("locationsbiome", antilist)
-    locationcitylist = csv_to_list("locationscities", antilist)
-    birdlist = csv_to_list("birds", antilist)
-    catlist = csv_to_list(csvfilename="cats", antilist=antilist,delimiter="?")
-    doglist = csv_to_list(csvfilename="dogs", antilist=antilist,delimiter="?")
-    insectlist = csv_to_list("insects", antilist)
-    pokemonlist = csv_to_list("pokemon", antilist)
-    pokemontypelist = csv_to_list("pokemontypes", antilist)
-    occultlist = csv_to_list("occult", antilist)
-    marinelifelist = csv_to_list("marinelife", antilist)
+    locationfantasylist = csv_to_list("locationsfantasy", antilist, lazy=True)
+    locationscifilist = csv_to_list("locationsscifi", antilist, lazy=True)
+    locationvideogamelist = csv_to_list("locationsvideogame", antilist, lazy=True)
+    locationbiomelist = csv_to_list("locationsbiome", antilist, lazy=True)
+    locationcitylist = csv_to_list("locationscities", antilist, lazy=True)
+    birdlist = csv_to_list("birds", antilist, lazy=True)
+    catlist = csv_to_list(csvfilename="cats", antilist=antilist,delimiter="?", lazy=True)
+    doglist = csv_to_list(csvfilename="dogs", antilist=antilist,delimiter="?", lazy=True)
+    insectlist = csv_to_list("insects", antilist, lazy=True)
+    pokemonlist = csv_to_list("pokemon", antilist, lazy=True)
+    pokemontypelist = csv_to_list("pokemontypes", antilist, lazy=True)
+    occultlist = csv_to_list("occult", antilist, lazy=True)
+    marinelifelist = csv_to_list("marinelife", antilist, lazy=True)
     
 
     # additional descriptor lists
-    outfitdescriptorlist = csv_to_list("outfitdescriptors",antilist)
-    hairdescriptorlist = csv_to_list("hairdescriptors",antilist)
-    humandescriptorlist = csv_to_list("humandescriptors",antilist)
-    locationdescriptorlist = csv_to_list("locationdescriptors",antilist)
-    basicbitchdescriptorlist = csv_to_list("basicbitchdescriptors",antilist)
-    animaldescriptorlist = csv_to_list("animaldescriptors",antilist)
+    outfitdescriptorlist = csv_to_list("outfitdescriptors",antilist, lazy=True)
+    hairdescriptorlist = csv_to_list("hairdescriptors",antilist, lazy=True)
+    humandescriptorlist = csv_to_list("humandescriptors",antilist, lazy=True)
+    locationdescriptorlist = csv_to_list("locationdescriptors",antilist, lazy=True)
+    basicbitchdescriptorlist = csv_to_list("basicbitchdescriptors",antilist, lazy=True)
+    animaldescriptorlist = csv_to_list("animaldescriptors",antilist, lazy=True)
 
     # descriptorlist becomes one with everything
-    descriptortotallist = descriptorlist + outfitdescriptorlist + hairdescriptorlist + humandescriptorlist + locationdescriptorlist + basicbitchdescriptorlist + animaldescriptorlist
-    # Deduplicate the list while preserving casings
-    descriptorlist = []
-    seen_items = set()
-
-    for item in descriptortotallist:
-        # Convert the item to lowercase to ignore casing
-        item_lower = item.lower()
-        
-        if item_lower not in seen_items:
-            seen_items.add(item_lower)
-            descriptorlist.append(item)
+    descriptorlist = generator.descriptors(antilist)
 
-    humanlist = fictionallist + nonfictionallist + humanoidlist
-    objecttotallist = objectlist + buildinglist + vehiclelist + foodlist + spacelist + floralist + containerlist + occultlist
-    outfitprinttotallist = objecttotallist + locationlist + colorlist + musicgenrelist + seasonlist + animallist + patternlist
+    humanlist = generator.humans(antilist, gender)
+    objecttotallist = generator.objects(antilist)
+    outfitprinttotallist = generator.outfit_prints(antilist)
     if(less_verbose):
         humanactivitycheatinglist = ["-miniactivity- OR(in;at) a OR(-location-;-building-;-waterlocation-)",
                                  "-miniactivity- OR(in;at) a OR(-location-;-building-;-waterlocation-)",
@@ -384,25 +756,25 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
     # Future: add in personal artists lists as well
     
     # lets maybe go wild "sometimes", based on insanitylevel
-    if(artists == "all" and rare_dist(insanitylevel)):
+    if(artists == "all" and rare_dist(insanitylevel, rng)):
        artists = "all (wild)"
        originalartistchoice = artists
 
     artisttypes = ["popular", "3D",	"abstract",	"angular", "anime"	,"architecture",	"art nouveau",	"art deco",	"baroque",	"bauhaus", 	"cartoon",	"character",	"children's illustration", 	"cityscape", "cinema",	"clean",	"cloudscape",	"collage",	"colorful",	"comics",	"cubism",	"dark",	"detailed", 	"digital",	"expressionism",	"fantasy",	"fashion",	"fauvism",	"figurativism",	"graffiti",	"graphic design",	"high contrast",	"horror",	"impressionism",	"installation",	"landscape",	"light",	"line drawing",	"low contrast",	"luminism",	"magical realism",	"manga",	"melanin",	"messy",	"monochromatic",	"nature",	"photography",	"pop art",	"portrait",	"primitivism",	"psychedelic",	"realism",	"renaissance",	"romanticism",	"scene",	"sci-fi",	"sculpture",	"seascape",	"space",	"stained glass",	"still life",	"storybook realism",	"street art",	"streetscape",	"surrealism",	"symbolism",	"textile",	"ukiyo-e",	"vibrant",	"watercolor",	"whimsical"]
     artiststyleselector = ""
     artiststyleselectormode = "normal"
-    if(artists == "all" and normal_dist(insanitylevel + 1)):
-        artiststyleselector = random.choice(artisttypes)
+    if(artists == "all" and normal_dist(insanitylevel + 1, rng)):
+        artiststyleselector = rng.choice(artisttypes)
         artists = artiststyleselector
     elif(artists == "all"):
         artiststyleselectormode = "custom"
          # then else maybe do nothing??
-        if(random.randint(0,6) == 0 and onlyartists == False):
+        if(rng.randint(0,6) == 0 and onlyartists == False):
             generateartist = False
         # go popular! Or even worse, we go full greg mode!
-        elif(common_dist(max(3,insanitylevel))):
+        elif(common_dist(max(3,insanitylevel), rng)):
             artists = "popular" 
-        elif(random.randint(0,1) == 0):
+        elif(rng.randint(0,1) == 0):
             # only on lower instanity levels anyway
             if(insanitylevel < 6):
                 #too much greg mode!
@@ -421,99 +793,91 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
     artistlist = []
     # create artist list to use in the code, maybe based on category  or personal lists
     if(artists != "all (wild)" and artists != "all" and artists != "none" and artists.startswith("personal_artists") == False and artists.startswith("personal artists") == False and artists in artisttypes):
-        artistlist = artist_category_csv_to_list("artists_and_category",artists)
+        artistlist = generator.artist_category(artists)
     elif(artists.startswith("personal_artists") == True or artists.startswith("personal artists") == True):
         artists = artists.replace(" ","_",-1) # add underscores back in
-        artistlist = csv_to_list(artists,antilist,"./userfiles/")
+        artistlist = csv_to_list(artists,antilist,"./userfiles/", lazy=True)
     elif(artists != "none"):
-        artistlist = csv_to_list("artists",antilist)
+        artistlist = csv_to_list("artists",antilist, lazy=True)
 
 
     # create special artists lists, used in templates
-    fantasyartistlist = artist_category_csv_to_list("artists_and_category","fantasy")
-    popularartistlist = artist_category_csv_to_list("artists_and_category","popular")
-    romanticismartistlist = artist_category_csv_to_list("artists_and_category","romanticism")
-    photographyartistlist = artist_category_csv_to_list("artists_and_category","photography")
-    portraitartistlist = artist_category_csv_to_list("artists_and_category","portrait")
-    characterartistlist = artist_category_csv_to_list("artists_and_category","character")
-    landscapeartistlist = artist_category_csv_to_list("artists_and_category","landscape")
-    scifiartistlist = artist_category_csv_to_list("artists_and_category","sci-fi")
-    graphicdesignartistlist = artist_category_csv_to_list("artists_and_category","graphic design")
-    digitalartistlist = artist_category_csv_to_list("artists_and_category","digital")
-    architectartistlist = artist_category_csv_to_list("artists_and_category","architecture")
-    cinemaartistlist = artist_category_csv_to_list("artists_and_category","cinema")
-    gregmodelist = csv_to_list("gregmode", antilist)
+    fantasyartistlist = generator.artist_category("fantasy")
+    popularartistlist = generator.artist_category("popular")
+    romanticismartistlist = generator.artist_category("romanticism")
+    photographyartistlist = generator.artist_category("photography")
+    portraitartistlist = generator.artist_category("portrait")
+    characterartistlist = generator.artist_category("character")
+    landscapeartistlist = generator.artist_category("landscape")
+    scifiartistlist = generator.artist_category("sci-fi")
+    graphicdesignartistlist = generator.artist_category("graphic design")
+    digitalartistlist = generator.artist_category("digital")
+    architectartistlist = generator.artist_category("architecture")
+    cinemaartistlist = generator.artist_category("cinema")
+    gregmodelist = csv_to_list("gregmode", antilist, lazy=True)
 
 
     # add any other custom lists
-    stylestiloralist = csv_to_list("styles_ti_lora",antilist,"./userfiles/")
+    stylestiloralist = csv_to_list("styles_ti_lora",antilist,"./userfiles/", lazy=True)
     generatestyle = bool(stylestiloralist) # True of not empty
 
-    custominputprefixlist = csv_to_list("custom_input_prefix",antilist,"./userfiles/")
+    custominputprefixlist = csv_to_list("custom_input_prefix",antilist,"./userfiles/", lazy=True)
     generatecustominputprefix = bool(custominputprefixlist) # True of not empty
 
-    custominputmidlist = csv_to_list("custom_input_mid",antilist,"./userfiles/")
+    custominputmidlist = csv_to_list("custom_input_mid",antilist,"./userfiles/", lazy=True)
     generatecustominputmid = bool(custominputmidlist) # True of not empty
 
-    custominputsuffixlist = csv_to_list("custom_input_suffix",antilist,"./userfiles/")
+    custominputsuffixlist = csv_to_list("custom_input_suffix",antilist,"./userfiles/", lazy=True)
     generatecustominputsuffix = bool(custominputsuffixlist) # True of not empty
 
-    customsubjectslist = csv_to_list("custom_subjects",antilist,"./userfiles/")
-    customoutfitslist = csv_to_list("custom_outfits",antilist,"./userfiles/")
+    customsubjectslist = csv_to_list("custom_subjects",antilist,"./userfiles/", lazy=True)
+    customoutfitslist = csv_to_list("custom_outfits",antilist,"./userfiles/", lazy=True)
 
     # special lists
-    backgroundtypelist = csv_to_list("backgroundtypes", antilist,"./csvfiles/special_lists/",0,"?")
-    insideshotlist =  csv_to_list("insideshots", antilist,"./csvfiles/special_lists/",0,"?")
-    photoadditionlist = csv_to_list("photoadditions", antilist,"./csvfiles/special_lists/",0,"?")
+    backgroundtypelist = csv_to_list("backgroundtypes", antilist,"./csvfiles/special_lists/",0,"?", lazy=True)
+    insideshotlist =  csv_to_list("insideshots", antilist,"./csvfiles/special_lists/",0,"?", lazy=True)
+    photoadditionlist = csv_to_list("photoadditions", antilist,"./csvfiles/special_lists/",0,"?", lazy=True)
     if(less_verbose):
-        buildhairlist = csv_to_list("buildhair_less_verbose", antilist,"./csvfiles/special_lists/",0,"?")
-        buildoutfitlist = csv_to_list("buildoutfit_less_verbose", antilist,"./csvfiles/special_lists/",0,"?")
-        humanadditionlist = csv_to_list("humanadditions_less_verbose", antilist,"./csvfiles/special_lists/",0,"?")
-        objectadditionslist = csv_to_list("objectadditions_less_verbose", antilist,"./csvfiles/special_lists/",0,"?")
-        buildfacelist = csv_to_list("buildface_less_verbose", antilist,"./csvfiles/special_lists/",0,"?")
-        buildaccessorielist = csv_to_list("buildaccessorie_less_verbose", antilist,"./csvfiles/special_lists/",0,"?")
-        humanactivitylist = csv_to_list("human_activities_less_verbose",antilist,"./csvfiles/",0,"?",False,False)
-        humanexpressionlist = csv_to_list("humanexpressions_less_verbose",antilist,"./csvfiles/",0,"?",False,False)
+        buildhairlist = csv_to_list("buildhair_less_verbose", antilist,"./csvfiles/special_lists/",0,"?", lazy=True)
+        buildoutfitlist = csv_to_list("buildoutfit_less_verbose", antilist,"./csvfiles/special_lists/",0,"?", lazy=True)
+        humanadditionlist = csv_to_list("humanadditions_less_verbose", antilist,"./csvfiles/special_lists/",0,"?", lazy=True)
+        objectadditionslist = csv_to_list("objectadditions_less_verbose", antilist,"./csvfiles/special_lists/",0,"?", lazy=True)
+        buildfacelist = csv_to_list("buildface_less_verbose", antilist,"./csvfiles/special_lists/",0,"?", lazy=True)
+        buildaccessorielist = csv_to_list("buildaccessorie_less_verbose", antilist,"./csvfiles/special_lists/",0,"?", lazy=True)
+        humanactivitylist = csv_to_list("human_activities_less_verbose",antilist,"./csvfiles/",0,"?",False,False, lazy=True)
+        humanexpressionlist = csv_to_list("humanexpressions_less_verbose",antilist,"./csvfiles/",0,"?",False,False, lazy=True)
     else:
-        buildhairlist = csv_to_list("buildhair", antilist,"./csvfiles/special_lists/",0,"?")
-        buildoutfitlist = csv_to_list("buildoutfit", antilist,"./csvfiles/special_lists/",0,"?")
-        humanadditionlist = csv_to_list("humanadditions", antilist,"./csvfiles/special_lists/",0,"?")
-        objectadditionslist = csv_to_list("objectadditions", antilist,"./csvfiles/special_lists/",0,"?")
-        buildfacelist = csv_to_list("buildface", antilist,"./csvfiles/special_lists/",0,"?")
-        buildaccessorielist = csv_to_list("buildaccessorie", antilist,"./csvfiles/special_lists/",0,"?")
-        humanactivitylist = csv_to_list("human_activities",antilist,"./csvfiles/",0,"?",False,False)
-        humanexpressionlist = csv_to_list("humanexpressions",antilist,"./csvfiles/",0,"?",False,False)
+        buildhairlist = csv_to_list("buildhair", antilist,"./csvfiles/special_lists/",0,"?", lazy=True)
+        buildoutfitlist = csv_to_list("buildoutfit", antilist,"./csvfiles/special_lists/",0,"?", lazy=True)
+        humanadditionlist = csv_to_list("humanadditions", antilist,"./csvfiles/special_lists/",0,"?", lazy=True)
+        objectadditionslist = csv_to_list("objectadditions", antilist,"./csvfiles/special_lists/",0,"?", lazy=True)
+        buildfacelist = csv_to_list("buildface", antilist,"./csvfiles/special_lists/",0,"?", lazy=True)
+        buildaccessorielist = csv_to_list("buildaccessorie", antilist,"./csvfiles/special_lists/",0,"?", lazy=True)
+        humanactivitylist = csv_to_list("human_activities",antilist,"./csvfiles/",0,"?",False,False, lazy=True)
+        humanexpressionlist = csv_to_list("humanexpressions",antilist,"./csvfiles/",0,"?",False,False, lazy=True)
 
     humanactivitylist = humanactivitylist + humanactivitycheatinglist
 
-    animaladditionlist = csv_to_list("animaladditions", antilist,"./csvfiles/special_lists/",0,"?")
+    animaladditionlist = csv_to_list("animaladditions", antilist,"./csvfiles/special_lists/",0,"?", lazy=True)
     
-    minilocationadditionslist = csv_to_list("minilocationadditions", antilist,"./csvfiles/special_lists/",0,"?")
-    overalladditionlist = csv_to_list("overalladditions", antilist,"./csvfiles/special_lists/",0,"?")
-    imagetypemodelist = csv_to_list("imagetypemodes", antilist,"./csvfiles/special_lists/",0,"?")
-    miniactivitylist = csv_to_list("miniactivity", antilist,"./csvfiles/special_lists/",0,"?")
-    animalsuffixadditionlist = csv_to_list("animalsuffixadditions", antilist,"./csvfiles/special_lists/",0,"?")
-    buildfacepartlist = csv_to_list("buildfaceparts", antilist,"./csvfiles/special_lists/",0,"?")
-    conceptmixerlist = csv_to_list("conceptmixer", antilist,"./csvfiles/special_lists/",0,"?")
+    minilocationadditionslist = csv_to_list("minilocationadditions", antilist,"./csvfiles/special_lists/",0,"?", lazy=True)
+    overalladditionlist = csv_to_list("overalladditions", antilist,"./csvfiles/special_lists/",0,"?", lazy=True)
+    imagetypemodelist = csv_to_list("imagetypemodes", antilist,"./csvfiles/special_lists/",0,"?", lazy=True)
+    miniactivitylist = csv_to_list("miniactivity", antilist,"./csvfiles/special_lists/",0,"?", lazy=True)
+    animalsuffixadditionlist = csv_to_list("animalsuffixadditions", antilist,"./csvfiles/special_lists/",0,"?", lazy=True)
+    buildfacepartlist = csv_to_list("buildfaceparts", antilist,"./csvfiles/special_lists/",0,"?", lazy=True)
+    conceptmixerlist = csv_to_list("conceptmixer", antilist,"./csvfiles/special_lists/",0,"?", lazy=True)
     
     
-    tokinatorlist = csv_to_list("tokinator", antilist,"./csvfiles/templates/",0,"?")
-    styleslist = csv_to_list("styles", antilist,"./csvfiles/templates/",0,"?")
-    stylessuffix = [item.split('-subject-')[1] for item in styleslist]
-    breakstylessuffix = [item.split(',') for item in stylessuffix]
-    allstylessuffixlist = [value for sublist in breakstylessuffix for value in sublist]
-    allstylessuffixlist = list(set(allstylessuffixlist))
-
-    artistsuffix = artist_descriptions_csv_to_list("artists_and_category")
-    breakartiststylessuffix = [item.split(',') for item in artistsuffix]
-    artiststylessuffixlist = [value for sublist in breakartiststylessuffix for value in sublist]
-    artiststylessuffixlist = list(set(artiststylessuffixlist))
-    allstylessuffixlist += artiststylessuffixlist
+    tokinatorlist = csv_to_list("tokinator", antilist,"./csvfiles/templates/",0,"?", lazy=True)
+    templatestore = generator.templates(antilist)
+    styleslist = templatestore.styles
+    allstylessuffixlist = generator.style_suffixes(antilist)
 
 
     
-    dynamictemplatesprefixlist = csv_to_list("dynamic_templates_prefix", antilist,"./csvfiles/templates/",0,"?")
-    dynamictemplatessuffixlist = csv_to_list("dynamic_templates_suffix", antilist,"./csvfiles/templates/",0,"?")
+    dynamictemplatesprefixlist = csv_to_list("dynamic_templates_prefix", antilist,"./csvfiles/templates/",0,"?", lazy=True)
+    dynamictemplatessuffixlist = csv_to_list("dynamic_templates_suffix", antilist,"./csvfiles/templates/",0,"?", lazy=True)
 
        
     # subjects
@@ -530,349 +894,119 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
     addontolocationlist = []
 
     # load subjects stuff from config
-    generatevehicle = True
-    generateobject = True
-    generatefood = True
-    generatebuilding = True
-    generatespace = True
-    generateflora = True
-    generateoccult = True
+    generatevehicle = config.generatevehicle
+    generateobject = config.generateobject
+    generatefood = config.generatefood
+    generatebuilding = config.generatebuilding
+    generatespace = config.generatespace
+    generateflora = config.generateflora
+    generateoccult = config.generateoccult
+    generateanimal = config.generateanimal
+    generatebird = config.generatebird
+    generatecat = config.generatecat
+    generatedog = config.generatedog
+    generateinsect = config.generateinsect
+    generatepokemon = config.generatepokemon
+    generatemarinelife = config.generatemarinelife
+    generatemanwoman = config.generatemanwoman
+    generatemanwomanrelation = config.generatemanwomanrelation
+    generatemanwomanmultiple = config.generatemanwomanmultiple
+    generatefictionalcharacter = config.generatefictionalcharacter
+    generatenonfictionalcharacter = config.generatenonfictionalcharacter
+    generatehumanoids = config.generatehumanoids
+    generatejob = config.generatejob
+    generatefirstnames = config.generatefirstnames
+    generatelocation = config.generatelocation
+    generatelocationfantasy = config.generatelocationfantasy
+    generatelocationscifi = config.generatelocationscifi
+    generatelocationvideogame = config.generatelocationvideogame
+    generatelocationbiome = config.generatelocationbiome
+    generatelocationcity = config.generatelocationcity
+    generateevent = config.generateevent
+    generateconcepts = config.generateconcepts
+    generatepoemline = config.generatepoemline
+    generatesongline = config.generatesongline
+    generatecardname = config.generatecardname
+    generateepisodetitle = config.generateepisodetitle
     generateconcept = True
-
-    generateanimal = True
-    generatebird = True
-    generatecat = True
-    generatedog = True
-    generateinsect = True
-    generatepokemon = True
-    generatemarinelife = True
-
-
-    generatemanwoman = True
-    generatemanwomanrelation = True
-    generatemanwomanmultiple = True
-    generatefictionalcharacter = True
-    generatenonfictionalcharacter = True
-    generatehumanoids = True
-    generatejob = True
-    generatefirstnames = True
-
     generatelandscape = True
-    generatelocation = True
-    generatelocationfantasy = True
-    generatelocationscifi = True
-    generatelocationvideogame = True
-    generatelocationbiome = True
-    generatelocationcity = True
-
-    generateevent = True
-    generateconcepts = True
-    generatepoemline = True
-    generatesongline = True
-    generatecardname = True
-    generateepisodetitle = True
-
-    custominputprefixrepeats = 2
-    custominputprefixchance = 'uncommon'
-
-    imagetypechance = 'normal'
-    generateimagetype = True
-    imagetypequalitychance = 'rare'
-    generateimagetypequality = True
     generateminilocationaddition = True
-    minilocationadditionchance = 'unique'
-    artmovementprefixchance = 'unique'
-    minivomitprefix1chance = 'rare'
-    minivomitprefix2chance = 'unique'
-    shotsizechance = 'uncommon'
-
-    subjectdescriptor1chance = 'common'
-    subjectdescriptor2chance = 'uncommon'
-    subjectbodytypechance = 'normal'
-    subjectculturechance = 'normal'
-    subjectconceptsuffixchance = 'unique'
-
-    subjectlandscapeinsideshotchance = 'unique'
-    subjectlandscapeaddonlocationchance = 'normal'
-    subjectlandscapeaddonlocationdescriptorchance = 'rare'
-    subjectlandscapeaddonlocationculturechance = 'rare'
-
-    objectadditionsrepeats = 2
-    objectadditionschance = 'uncommon'
-    humanadditionchance = 'rare'
-    overalladditionchance = 'extraordinary'
-
-    emojichance = 'legendary'
-    buildfacechance = 'legendary'
-    humanexpressionchance = 'rare'
-    joboractivitychance = 'normal'
-    humanvomitchance = 'rare'
-
-    custominputmidrepeats = 2
-    custominputmidchance = 'uncommon'
-    minivomitmidchance = 'unique'
-
-    outfitchance = 'normal'
-    posechance = 'uncommon'
-    hairchance = 'normal'
-    accessorychance = 'normal'
-    humanoidinsideshotchance = 'legendary'
-    humanoidbackgroundchance = 'uncommon'
-
-    landscapeminilocationchance = 'uncommon'
-    generalminilocationchance = 'rare'
-
-    timperiodchance = 'normal'
-    focuschance = 'normal'
-    directionchance = 'normal'
-    moodchance = 'normal'
-    minivomitsuffixchance = 'unique'
-    artmovementchance = 'normal'
-    lightingchance = 'normal'
-    photoadditionchance = 'common'
-    lenschance = 'normal'
-    colorschemechance = 'normal'
-    vomit1chance = 'uncommon'
-    vomit2chance= 'uncommon'
-    greatworkchance = 'novel'
-    poemlinechance = 'novel'
-    songlinechance = 'novel'
-    quality1chance = 'uncommon'
-    quality2chance = 'uncommon'
-
-    customstyle1chance = 'uncommon'
-    customstyle2chance = 'uncommon'
-
-    custominputsuffixrepeats = 2
-    custominputsuffixchance = 'uncommon'
-
-    artistsatbackchance = 'uncommon'
-
-    for item in config:
-        # objects
-        if item[0] == 'subject_vehicle' and item[1] != 'on':
-            generatevehicle = False
-        if item[0] == 'subject_object' and item[1] != 'on':
-            generateobject = False
-        if item[0] == 'subject_food' and item[1] != 'on':
-            generatefood = False
-        if item[0] == 'subject_building' and item[1] != 'on':
-            generatebuilding = False
-        if item[0] == 'subject_space' and item[1] != 'on':
-            generatespace = False
-        if item[0] == 'subject_flora' and item[1] != 'on':
-            generateflora = False
-        if item[0] == 'subject_occult' and item[1] != 'on':
-            generateoccult = False
-        # animals
-        if item[0] == 'subject_animal' and item[1] != 'on':
-            generateanimal = False
-        if item[0] == 'subject_bird' and item[1] != 'on':
-            generatebird = False
-        if item[0] == 'subject_cat' and item[1] != 'on':
-            generatecat = False
-        if item[0] == 'subject_dog' and item[1] != 'on':
-            generatedog = False
-        if item[0] == 'subject_insect' and item[1] != 'on':
-            generateinsect = False
-        if item[0] == 'subject_pokemon' and item[1] != 'on':
-            generatepokemon = False
-        if item[0] == 'subject_marinelife' and item[1] != 'on':
-            generatemarinelife = False
-        # humanoids
-        if item[0] == 'subject_manwoman' and item[1] != 'on':
-            generatemanwoman = False
-        if item[0] == 'subject_manwomanrelation' and item[1] != 'on':
-            generatemanwomanrelation = False
-        if item[0] == 'subject_manwomanmultiple' and item[1] != 'on':
-            generatemanwomanmultiple = False
-        if item[0] == 'subject_fictional' and item[1] != 'on':
-            generatefictionalcharacter = False
-        if item[0] == 'subject_nonfictional' and item[1] != 'on':
-            generatenonfictionalcharacter = False
-        if item[0] == 'subject_humanoid' and item[1] != 'on':
-            generatehumanoids = False
-        if item[0] == 'subject_job' and item[1] != 'on':
-            generatejob = False
-        if item[0] == 'subject_firstnames' and item[1] != 'on':
-            generatefirstnames = False
-        # landscape
-        if item[0] == 'subject_location' and item[1] != 'on':
-            generatelocation = False
-        if item[0] == 'subject_location_fantasy' and item[1] != 'on':
-            generatelocationfantasy = False
-        if item[0] == 'subject_location_scifi' and item[1] != 'on':
-            generatelocationscifi = False
-        if item[0] == 'subject_location_videogame' and item[1] != 'on':
-            generatelocationvideogame = False
-        if item[0] == 'subject_location_biome' and item[1] != 'on':
-            generatelocationbiome = False
-        if item[0] == 'subject_location_city' and item[1] != 'on':
-            generatelocationcity = False
-        # concept
-        if item[0] == 'subject_event' and item[1] != 'on':
-            generateevent = False
-        if item[0] == 'subject_concept' and item[1] != 'on':
-            generateconcepts = False
-        if item[0] == 'subject_poemline' and item[1] != 'on':
-            generatepoemline = False
-        if item[0] == 'subject_songline' and item[1] != 'on':
-            generatesongline = False
-        if item[0] == 'subject_cardname' and item[1] != 'on':
-            generatecardname = False
-        if item[0] == 'subject_episodetitle' and item[1] != 'on':
-            generateepisodetitle = False
-        
-        # main list stuff
-        if item[0] == 'custominputprefixrepeats':
-            custominputprefixrepeats = int(item[1])
-        if item[0] == 'custominputprefixchance':
-            custominputprefixchance = item[1]
-            if(custominputprefixchance == 'never'):
-                generatecustominputprefix = False
-        if item[0] == 'imagetypechance':
-            imagetypechance = item[1]
-            if(imagetypechance == 'never'):
-                generateimagetype = False
-        if item[0] == 'imagetypequalitychance':
-            imagetypequalitychance = item[1]
-            if(imagetypequalitychance == 'never'):
-                generateimagetypequality = False
-        if item[0] == 'minilocationadditionchance':
-            minilocationadditionchance = item[1]
-        if item[0] == 'artmovementprefixchance':
-            artmovementprefixchance = item[1]
-        if item[0] == 'minivomitprefix1chance':
-            minivomitprefix1chance = item[1]
-        if item[0] == 'minivomitprefix2chance':
-            minivomitprefix2chance = item[1]
-        
-        if item[0] == 'shotsizechance':
-            shotsizechance = item[1]
-
-        if item[0] == 'subjectdescriptor1chance':
-            subjectdescriptor1chance = item[1]
-        if item[0] == 'subjectdescriptor2chance':
-            subjectdescriptor2chance = item[1]
-        if item[0] == 'subjectbodytypechance':
-            subjectbodytypechance = item[1]
-        if item[0] == 'subjectculturechance':
-            subjectculturechance = item[1]
-        if item[0] == 'subjectconceptsuffixchance':
-            subjectconceptsuffixchance = item[1]
-
-        if item[0] == 'subjectlandscapeinsideshotchance':
-            subjectlandscapeinsideshotchance = item[1]
-        if item[0] == 'subjectlandscapeaddonlocationchance':
-            subjectlandscapeaddonlocationchance = item[1]
-        if item[0] == 'subjectlandscapeaddonlocationdescriptorchance':
-            subjectlandscapeaddonlocationdescriptorchance = item[1]
-        if item[0] == 'subjectlandscapeaddonlocationculturechance':
-            subjectlandscapeaddonlocationculturechance = item[1]
-
-        if item[0] == 'objectadditionsrepeats':
-            objectadditionsrepeats = int(item[1])
-        if item[0] == 'objectadditionschance':
-            objectadditionschance = item[1]
-        if item[0] == 'humanadditionchance':
-            humanadditionchance = item[1]
-        if item[0] == 'overalladditionchance':
-            overalladditionchance = item[1]
-
-        if item[0] == 'emojichance':
-            emojichance = item[1]
-            if(hardturnoffemojis==True):
-                emojichance='never'
-        if item[0] == 'buildfacechance':
-            buildfacechance = item[1]
-        if item[0] == 'humanexpressionchance':
-            humanexpressionchance = item[1]
-        if item[0] == 'humanvomitchance':
-            humanvomitchance = item[1]
-        if item[0] == 'joboractivitychance':
-            joboractivitychance = item[1]
-
-        if item[0] == 'custominputmidrepeats':
-            custominputmidrepeats = int(item[1])
-        if item[0] == 'custominputmidchance':
-            custominputmidchance = item[1]
-        if item[0] == 'minivomitmidchance':
-            minivomitmidchance = item[1]
-        
-        if item[0] == 'outfitchance':
-            outfitchance = item[1]
-        if item[0] == 'posechance':
-            posechance = item[1]
-        if item[0] == 'hairchance':
-            hairchance = item[1]
-        if item[0] == 'accessorychance':
-            accessorychance = item[1]
-        if item[0] == 'humanoidinsideshotchance':
-            humanoidinsideshotchance = item[1]
-        if item[0] == 'humanoidbackgroundchance':
-            humanoidbackgroundchance = item[1]
-
-        if item[0] == 'landscapeminilocationchance':
-            landscapeminilocationchance = item[1]
-        if item[0] == 'generalminilocationchance':
-            generalminilocationchance = item[1]
-
-        if item[0] == 'timperiodchance':
-            timperiodchance = item[1]
-        if item[0] == 'focuschance':
-            focuschance = item[1]
-        if item[0] == 'directionchance':
-            directionchance = item[1]
-        if item[0] == 'moodchance':
-            moodchance = item[1]
-        if item[0] == 'minivomitsuffixchance':
-            minivomitsuffixchance = item[1]
-        if item[0] == 'artmovementchance':
-            artmovementchance = item[1]
-        if item[0] == 'lightingchance':
-            lightingchance = item[1]
-        if item[0] == 'photoadditionchance':
-            photoadditionchance = item[1]
-        if item[0] == 'lenschance':
-            lenschance = item[1]
-        if item[0] == 'colorschemechance':
-            colorschemechance = item[1]
-        if item[0] == 'vomit1chance':
-            vomit1chance = item[1]
-        if item[0] == 'vomit2chance':
-            vomit2chance = item[1]
-        if item[0] == 'greatworkchance':
-            greatworkchance = item[1]
-        if item[0] == 'poemlinechance':
-            poemlinechance = item[1]
-        if item[0] == 'songlinechance':
-            songlinechance = item[1]
-        if item[0] == 'quality1chance':
-            quality1chance = item[1]
-        if item[0] == 'quality2chance':
-            quality2chance = item[1]
-
-        if item[0] == 'customstyle1chance':
-            customstyle1chance = item[1]
-        if item[0] == 'customstyle2chance':
-            customstyle2chance = item[1]
-        
-        if item[0] == 'custominputsuffixrepeats':
-            custominputsuffixrepeats = int(item[1])
-        if item[0] == 'custominputsuffixchance':
-            custominputsuffixchance = item[1]
-
-        if item[0] == 'artistsatbackchance':
-            artistsatbackchance = item[1]
-
-
-    generatevehicle = bool(vehiclelist) and generatevehicle
-    generateobject = bool(objectlist) and generateobject
-    generatefood = bool(foodlist) and generatefood
-    generatebuilding = bool(buildinglist) and generatebuilding
-    generatespace = bool(spacelist) and generatespace
-    generateflora = bool(floralist) and generateflora
-    generateoccult = bool(occultlist) and generateoccult
+
+    custominputprefixrepeats = config.custominputprefixrepeats
+    custominputprefixchance = config.custominputprefixchance
+    imagetypechance = config.imagetypechance
+    imagetypequalitychance = config.imagetypequalitychance
+    minilocationadditionchance = config.minilocationadditionchance
+    artmovementprefixchance = config.artmovementprefixchance
+    minivomitprefix1chance = config.minivomitprefix1chance
+    minivomitprefix2chance = config.minivomitprefix2chance
+    shotsizechance = config.shotsizechance
+    subjectdescriptor1chance = config.subjectdescriptor1chance
+    subjectdescriptor2chance = config.subjectdescriptor2chance
+    subjectbodytypechance = config.subjectbodytypechance
+    subjectculturechance = config.subjectculturechance
+    subjectconceptsuffixchance = config.subjectconceptsuffixchance
+    subjectlandscapeinsideshotchance = config.subjectlandscapeinsideshotchance
+    subjectlandscapeaddonlocationchance = config.subjectlandscapeaddonlocationchance
+    subjectlandscapeaddonlocationdescriptorchance = config.subjectlandscapeaddonlocationdescriptorchance
+    subjectlandscapeaddonlocationculturechance = config.subjectlandscapeaddonlocationculturechance
+    objectadditionsrepeats = config.objectadditionsrepeats
+    objectadditionschance = config.objectadditionschance
+    humanadditionchance = config.humanadditionchance
+    overalladditionchance = config.overalladditionchance
+    emojichance = config.emojichance
+    buildfacechance = config.buildfacechance
+    humanexpressionchance = config.humanexpressionchance
+    humanvomitchance = config.humanvomitchance
+    joboractivitychance = config.joboractivitychance
+    custominputmidrepeats = config.custominputmidrepeats
+    custominputmidchance = config.custominputmidchance
+    minivomitmidchance = config.minivomitmidchance
+    outfitchance = config.outfitchance
+    posechance = config.posechance
+    hairchance = config.hairchance
+    accessorychance = config.accessorychance
+    humanoidinsideshotchance = config.humanoidinsideshotchance
+    humanoidbackgroundchance = config.humanoidbackgroundchance
+    landscapeminilocationchance = config.landscapeminilocationchance
+    generalminilocationchance = config.generalminilocationchance
+    timperiodchance = config.timperiodchance
+    focuschance = config.focuschance
+    directionchance = config.directionchance
+    moodchance = config.moodchance
+    minivomitsuffixchance = config.minivomitsuffixchance
+    artmovementchance = config.artmovementchance
+    lightingchance = config.lightingchance
+    photoadditionchance = config.photoadditionchance
+    lenschance = config.lenschance
+    colorschemechance = config.colorschemechance
+    vomit1chance = config.vomit1chance
+    vomit2chance = config.vomit2chance
+    greatworkchance = config.greatworkchance
+    poemlinechance = config.poemlinechance
+    songlinechance = config.songlinechance
+    quality1chance = config.quality1chance
+    quality2chance = config.quality2chance
+    customstyle1chance = config.customstyle1chance
+    customstyle2chance = config.customstyle2chance
+    custominputsuffixrepeats = config.custominputsuffixrepeats
+    custominputsuffixchance = config.custominputsuffixchance
+    artistsatbackchance = config.artistsatbackchance
+
+    generatecustominputprefix = generatecustominputprefix and config.generatecustominputprefix
+    generateimagetype = config.generateimagetype
+    generateimagetypequality = config.generateimagetypequality
+    if(hardturnoffemojis==True):
+        emojichance = 'never'
+
+
+    generatevehicle = generatevehicle and bool(vehiclelist)
+    generateobject = generateobject and bool(objectlist)
+    generatefood = generatefood and bool(foodlist)
+    generatebuilding = generatebuilding and bool(buildinglist)
+    generatespace = generatespace and bool(spacelist)
+    generateflora = generateflora and bool(floralist)
+    generateoccult = generateoccult and bool(occultlist)
     generateobject = generatevehicle or generateobject or generatefood or generatebuilding or generatespace or generateflora or generateoccult
     
 
@@ -955,14 +1089,14 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
     if(generatemarinelife):
         animalwildcardlist.append("-marinelife-")
 
-    generatefictionalcharacter = bool(fictionallist) and generatefictionalcharacter
-    generatenonfictionalcharacter = bool(nonfictionallist) and generatenonfictionalcharacter
-    generatehumanoids = bool(humanoidlist) and generatehumanoids
-    generatemanwoman = bool(manwomanlist) and generatemanwoman
-    generatemanwomanrelation = bool(manwomanrelationlist) and generatemanwomanrelation
-    generatemanwomanmultiple = bool(manwomanmultiplelist) and generatemanwomanmultiple
-    generatejob = bool(joblist) and generatejob
-    generatefirstnames = bool(firstnamelist) and generatefirstnames
+    generatefictionalcharacter = generatefictionalcharacter and bool(fictionallist)
+    generatenonfictionalcharacter = generatenonfictionalcharacter and bool(nonfictionallist)
+    generatehumanoids = generatehumanoids and bool(humanoidlist)
+    generatemanwoman = generatemanwoman and bool(manwomanlist)
+    generatemanwomanrelation = generatemanwomanrelation and bool(manwomanrelationlist)
+    generatemanwomanmultiple = generatemanwomanmultiple and bool(manwomanmultiplelist)
+    generatejob = generatejob and bool(joblist)
+    generatefirstnames = generatefirstnames and bool(firstnamelist)
     generatehumanoid = generatefictionalcharacter or generatenonfictionalcharacter or generatehumanoids or generatemanwoman or generatejob or generatemanwomanrelation or generatefirstnames or generatemanwomanmultiple
 
 
@@ -1000,14 +1134,13 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
         humanoidsubjectchooserlist.append("firstname")
     
     
-    generateanimal = bool(animallist) and generateanimal
-    generatebird = bool(birdlist) and generatebird
-    generatecat = bool(catlist) and generatecat
-    generatedog = bool(doglist) and generatedog
-    generateinsect = bool(insectlist) and generateinsect
-    generatepokemon = bool(pokemonlist) and generatepokemon
-    generatemarinelife = bool(marinelifelist) and generatemarinelife
-
+    generateanimal = generateanimal and bool(animallist)
+    generatebird = generatebird and bool(birdlist)
+    generatecat = generatecat and bool(catlist)
+    generatedog = generatedog and bool(doglist)
+    generateinsect = generateinsect and bool(insectlist)
+    generatepokemon = generatepokemon and bool(pokemonlist)
+    generatemarinelife = generatemarinelife and bool(marinelifelist)
     generateanimaltotal = generateanimal or generatebird or generatecat or generatedog or generateinsect or generatepokemon or generatemarinelife
 
     if(generateanimal):
@@ -1029,12 +1162,12 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
     if(generateanimaltotal):
         mainchooserlist.append("animal")
 
-    generatelocation = bool(locationlist) and generatelocation
-    generatelocationfantasy = bool(locationfantasylist) and generatelocationfantasy
-    generatelocationscifi = bool(locationscifilist) and generatelocationscifi
-    generatelocationvideogame = bool(locationvideogamelist) and generatelocationvideogame
-    generatelocationbiome = bool(locationbiomelist) and generatelocationbiome
-    generatelocationcity = bool(locationcitylist) and generatelocationcity
+    generatelocation = generatelocation and bool(locationlist)
+    generatelocationfantasy = generatelocationfantasy and bool(locationfantasylist)
+    generatelocationscifi = generatelocationscifi and bool(locationscifilist)
+    generatelocationvideogame = generatelocationvideogame and bool(locationvideogamelist)
+    generatelocationbiome = generatelocationbiome and bool(locationbiomelist)
+    generatelocationcity = generatelocationcity and bool(locationcitylist)
     generatelandscape = generatelocation or generatelocationfantasy or generatelocationscifi or generatelocationvideogame or generatelocationbiome or generatelocationcity
 
     if(generatelandscape):
@@ -1057,15 +1190,12 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
     if(generatelocationcity):
         locationsubjectchooserlist.append("city")
     
-    generateevent = bool(eventlist) and generateevent
-    generateconcepts = bool(conceptprefixlist) and bool(conceptsuffixlist) and generateconcepts
-    generatepoemline = bool(poemlinelist) and generatepoemline 
-    generatesongline = bool(songlinelist) and generatesongline
-    generatecardname = bool(cardnamelist) and generatecardname
-    generateepisodetitle = bool(episodetitlelist) and generateepisodetitle
-    
-
-
+    generateevent = generateevent and bool(eventlist)
+    generateconcepts = generateconcepts and bool(conceptprefixlist) and bool(conceptsuffixlist)
+    generatepoemline = generatepoemline and bool(poemlinelist)
+    generatesongline = generatesongline and bool(songlinelist)
+    generatecardname = generatecardname and bool(cardnamelist)
+    generateepisodetitle = generateepisodetitle and bool(episodetitlelist)
     generateconcept = generateevent or generateconcepts or generatepoemline or generatesongline
 
     if(generateevent):
@@ -1092,7 +1222,7 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
 
 
     # determine wether we have a special mode or not
-    if(random.randint(1,int(imagemodechance)) == 1 and (imagetype == "all" or imagetype == "all - anime") and giventypeofimage == "" and onlyartists == False):
+    if(rng.randint(1,int(imagemodechance)) == 1 and (imagetype == "all" or imagetype == "all - anime") and giventypeofimage == "" and onlyartists == False):
         if(less_verbose):
             imagetypemodelist.remove("dynamic templates mode")
         if(anime_mode):
@@ -1100,7 +1230,7 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
             imagetypemodelist.remove("massive madness mode")
             imagetypemodelist.remove("fixed styles mode")
             imagetypemodelist.remove("unique art mode")
-        imagetype = random.choice(imagetypemodelist)  # override imagetype with a random "mode" value
+        imagetype = rng.choice(imagetypemodelist)  # override imagetype with a random "mode" value
 
 
 
@@ -1126,7 +1256,7 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
 
     if(imagetype == "art blaster mode"):
         specialmode = True
-        if(uncommon_dist(insanitylevel)):
+        if(uncommon_dist(insanitylevel, rng)):
             artblastermode = True
         elif(bool(artistlist)):
             onlysubjectmode = True
@@ -1393,6 +1523,7 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
     
     promptstocompound = int(promptcompounderlevel)
     compoundcounter = 0
+    subjectchooser = ""
 
     while compoundcounter < promptstocompound:
         isphoto = 0
@@ -1413,48 +1544,36 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
         completeprompt += ", "
 
         if(templatemode==True):
-            templatelist = csv_to_list("templates", antilist,"./csvfiles/templates/",1,";",True)
-
-            
-            # templateenvironments = [templateenvironment[1] for templateenvironment in templatelist]
-            # templateenvironmentsources = [templateenvironmentsource[2] for templateenvironmentsource in templatelist]
-            # templatesubjecttypes = [templatesubjecttype[3] for templatesubjecttype in templatelist]
-
             targettemplateenvironment = "all"
             templateenvironmentsources = "all"
 
             # takes the prompt based on filters:
             # targettemplateenvironment: either civitai model or website
             # templateenvironmentsources: either
-            templateprompts = [templateprompt[0] for templateprompt in templatelist if( (templateprompt[1] == targettemplateenvironment or targettemplateenvironment =="all") and (templateprompt[2] == templateenvironmentsources or templateenvironmentsources == "all") and (templateprompt[3] == forcesubject or forcesubject == "all") ) ]
-            templatepromptcreator = [templateprompt[1] for templateprompt in templatelist if( (templateprompt[1] == targettemplateenvironment or targettemplateenvironment =="all") and (templateprompt[2] == templateenvironmentsources or templateenvironmentsources == "all") and (templateprompt[3] == forcesubject or forcesubject == "all") ) ]
-            templatesubjects= [templateprompt[4] for templateprompt in templatelist if( (templateprompt[1] == targettemplateenvironment or targettemplateenvironment =="all") and (templateprompt[2] == templateenvironmentsources or templateenvironmentsources == "all") and (templateprompt[3] == forcesubject or forcesubject == "all") )]
-            
             # choose the template
-            chosentemplate = random.choice(templateprompts)
-            templateindex = templateprompts.index(chosentemplate)
+            chosentemplate, templatecreator, templatesubject = rng.choice(templatestore.templates(forcesubject, targettemplateenvironment, templateenvironmentsources))
 
-            print("Processing a prompt that was inspired from: " + templatepromptcreator[templateindex])
+            print("Processing a prompt that was inspired from: " + templatecreator)
 
             # if there is a subject override, then replace the subject with that
             if(givensubject==""):
-                completeprompt += chosentemplate.replace("-subject-",templatesubjects[templateindex] )
+                completeprompt += chosentemplate.replace("-subject-",templatesubject )
             elif(givensubject != "" and subjectingivensubject == False):
                 completeprompt += chosentemplate.replace("-subject-",givensubject )
             elif(givensubject != "" and subjectingivensubject == True):
-                completeprompt += chosentemplate.replace("-subject-", givensubjectpromptlist[0] + " " + templatesubjects[templateindex] + " " + givensubjectpromptlist[1])
+                completeprompt += chosentemplate.replace("-subject-", givensubjectpromptlist[0] + " " + templatesubject + " " + givensubjectpromptlist[1])
 
 
 
         # custom prefix list
         for i in range(custominputprefixrepeats):
-            if(chance_roll(insanitylevel, custominputprefixchance) and generatecustominputprefix == True):
-                completeprompt += random.choice(custominputprefixlist) + ", "
+            if(chance_roll(insanitylevel, custominputprefixchance, rng) and generatecustominputprefix == True):
+                completeprompt += rng.choice(custominputprefixlist) + ", "
 
 
 
         if(insanitylevel==0):
-            insanitylevel =  random.randint(1, 10)  # 10 = add everything, 1 is add almost nothing
+            insanitylevel =  rng.randint(1, 10)  # 10 = add everything, 1 is add almost nothing
         insanitylevel3 = int((insanitylevel/3) + 1.20)
 
         # print("Setting insanity level to " + str(insanitylevel))
@@ -1475,13 +1594,13 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
             # we want it to be MORE diverce when the insanity level raises
             # in this case, raise the chance for a humanoid, gets more wierd when going above 5
 
-            if(random.randint(0,6) > max(2,insanitylevel -2) and "concept" in mainchooserlist):
+            if(rng.randint(0,6) > max(2,insanitylevel -2) and "concept" in mainchooserlist):
                 mainchooserlist.remove("concept")
-            if(random.randint(0,6) > max(2,insanitylevel -2) and "landscape" in mainchooserlist):
+            if(rng.randint(0,6) > max(2,insanitylevel -2) and "landscape" in mainchooserlist):
                 mainchooserlist.remove("landscape")
-            if(random.randint(0,6) > max(2,insanitylevel -2) and "object" in mainchooserlist):
+            if(rng.randint(0,6) > max(2,insanitylevel -2) and "object" in mainchooserlist):
                 mainchooserlist.remove("object")
-            if(random.randint(0,6) > max(2,insanitylevel -2) and "animal" in mainchooserlist):
+            if(rng.randint(0,6) > max(2,insanitylevel -2) and "animal" in mainchooserlist):
                 mainchooserlist.remove("animal")
         
         # second for landscapes
@@ -1495,36 +1614,36 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
             # remove the shizzle based on chance?
             # we want it to be MORE diverce when the insanity level raises
             # in this case, raise the chance for a landscape, gets more wierd when going above 5
-            if(random.randint(0,6) > max(2,insanitylevel -2) and "concept" in mainchooserlist):
+            if(rng.randint(0,6) > max(2,insanitylevel -2) and "concept" in mainchooserlist):
                 mainchooserlist.remove("concept")
-            if(random.randint(0,6) > max(2,insanitylevel -2) and "animal" in mainchooserlist):
+            if(rng.randint(0,6) > max(2,insanitylevel -2) and "animal" in mainchooserlist):
                 mainchooserlist.remove("animal")
-            if(random.randint(0,6) > max(2,insanitylevel -2) and "object" in mainchooserlist):
+            if(rng.randint(0,6) > max(2,insanitylevel -2) and "object" in mainchooserlist):
                 mainchooserlist.remove("object")
-            if(random.randint(0,8) > max(2,insanitylevel -2) and "humanoid" in mainchooserlist):
+            if(rng.randint(0,8) > max(2,insanitylevel -2) and "humanoid" in mainchooserlist):
                 mainchooserlist.remove("humanoid")
 
         #focus in animemode on mostly humans
         if(anime_mode  and (forcesubject == "all" or forcesubject == "")):
-            if(random.randint(0,11) > max(2,insanitylevel -2) and "concept" in mainchooserlist):
+            if(rng.randint(0,11) > max(2,insanitylevel -2) and "concept" in mainchooserlist):
                 mainchooserlist.remove("concept")
-            if(random.randint(0,11) > max(2,insanitylevel -2) and "landscape" in mainchooserlist):
+            if(rng.randint(0,11) > max(2,insanitylevel -2) and "landscape" in mainchooserlist):
                 mainchooserlist.remove("landscape")
-            if(random.randint(0,11) > max(2,insanitylevel -2) and "object" in mainchooserlist):
+            if(rng.randint(0,11) > max(2,insanitylevel -2) and "object" in mainchooserlist):
                 mainchooserlist.remove("object")
-            if(random.randint(0,8) > max(2,insanitylevel -2) and "animal" in mainchooserlist):
+            if(rng.randint(0,8) > max(2,insanitylevel -2) and "animal" in mainchooserlist):
                 mainchooserlist.remove("animal")
     
 
         # choose the main subject type
-        mainchooser = random.choice(mainchooserlist)
+        mainchooser = rng.choice(mainchooserlist)
         
         if(forcesubject != "" and forcesubject != "all"):
             mainchooser = forcesubject    
         # 0 object, 1 animal, 2 animal as human, 3 ManWoman, 4 Job, 5 fictional, 6 non fictional, 7 humanoid, 8 landscape, 9 event
         if(mainchooser == "object"):
             subjectchooser = "object"
-        if(mainchooser == "animal" and (random.randint(0,5) == 5 or anime_mode)):
+        if(mainchooser == "animal" and (rng.randint(0,5) == 5 or anime_mode)):
             # sometimes interpret the animal as a human
             # for anime_mode this is always true
             animalashuman = True
@@ -1535,29 +1654,29 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
             # lower values even more stable
             # Upper values are still quite random
             humanoidsubjectchooserlistbackup = humanoidsubjectchooserlist.copy() # make a backup of the list
-            if(random.randint(0,20) > max(2,insanitylevel -2) and "manwomanrelation" in humanoidsubjectchooserlist):
+            if(rng.randint(0,20) > max(2,insanitylevel -2) and "manwomanrelation" in humanoidsubjectchooserlist):
                 humanoidsubjectchooserlist.remove("manwomanrelation")
-            if(random.randint(0,30) > max(2,insanitylevel -2) and "manwomanmultiple" in humanoidsubjectchooserlist):
+            if(rng.randint(0,30) > max(2,insanitylevel -2) and "manwomanmultiple" in humanoidsubjectchooserlist):
                 humanoidsubjectchooserlist.remove("manwomanmultiple")
-            if(random.randint(0,7) > max(2,insanitylevel -2) and "firstname" in humanoidsubjectchooserlist):
+            if(rng.randint(0,7) > max(2,insanitylevel -2) and "firstname" in humanoidsubjectchooserlist):
                 humanoidsubjectchooserlist.remove("firstname")
-            if(random.randint(0,5) > max(2,insanitylevel -2) and "job" in humanoidsubjectchooserlist):
+            if(rng.randint(0,5) > max(2,insanitylevel -2) and "job" in humanoidsubjectchooserlist):
                 humanoidsubjectchooserlist.remove("job")
-            if(random.randint(0,5) > max(2,insanitylevel -2) and "fictional" in humanoidsubjectchooserlist):
+            if(rng.randint(0,5) > max(2,insanitylevel -2) and "fictional" in humanoidsubjectchooserlist):
                 humanoidsubjectchooserlist.remove("fictional")
-            if(random.randint(0,5) > max(2,insanitylevel -2) and "non fictional" in humanoidsubjectchooserlist):
+            if(rng.randint(0,5) > max(2,insanitylevel -2) and "non fictional" in humanoidsubjectchooserlist):
                 humanoidsubjectchooserlist.remove("non fictional")
-            if(random.randint(0,5) > max(2,insanitylevel -2) and "humanoid" in humanoidsubjectchooserlist):
+            if(rng.randint(0,5) > max(2,insanitylevel -2) and "humanoid" in humanoidsubjectchooserlist):
                 humanoidsubjectchooserlist.remove("humanoid")
             # more random stuff on higher levels
-            if(random.randint(0,4) > max(2,insanitylevel -2) and "human" in humanoidsubjectchooserlist):
+            if(rng.randint(0,4) > max(2,insanitylevel -2) and "human" in humanoidsubjectchooserlist):
                 humanoidsubjectchooserlist.remove("human")
 
             # if we accidently remove everything, then restore the backup list
             if(not bool(humanoidsubjectchooserlist)):
                 humanoidsubjectchooserlist = humanoidsubjectchooserlistbackup
                         
-            subjectchooser = random.choice(humanoidsubjectchooserlist)
+            subjectchooser = rng.choice(humanoidsubjectchooserlist)
             
             
             
@@ -1581,11 +1700,11 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
                 else:
                     subjectchooser = subtypehumanoid
         if(mainchooser == "landscape"):
-            subjectchooser = random.choice(locationsubjectchooserlist)
+            subjectchooser = rng.choice(locationsubjectchooserlist)
 
         if(mainchooser == "concept"):
             #eventsubjectchooserlist = ["event", "concept", "poemline", "songline"]
-            subjectchooser = random.choice(eventsubjectchooserlist)
+            subjectchooser = rng.choice(eventsubjectchooserlist)
             if(subtypeconcept != "all"):
                 if(subtypeconcept == "event"):
                     subjectchooser = "event"
@@ -1611,7 +1730,7 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
             hisherlist = ["their"]
             himherlist = ["them"]
             # on rare occasions do "one of them"
-            if(random.randint(0,20) == 0):
+            if(rng.randint(0,20) == 0):
                 heshelist = ["one of them"]
                 hisherlist = ["one of their"]
                 himherlist = ["one of them"]
@@ -1629,7 +1748,7 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
             hisherlist = ["their"]
             himherlist = ["them"]
             # on rare occasions do "one of them"
-            if(random.randint(0,20) == 0):
+            if(rng.randint(0,20) == 0):
                 heshelist = ["one of them"]
                 hisherlist = ["one of their"]
                 himherlist = ["one of them"]
@@ -1644,19 +1763,19 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
         # start art blaster here
         if(artblastermode==True):
             step = 0
-            end = random.randint(1, insanitylevel) + 1
+            end = rng.randint(1, insanitylevel) + 1
             while step < end:
-                if(uncommon_dist(insanitylevel) and bool(artistlist)):
+                if(uncommon_dist(insanitylevel, rng) and bool(artistlist)):
                     completeprompt += "-artist-, "
-                if(uncommon_dist(insanitylevel) and bool(artmovementlist)):
+                if(uncommon_dist(insanitylevel, rng) and bool(artmovementlist)):
                     completeprompt += "-artmovement-, "
-                if(unique_dist(insanitylevel) and bool(vomitlist)):
+                if(unique_dist(insanitylevel, rng) and bool(vomitlist)):
                     completeprompt += "-vomit-, "
-                if(unique_dist(insanitylevel) and bool(imagetypelist)):
+                if(unique_dist(insanitylevel, rng) and bool(imagetypelist)):
                     completeprompt += "-imagetype-, "
-                if(unique_dist(insanitylevel) and bool(colorschemelist)):
+                if(unique_dist(insanitylevel, rng) and bool(colorschemelist)):
                     completeprompt += "-colorscheme-, "
-                if(uncommon_dist(insanitylevel) and bool(artistlist)):
+                if(uncommon_dist(insanitylevel, rng) and bool(artistlist)):
                     completeprompt += "-artiststyle-, "
                 step = step + 1 
 
@@ -1664,23 +1783,23 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
         # start unique art here
         if(uniqueartmode==True):
             step = 0
-            end = random.randint(1, insanitylevel) + 1
+            end = rng.randint(1, insanitylevel) + 1
             while step < end:
-                if(uncommon_dist(insanitylevel) and bool(othertypelist)):
+                if(uncommon_dist(insanitylevel, rng) and bool(othertypelist)):
                     completeprompt += "-othertype-, "
-                if(uncommon_dist(insanitylevel) and bool(artmovementlist)):
+                if(uncommon_dist(insanitylevel, rng) and bool(artmovementlist)):
                     completeprompt += "-artmovement-, "
-                if(uncommon_dist(insanitylevel) and bool(colorschemelist)):
+                if(uncommon_dist(insanitylevel, rng) and bool(colorschemelist)):
                     completeprompt += "-colorscheme-, "
-                if(rare_dist(insanitylevel) and bool(vomitlist)):
+                if(rare_dist(insanitylevel, rng) and bool(vomitlist)):
                     completeprompt += "-vomit-, "
-                if(rare_dist(insanitylevel) and bool(lightinglist)):
+                if(rare_dist(insanitylevel, rng) and bool(lightinglist)):
                     completeprompt += "-lighting-, "
-                if(unique_dist(insanitylevel) and bool(imagetypelist)):
+                if(unique_dist(insanitylevel, rng) and bool(imagetypelist)):
                     completeprompt += "-imagetype-, "
-                if(unique_dist(insanitylevel) and bool(qualitylist)):
+                if(unique_dist(insanitylevel, rng) and bool(qualitylist)):
                     completeprompt += "-quality-, "
-                if(unique_dist(insanitylevel) and bool(artistlist)):
+                if(unique_dist(insanitylevel, rng) and bool(artistlist)):
                     completeprompt += "-artistdescription-, "
                 
                 step = step + 1 
@@ -1688,96 +1807,96 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
         # start quality vomit here
         if(qualityvomitmode==True):
             step = 0
-            end = random.randint(1, insanitylevel) + 1
+            end = rng.randint(1, insanitylevel) + 1
             while step < end:
-                if(uncommon_dist(insanitylevel) and bool(vomitlist)):
+                if(uncommon_dist(insanitylevel, rng) and bool(vomitlist)):
                     completeprompt += "-vomit-, "
-                if(uncommon_dist(insanitylevel) and bool(flufferlist)):
+                if(uncommon_dist(insanitylevel, rng) and bool(flufferlist)):
                     completeprompt += "-fluff-, "
-                if(uncommon_dist(insanitylevel) and bool(qualitylist)):
+                if(uncommon_dist(insanitylevel, rng) and bool(qualitylist)):
                     completeprompt += "-quality-, "
-                if(unique_dist(insanitylevel) and bool(minivomitlist)):
+                if(unique_dist(insanitylevel, rng) and bool(minivomitlist)):
                     completeprompt += "-minivomit-, "
-                if(unique_dist(insanitylevel) and bool(artmovementlist)):
+                if(unique_dist(insanitylevel, rng) and bool(artmovementlist)):
                     completeprompt += "-artmovement-, "
-                if(unique_dist(insanitylevel) and bool(colorschemelist)):
+                if(unique_dist(insanitylevel, rng) and bool(colorschemelist)):
                     completeprompt += "-colorscheme-, "
                 step = step + 1
 
         # start mood color here
         if(colorcannonmode == True):
             step = 0
-            end = random.randint(1, insanitylevel) + 1
+            end = rng.randint(1, insanitylevel) + 1
             while step < end:
-                if(uncommon_dist(insanitylevel) and bool(moodlist)):
+                if(uncommon_dist(insanitylevel, rng) and bool(moodlist)):
                     completeprompt += "-mood-, "
-                if(uncommon_dist(insanitylevel) and bool(colorschemelist)):
+                if(uncommon_dist(insanitylevel, rng) and bool(colorschemelist)):
                     completeprompt += "-colorscheme-, "
-                if(rare_dist(insanitylevel) and bool(vomitlist)):
+                if(rare_dist(insanitylevel, rng) and bool(vomitlist)):
                     completeprompt += "-vomit-, "
-                if(unique_dist(insanitylevel) and bool(artmovementlist)):
+                if(unique_dist(insanitylevel, rng) and bool(artmovementlist)):
                     completeprompt += "-artmovement-, "
-                if(unique_dist(insanitylevel) and bool(lightinglist)):
+                if(unique_dist(insanitylevel, rng) and bool(lightinglist)):
                     completeprompt += "-lighting-, "
-                if(unique_dist(insanitylevel) and bool(allstylessuffixlist)):
+                if(unique_dist(insanitylevel, rng) and bool(allstylessuffixlist)):
                     completeprompt += "-allstylessuffix-, "
                 step = step + 1 
 
         # start photo fantasy here
         if(photofantasymode == True):
             step = 0
-            end = random.randint(1, insanitylevel) + 1
-            if(common_dist(insanitylevel)):
-                if(uncommon_dist(insanitylevel)):
+            end = rng.randint(1, insanitylevel) + 1
+            if(common_dist(insanitylevel, rng)):
+                if(uncommon_dist(insanitylevel, rng)):
                     completeprompt += "-imagetypequality- "
                 completeprompt += " photograph, "
             while step < end:
-                if(uncommon_dist(insanitylevel) and bool(lightinglist)):
+                if(uncommon_dist(insanitylevel, rng) and bool(lightinglist)):
                     completeprompt += "-photoaddition-, "
-                if(uncommon_dist(insanitylevel) and bool(lightinglist)):
+                if(uncommon_dist(insanitylevel, rng) and bool(lightinglist)):
                     completeprompt += "-lighting-, "
-                if(uncommon_dist(insanitylevel) and bool(cameralist)):
+                if(uncommon_dist(insanitylevel, rng) and bool(cameralist)):
                     completeprompt += "-camera-, "
-                if(rare_dist(insanitylevel) and bool(lenslist)):
+                if(rare_dist(insanitylevel, rng) and bool(lenslist)):
                     completeprompt += "-lens-, "
-                if(unique_dist(insanitylevel) and bool(moodlist)):
+                if(unique_dist(insanitylevel, rng) and bool(moodlist)):
                     completeprompt += "-mood-, "
-                if(unique_dist(insanitylevel) and bool(colorschemelist)):
+                if(unique_dist(insanitylevel, rng) and bool(colorschemelist)):
                     completeprompt += "-colorscheme-, "
                 step = step + 1 
 
         # start massive madness here
         if(massivemadnessmode == True):
             step = 0
-            end = random.randint(1, insanitylevel) + 1
+            end = rng.randint(1, insanitylevel) + 1
             while step < end:
-                if(rare_dist(insanitylevel) and bool(artistlist)):
+                if(rare_dist(insanitylevel, rng) and bool(artistlist)):
                     completeprompt += "-artist-, "
-                if(rare_dist(insanitylevel) and bool(descriptorlist)):
+                if(rare_dist(insanitylevel, rng) and bool(descriptorlist)):
                     completeprompt += "-descriptor-, "
-                if(rare_dist(insanitylevel) and bool(moodlist)):
+                if(rare_dist(insanitylevel, rng) and bool(moodlist)):
                     completeprompt += "-mood-, "
-                if(rare_dist(insanitylevel) and bool(colorschemelist)):
+                if(rare_dist(insanitylevel, rng) and bool(colorschemelist)):
                     completeprompt += "-colorscheme-, "
-                if(rare_dist(insanitylevel) and bool(vomitlist)):
+                if(rare_dist(insanitylevel, rng) and bool(vomitlist)):
                     completeprompt += "-vomit-, "
-                if(rare_dist(insanitylevel) and bool(artmovementlist)):
+                if(rare_dist(insanitylevel, rng) and bool(artmovementlist)):
                     completeprompt += "-artmovement-, "
-                if(rare_dist(insanitylevel) and bool(lightinglist)):
+                if(rare_dist(insanitylevel, rng) and bool(lightinglist)):
                     completeprompt += "-lighting-, "
-                if(rare_dist(insanitylevel) and bool(minilocationadditionslist)):
+                if(rare_dist(insanitylevel, rng) and bool(minilocationadditionslist)):
                     completeprompt += "-minilocationaddition-, "
-                if(rare_dist(insanitylevel) and bool(materiallist)):
+                if(rare_dist(insanitylevel, rng) and bool(materiallist)):
                     completeprompt += "-material-, "
-                if(rare_dist(insanitylevel) and bool(conceptsuffixlist)):
+                if(rare_dist(insanitylevel, rng) and bool(conceptsuffixlist)):
                     completeprompt += "-conceptsuffix-, "
-                if(rare_dist(insanitylevel) and bool(qualitylist)):
+                if(rare_dist(insanitylevel, rng) and bool(qualitylist)):
                     completeprompt += "-quality-, "
-                if(rare_dist(insanitylevel) and bool(cameralist)):
+                if(rare_dist(insanitylevel, rng) and bool(cameralist)):
                     completeprompt += "-camera-, "
-                if(rare_dist(insanitylevel) and bool(lenslist)):
+                if(rare_dist(insanitylevel, rng) and bool(lenslist)):
                     completeprompt += "-lens-, "
-                if(rare_dist(insanitylevel) and bool(imagetypelist)):
+                if(rare_dist(insanitylevel, rng) and bool(imagetypelist)):
                     completeprompt += "-imagetype-, "
                 step = step + 1 
             
@@ -1785,15 +1904,13 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
 
         # start styles mode here
         if(stylesmode == True):
-            chosenstyle = random.choice(styleslist)
-            chosenstyleprefix = chosenstyle.split("-subject-")[0]
-            chosenstylesuffix = chosenstyle.split("-subject-")[1]
+            chosenstyleprefix, chosenstylesuffix = rng.choice(styleslist)
             completeprompt += chosenstyleprefix
 
         if(dynamictemplatesmode == True):
             if(artists == "none"):
                 dynamictemplatesprefixlist = [sentence for sentence in dynamictemplatesprefixlist if "-artist-" not in sentence.lower()]
-            chosenstyleprefix = random.choice(dynamictemplatesprefixlist)
+            chosenstyleprefix = rng.choice(dynamictemplatesprefixlist)
             completeprompt += chosenstyleprefix
             if(chosenstyleprefix[-1] == "."):
                 completeprompt += " OR(Capturing a; Describing a;Portraying a;Featuring a)"
@@ -1806,37 +1923,37 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
 
         artistsplacement = "front"
         # remove the artistsatbackchange to be depended on the insanitylevel, we would like this to be a set chance
-        if(random.randint(0, 2) == 0 and onlyartists == False):
+        if(rng.randint(0, 2) == 0 and onlyartists == False):
             artistlocations = ["back", "middle"]
-            artistsplacement = random.choice(artistlocations)
+            artistsplacement = rng.choice(artistlocations)
 
         if(artists != "none" and artistsplacement == "front" and generateartist == True):
             doartistnormal = True
             if(artists == "greg mode"):
                 artistbylist = ["art by", "designed by", "stylized by", "by"]
-                completeprompt += random.choice(artistbylist) + " -gregmode-, "
+                completeprompt += rng.choice(artistbylist) + " -gregmode-, "
                 doartistnormal = False
             # in case we have ALL, we can also do a specific artist mode per chosen subject. sometimes
-            elif(originalartistchoice == "all" and random.randint(0,3) == 0):
+            elif(originalartistchoice == "all" and rng.randint(0,3) == 0):
                 if(mainchooser in ["humanoid", "animal"]):
                     artistbylist = ["art by", "designed by", "stylized by", "by"]
-                    completeprompt += random.choice(artistbylist) + " OR(-portraitartist-;-characterartist-), OR(-portraitartist-;-characterartist-) OR(;and OR(-fantasyartist-;-scifiartist-;-photographyartist-;-digitalartist-;-graphicdesignartist-);uncommon), "
+                    completeprompt += rng.choice(artistbylist) + " OR(-portraitartist-;-characterartist-), OR(-portraitartist-;-characterartist-) OR(;and OR(-fantasyartist-;-scifiartist-;-photographyartist-;-digitalartist-;-graphicdesignartist-);uncommon), "
                     doartistnormal = False
 
                 elif(mainchooser in ["landscape"]):
                     artistbylist = ["art by", "designed by", "stylized by", "by"]
-                    completeprompt += random.choice(artistbylist) + " OR(-landscapeartist-;-digitalartist-), OR(-landscapeartist-;-graphicdesignartist-) OR(;and OR(-fantasyartist-;-scifiartist-;-photographyartist-;-digitalartist-;-graphicdesignartist-);uncommon), "
+                    completeprompt += rng.choice(artistbylist) + " OR(-landscapeartist-;-digitalartist-), OR(-landscapeartist-;-graphicdesignartist-) OR(;and OR(-fantasyartist-;-scifiartist-;-photographyartist-;-digitalartist-;-graphicdesignartist-);uncommon), "
                     doartistnormal = False
 
                 elif(subjectchooser in ["building"]):
                     artistbylist = ["art by", "designed by", "stylized by", "by"]
-                    completeprompt += random.choice(artistbylist) + " OR(-landscapeartist-;-architectartist-), OR(-landscapeartist-;-architectartist-) OR(;and OR(-fantasyartist-;-scifiartist-;-photographyartist-;-digitalartist-;-graphicdesignartist-);uncommon), "
+                    completeprompt += rng.choice(artistbylist) + " OR(-landscapeartist-;-architectartist-), OR(-landscapeartist-;-architectartist-) OR(;and OR(-fantasyartist-;-scifiartist-;-photographyartist-;-digitalartist-;-graphicdesignartist-);uncommon), "
                     doartistnormal = False
 
                 # else sometimes to something like this?
-                elif(random.randint(0,5) == 0):
+                elif(rng.randint(0,5) == 0):
                     artistbylist = ["art by", "designed by", "stylized by", "by"]
-                    completeprompt += random.choice(artistbylist) + " OR(-portraitartist-;-characterartist-;-fantasyartist-;-scifiartist-;-photographyartist-;-digitalartist-;-graphicdesignartist-), OR(-portraitartist-;-characterartist-;-fantasyartist-;-scifiartist-;-photographyartist-;-digitalartist-;-graphicdesignartist-) and OR(-portraitartist-;-characterartist-;-fantasyartist-;-scifiartist-;-photographyartist-;-digitalartist-;-graphicdesignartist-)"
+                    completeprompt += rng.choice(artistbylist) + " OR(-portraitartist-;-characterartist-;-fantasyartist-;-scifiartist-;-photographyartist-;-digitalartist-;-graphicdesignartist-), OR(-portraitartist-;-characterartist-;-fantasyartist-;-scifiartist-;-photographyartist-;-digitalartist-;-graphicdesignartist-) and OR(-portraitartist-;-characterartist-;-fantasyartist-;-scifiartist-;-photographyartist-;-digitalartist-;-graphicdesignartist-)"
                     doartistnormal = False
 
 
@@ -1844,9 +1961,9 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
             if(doartistnormal):
                     
                 # take 1-3 artists, weighted to 1-2
-                step = random.randint(0, 1)
+                step = rng.randint(0, 1)
                 minstep = step
-                end = random.randint(1, insanitylevel3)
+                end = rng.randint(1, insanitylevel3)
 
 
 
@@ -1862,7 +1979,7 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
 
 
 
-                modeselector = random.randint(0,10)
+                modeselector = rng.randint(0,10)
                 if modeselector < 5 and end - step >= 2:
                     artistmodeslist = ["hybrid", "stopping", "adding", "switching", "enhancing"]
                     artistmode = artistmodeslist[modeselector]
@@ -1883,7 +2000,7 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
                     completeprompt += " ["
                     
                 while step < end: 
-                    if(normal_dist(insanitylevel) and remove_weights == False):
+                    if(normal_dist(insanitylevel, rng) and remove_weights == False):
                         isweighted = 1
                     
                     if isweighted == 1:
@@ -1892,7 +2009,7 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
                     #completeprompt = add_from_csv(completeprompt, "artists", 0, "art by ","")
                     if(step == minstep):
                         # sometimes do this
-                        if(giventypeofimage=="" and imagetype == "all" and random.randint(0, 1) == 0):
+                        if(giventypeofimage=="" and imagetype == "all" and rng.randint(0, 1) == 0):
                             if(artiststyleselectormode == "normal"):
                                 completeprompt += artiststyleselector + " art "
                             else:
@@ -1900,10 +2017,10 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
                         artistbylist = ["art by", "designed by", "stylized by", "by"]
                     else:
                         artistbylist = [""]
-                    completeprompt += random.choice(artistbylist) + " -artist-"
+                    completeprompt += rng.choice(artistbylist) + " -artist-"
                     
                     if isweighted == 1:
-                        completeprompt += ":" + str(1 + (random.randint(-3,3)/10)) + ")"       
+                        completeprompt += ":" + str(1 + (rng.randint(-3,3)/10)) + ")"       
                     
                     if artistmode in ["hybrid"] and not end - step == 1:
                         completeprompt += "|"
@@ -1921,39 +2038,41 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
 
                 if artistmode in ["stopping"]:
                     completeprompt += "::"
-                    completeprompt += str(random.randint(1,19))
+                    completeprompt += str(rng.randint(1,19))
                 
                 if artistmode in ["switching","adding"]:
-                    completeprompt += ":" + str(random.randint(1,18))
+                    completeprompt += ":" + str(rng.randint(1,18))
                 if artistmode in ["hybrid", "stopping","adding", "switching"]:
                     completeprompt += "] "
 
 
             if(onlyartists == True):
                 #Parse or statements
-                completeprompt = parse_custom_functions(completeprompt, insanitylevel)
+                completeprompt = parse_custom_functions(completeprompt, insanitylevel, rng=rng)
 
                 # replace artist wildcards
-                completeprompt = replacewildcard(completeprompt, insanitylevel, "-artist-", artistlist, False, False)
-                completeprompt = replacewildcard(completeprompt, insanitylevel, "-gregmode-", gregmodelist, False, False)
-
-                completeprompt = replacewildcard(completeprompt, insanitylevel, "-fantasyartist-", fantasyartistlist, False, False)
-                completeprompt = replacewildcard(completeprompt, insanitylevel, "-popularartist-", popularartistlist, False, False)
-                completeprompt = replacewildcard(completeprompt, insanitylevel, "-romanticismartist-", romanticismartistlist, False, False)
-                completeprompt = replacewildcard(completeprompt, insanitylevel, "-photographyartist-", photographyartistlist, False, False)
-                completeprompt = replacewildcard(completeprompt, insanitylevel, "-portraitartist-", portraitartistlist, False, False)
-                completeprompt = replacewildcard(completeprompt, insanitylevel, "-characterartist-", characterartistlist, False, False)
-                completeprompt = replacewildcard(completeprompt, insanitylevel, "-landscapeartist-", landscapeartistlist, False, False)
-                completeprompt = replacewildcard(completeprompt, insanitylevel, "-scifiartist-", scifiartistlist, False, False)
-                completeprompt = replacewildcard(completeprompt, insanitylevel, "-graphicdesignartist-", graphicdesignartistlist, False, False)
-                completeprompt = replacewildcard(completeprompt, insanitylevel, "-digitalartist-", digitalartistlist, False, False)
-                completeprompt = replacewildcard(completeprompt, insanitylevel, "-architectartist-", architectartistlist, False, False)
-                completeprompt = replacewildcard(completeprompt, insanitylevel, "-cinemaartist-", cinemaartistlist, False, False)
+                completeprompt = replacewildcard(completeprompt, insanitylevel, "-artist-", artistlist, False, False, rng=rng)
+                completeprompt = replacewildcard(completeprompt, insanitylevel, "-gregmode-", gregmodelist, False, False, rng=rng)
+
+                completeprompt = replacewildcard(completeprompt, insanitylevel, "-fantasyartist-", fantasyartistlist, False, False, rng=rng)
+                completeprompt = replacewildcard(completeprompt, insanitylevel, "-popularartist-", popularartistlist, False, False, rng=rng)
+                completeprompt = replacewildcard(completeprompt, insanitylevel, "-romanticismartist-", romanticismartistlist, False, False, rng=rng)
+                completeprompt = replacewildcard(completeprompt, insanitylevel, "-photographyartist-", photographyartistlist, False, False, rng=rng)
+                completeprompt = replacewildcard(completeprompt, insanitylevel, "-portraitartist-", portraitartistlist, False, False, rng=rng)
+                completeprompt = replacewildcard(completeprompt, insanitylevel, "-characterartist-", characterartistlist, False, False, rng=rng)
+                completeprompt = replacewildcard(completeprompt, insanitylevel, "-landscapeartist-", landscapeartistlist, False, False, rng=rng)
+                completeprompt = replacewildcard(completeprompt, insanitylevel, "-scifiartist-", scifiartistlist, False, False, rng=rng)
+                completeprompt = replacewildcard(completeprompt, insanitylevel, "-graphicdesignartist-", graphicdesignartistlist, False, False, rng=rng)
+                completeprompt = replacewildcard(completeprompt, insanitylevel, "-digitalartist-", digitalartistlist, False, False, rng=rng)
+                completeprompt = replacewildcard(completeprompt, insanitylevel, "-architectartist-", architectartistlist, False, False, rng=rng)
+                completeprompt = replacewildcard(completeprompt, insanitylevel, "-cinemaartist-", cinemaartistlist, False, False, rng=rng)
                     
                 # clean it up
                 completeprompt = cleanup(completeprompt, advancedprompting, insanitylevel)
 
                 print("only generated these artists:" + completeprompt)
+                if(returndetails == True):
+                    return completeprompt, completeprompt, completeprompt, subjectchooser, seed
                 return completeprompt
 
 
@@ -1961,7 +2080,7 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
 
             
             # sometimes do this as well
-            if(giventypeofimage=="" and imagetype == "all" and random.randint(0, 2) == 0):
+            if(giventypeofimage=="" and imagetype == "all" and rng.randint(0, 2) == 0):
                 completeprompt += "-artiststyle- art, "
 
 
@@ -1976,13 +2095,13 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
                 tokinatorsubtype = ["(1boy, solo)"]
             if(anime_mode and gender == "female"):
                 tokinatorsubtype = ["(1girl, solo)"]
-            if(chance_roll(insanitylevel,"normal")):
-                if(chance_roll(insanitylevel,"normal") and remove_weights == False):
+            if(chance_roll(insanitylevel,"normal", rng)):
+                if(chance_roll(insanitylevel,"normal", rng) and remove_weights == False):
                     completeprompt += "(OR(;-imagetypequality-;uncommon) OR(-imagetype-;-othertype-;rare):1.3) "
                 else:
                     completeprompt += "OR(;-imagetypequality-;uncommon) OR(-imagetype-;-othertype-;rare) "
-            completeprompt += random.choice(tokinatorlist)
-            completeprompt = completeprompt.replace("-tokensubtype-", random.choice(tokinatorsubtype))
+            completeprompt += rng.choice(tokinatorlist)
+            completeprompt = completeprompt.replace("-tokensubtype-", rng.choice(tokinatorsubtype))
 
             if("subject" in givensubject and smartsubject):
                 givensubject = givensubject.replace("subject", "-token-")
@@ -2011,26 +2130,24 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
             if(imagetype != "all" and imagetype != "all - force multiple" and imagetype != "only other types" and imagetype != "all - anime"):
                  
                     completeprompt += " " + imagetype + ", "
-            elif(imagetype == "all - force multiple" or unique_dist(insanitylevel) and not anime_mode):
-                amountofimagetypes = random.randint(2,3)
+            elif(imagetype == "all - force multiple" or unique_dist(insanitylevel, rng) and not anime_mode):
+                amountofimagetypes = rng.randint(2,3)
             elif(imagetype == "only other types"):
-                if(amountofimagetypes < 2 and random.randint(0,2) == 0):
+                if(amountofimagetypes < 2 and rng.randint(0,2) == 0):
                         partlystylemode = True
                         print("Ohhh! Adding some secret sauce to this prompt")
-                        chosenstyle = random.choice(styleslist)
-                        chosenstyleprefix = chosenstyle.split("-subject-")[0]
-                        chosenstylesuffix = chosenstyle.split("-subject-")[1]
+                        chosenstyleprefix, chosenstylesuffix = rng.choice(styleslist)
 
                         completeprompt += " " + chosenstyleprefix + ", "
                 else:
                     othertype = 1
-                    completeprompt += random.choice(othertypelist)
+                    completeprompt += rng.choice(othertypelist)
             
-            if((imagetype == "all" or imagetype == "all - anime") and chance_roll(insanitylevel, imagetypechance) and amountofimagetypes <= 1):
+            if((imagetype == "all" or imagetype == "all - anime") and chance_roll(insanitylevel, imagetypechance, rng) and amountofimagetypes <= 1):
                 amountofimagetypes = 1
 
             # on lower insanity levels, almost force this
-            if((imagetype == "all" or imagetype == "all - anime") and insanitylevel <= 3 and amountofimagetypes <= 1 and random.randint(0,1)== 0):
+            if((imagetype == "all" or imagetype == "all - anime") and insanitylevel <= 3 and amountofimagetypes <= 1 and rng.randint(0,1)== 0):
                 amountofimagetypes = 1
 
             if((imagetype == "all" or imagetype == "all - anime") and insanitylevel <= 2 and amountofimagetypes <= 1):
@@ -2042,28 +2159,26 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
 
             for i in range(amountofimagetypes):
             # one in 6 images is a complex/other type
-                if((chance_roll(insanitylevel, imagetypequalitychance) or originalartistchoice == "greg mode") and generateimagetypequality):
+                if((chance_roll(insanitylevel, imagetypequalitychance, rng) or originalartistchoice == "greg mode") and generateimagetypequality):
                     completeprompt += "-imagetypequality- "
               
                 if(imagetype == "all - anime" and not anime_mode):
                     completeprompt += " anime"
-                if(random.randint(0,4) < 4 and insanitylevel > 3 ):
+                if(rng.randint(0,4) < 4 and insanitylevel > 3 ):
                     # woops, never to this as wildcards. We need to know as early as possible wether something is a photo. Lets put it back!
-                    completeprompt += " " + random.choice(imagetypelist) + ", "
-                elif(random.randint(0,1) == 0 and insanitylevel <= 3):
-                    completeprompt += " " + random.choice(imagetypelist) + ", "
+                    completeprompt += " " + rng.choice(imagetypelist) + ", "
+                elif(rng.randint(0,1) == 0 and insanitylevel <= 3):
+                    completeprompt += " " + rng.choice(imagetypelist) + ", "
                 elif(not anime_mode):
-                    if(amountofimagetypes < 2 and random.randint(0,1) == 0):
+                    if(amountofimagetypes < 2 and rng.randint(0,1) == 0):
                         partlystylemode = True
                         print("Ohhh! Adding some secret sauce to this prompt")
-                        chosenstyle = random.choice(styleslist)
-                        chosenstyleprefix = chosenstyle.split("-subject-")[0]
-                        chosenstylesuffix = chosenstyle.split("-subject-")[1]
+                        chosenstyleprefix, chosenstylesuffix = rng.choice(styleslist)
 
                         completeprompt += " " + chosenstyleprefix + ", "
                     else:
                         othertype = 1
-                        completeprompt += " " + random.choice(othertypelist) + ", "
+                        completeprompt += " " + rng.choice(othertypelist) + ", "
             
             if(othertype==1):
                 completeprompt += " of a "
@@ -2078,24 +2193,24 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
         if(superprompter == True):
             insanitylevel = max(1, insanitylevel-4)
         ### here we can do some other stuff to spice things up
-        if(chance_roll(insanitylevel, minilocationadditionchance) and generateminilocationaddition == True):
+        if(chance_roll(insanitylevel, minilocationadditionchance, rng) and generateminilocationaddition == True):
             completeprompt += " -minilocationaddition-, "
         
-        if(chance_roll(insanitylevel, artmovementprefixchance) and generateartmovement == True):
+        if(chance_roll(insanitylevel, artmovementprefixchance, rng) and generateartmovement == True):
             generateartmovement = False
             completeprompt += " -artmovement-, "
         
-        if(chance_roll(insanitylevel, minivomitprefix1chance) and generateminivomit == True):
+        if(chance_roll(insanitylevel, minivomitprefix1chance, rng) and generateminivomit == True):
             completeprompt += " -minivomit-, "
         
-        if(chance_roll(insanitylevel, minivomitprefix2chance) and generateminivomit == True):
+        if(chance_roll(insanitylevel, minivomitprefix2chance, rng) and generateminivomit == True):
             completeprompt += " -minivomit-, "
 
 
         
         # start shot size
 
-        if(mainchooser in ["object", "animal", "humanoid", "concept"] and othertype == 0 and "portrait" not in completeprompt and generateshot == True and chance_roll(insanitylevel,shotsizechance)):
+        if(mainchooser in ["object", "animal", "humanoid", "concept"] and othertype == 0 and "portrait" not in completeprompt and generateshot == True and chance_roll(insanitylevel,shotsizechance, rng)):
             completeprompt += "-shotsize- of a "
         elif("portrait" in completeprompt and generateshot == True and partlystylemode == False):
             completeprompt += " , close up of a "
@@ -2120,15 +2235,15 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
             # outfitmode = 2 IS NORMAL
             if(overrideoutfit!=""):
                 outfitmode = 2
-            if(animalashuman or subjectchooser in ["human","fictional", "non fictional", "humanoid", "manwomanrelation","manwomanmultiple", "firstname"]  and chance_roll(insanitylevel, outfitchance) and generateoutfit == True and humanspecial != 1):
-                if(random.randint(0,10)==0):
+            if(animalashuman or subjectchooser in ["human","fictional", "non fictional", "humanoid", "manwomanrelation","manwomanmultiple", "firstname"]  and chance_roll(insanitylevel, outfitchance, rng) and generateoutfit == True and humanspecial != 1):
+                if(rng.randint(0,10)==0):
                     outfitmode = 1
                 else:
                     outfitmode = 2
             
             if(outfitmode == 1):
                 completeprompt += "OR(wearing;dressed in;in;normal) OR(;OR(;a very;rare) -outfitdescriptor-;normal) OR(;-color-;uncommon) OR(;-culture-;uncommon) OR(;-material-;rare) -outfit-, "
-                if(extraordinary_dist(insanitylevel)):
+                if(extraordinary_dist(insanitylevel, rng)):
                     completeprompt += " -outfitvomit-, "
             
 
@@ -2137,7 +2252,7 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
                 completeprompt += " " + givensubjectpromptlist[0] + " "
 
             # Once in a very rare while, we get a ... full of ...s
-            if(novel_dist(insanitylevel) and (animalashuman or subjectchooser in ["human", "job", "fictional", "non fictional", "humanoid", "manwomanrelation","firstname"])):         
+            if(novel_dist(insanitylevel, rng) and (animalashuman or subjectchooser in ["human", "job", "fictional", "non fictional", "humanoid", "manwomanrelation","firstname"])):         
                 buildingfullmode = True
                 insideshot = 1
                 heshelist = ["they"]
@@ -2147,12 +2262,12 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
 
 
             # Sometimes the descriptors are at the back, in more natural language. Lets determine.
-            descriptorsintheback = random.randint(0,2)
+            descriptorsintheback = rng.randint(0,2)
             if(descriptorsintheback < 2):
                 # Common to have 1 description, uncommon to have 2
-                if(chance_roll(insanitylevel, subjectdescriptor1chance) and generatedescriptors == True):
+                if(chance_roll(insanitylevel, subjectdescriptor1chance, rng) and generatedescriptors == True):
                     if(animalashuman or subjectchooser in ["human", "job", "fictional", "non fictional", "humanoid", "manwomanrelation", "manwomanmultiple","firstname"]):
-                        if(anime_mode and random.randint(0,2)<2):
+                        if(anime_mode and rng.randint(0,2)<2):
                             completeprompt += "-basicbitchdescriptor- "
                         else:
                             completeprompt += "-humandescriptor- "
@@ -2163,9 +2278,9 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
                     else:
                         completeprompt += "-descriptor- "
 
-                if(chance_roll(insanitylevel, subjectdescriptor2chance) and generatedescriptors == True):
+                if(chance_roll(insanitylevel, subjectdescriptor2chance, rng) and generatedescriptors == True):
                     if(animalashuman or subjectchooser in ["human", "job", "fictional", "non fictional", "humanoid", "manwomanrelation", "manwomanmultiple","firstname"]):
-                        if(anime_mode and random.randint(0,2)<2):
+                        if(anime_mode and rng.randint(0,2)<2):
                             completeprompt += "-basicbitchdescriptor- "
                         else:
                             completeprompt += "-humandescriptor- "
@@ -2177,17 +2292,17 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
                         completeprompt += "-descriptor- "
             
             # color, for animals, landscape, objects and concepts
-            if(mainchooser in ["animal", "object", "landscape", "concept"] and unique_dist(insanitylevel)):
+            if(mainchooser in ["animal", "object", "landscape", "concept"] and unique_dist(insanitylevel, rng)):
                 completeprompt += " OR(-color-;-colorcombination-) "
             
             # age, very rare to add.
-            if(subjectchooser in ["human", "job", "fictional", "non fictional", "humanoid", "manwomanrelation", "manwomanmultiple","firstname"] and extraordinary_dist(insanitylevel)):
-                completeprompt += str(random.randint(20,99)) + " OR(y.o.;year old) "
+            if(subjectchooser in ["human", "job", "fictional", "non fictional", "humanoid", "manwomanrelation", "manwomanmultiple","firstname"] and extraordinary_dist(insanitylevel, rng)):
+                completeprompt += str(rng.randint(20,99)) + " OR(y.o.;year old) "
 
-            if((animalashuman or subjectchooser in ["human", "job", "fictional", "non fictional", "humanoid", "manwomanrelation", "manwomanmultiple","firstname"]) and chance_roll(insanitylevel, subjectbodytypechance) and generatebodytype == True):
+            if((animalashuman or subjectchooser in ["human", "job", "fictional", "non fictional", "humanoid", "manwomanrelation", "manwomanmultiple","firstname"]) and chance_roll(insanitylevel, subjectbodytypechance, rng) and generatebodytype == True):
                 completeprompt += "-bodytype- "
 
-            if((animalashuman or subjectchooser in ["object","human", "job", "fictional", "non fictional", "humanoid", "manwomanrelation", "manwomanmultiple","firstname"]) and chance_roll(insanitylevel, subjectculturechance) and generatedescriptors == True):
+            if((animalashuman or subjectchooser in ["object","human", "job", "fictional", "non fictional", "humanoid", "manwomanrelation", "manwomanmultiple","firstname"]) and chance_roll(insanitylevel, subjectculturechance, rng) and generatedescriptors == True):
                 completeprompt += "-culture- "
 
             if(mainchooser == "object"):
@@ -2219,29 +2334,29 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
 
                 if(givensubject == "" or (subjectingivensubject and givensubject != "")):
 
-                    if(rare_dist(insanitylevel) and advancedprompting == True):
+                    if(rare_dist(insanitylevel, rng) and advancedprompting == True):
                         hybridorswaplist = ["hybrid", "swap"]
-                        hybridorswap = random.choice(hybridorswaplist)
+                        hybridorswap = rng.choice(hybridorswaplist)
                         completeprompt += "["
 
-                    chosenobjectwildcard = random.choice(objectwildcardlist)
+                    chosenobjectwildcard = rng.choice(objectwildcardlist)
 
                     completeprompt += chosenobjectwildcard + " "
 
                     if(hybridorswap == "hybrid"):
-                        if(uncommon_dist(insanitylevel)):
-                            completeprompt += "|" + random.choice(objectwildcardlist) + "] "
+                        if(uncommon_dist(insanitylevel, rng)):
+                            completeprompt += "|" + rng.choice(objectwildcardlist) + "] "
                         else:
                             completeprompt += "|" 
                             completeprompt += chosenobjectwildcard + " "
                             completeprompt += "] "
                     if(hybridorswap == "swap"):
-                        if(uncommon_dist(insanitylevel)):
-                            completeprompt += ":" + random.choice(objectwildcardlist) + ":" + str(random.randint(1,5)) +  "] "
+                        if(uncommon_dist(insanitylevel, rng)):
+                            completeprompt += ":" + rng.choice(objectwildcardlist) + ":" + str(rng.randint(1,5)) +  "] "
                         else:
                             completeprompt += ":"
                             completeprompt += chosenobjectwildcard + " "
-                            completeprompt += ":" + str(random.randint(1,5)) +  "] "
+                            completeprompt += ":" + str(rng.randint(1,5)) +  "] "
                 else:
                     completeprompt += " " + givensubject + " "
                 
@@ -2257,9 +2372,9 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
                 
                         
                     if(gender=="male"):
-                        completeprompt += random.choice(anthrolist) + ", 1boy, solo, "
+                        completeprompt += rng.choice(anthrolist) + ", 1boy, solo, "
                     else:
-                        completeprompt += random.choice(anthrolist) + ", 1girl, solo, "
+                        completeprompt += rng.choice(anthrolist) + ", 1girl, solo, "
                 
                 # if we have a given subject, we should skip making an actual subject
                 if(givensubject == "" or (subjectingivensubject and givensubject != "")):
@@ -2281,14 +2396,14 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
                             animalwildcardlist = ["-marinelife-"]
 
                     
-                    chosenanimalwildcard = random.choice(animalwildcardlist)
+                    chosenanimalwildcard = rng.choice(animalwildcardlist)
 
-                    if(rare_dist(insanitylevel) and advancedprompting == True):
+                    if(rare_dist(insanitylevel, rng) and advancedprompting == True):
                         hybridorswaplist = ["hybrid", "swap"]
-                        hybridorswap = random.choice(hybridorswaplist)
+                        hybridorswap = rng.choice(hybridorswaplist)
                         completeprompt += "["
                         
-                    if(unique_dist(insanitylevel) and generateanimaladdition == True):
+                    if(unique_dist(insanitylevel, rng) and generateanimaladdition == True):
                         animaladdedsomething = 1
                         completeprompt += "-animaladdition- " + chosenanimalwildcard + " "
                     if(animaladdedsomething != 1):
@@ -2297,15 +2412,15 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
                    
 
                     if(hybridorswap == "hybrid"):
-                        if(uncommon_dist(insanitylevel)):
-                            completeprompt += "|" + random.choice(hybridlist) + "] "
+                        if(uncommon_dist(insanitylevel, rng)):
+                            completeprompt += "|" + rng.choice(hybridlist) + "] "
                         else:
                             completeprompt += "| " + chosenanimalwildcard +  " ] "
                     if(hybridorswap == "swap"):
-                        if(uncommon_dist(insanitylevel)):
-                            completeprompt += ":" + random.choice(hybridlist) + ":" + str(random.randint(1,5)) +  "] "
+                        if(uncommon_dist(insanitylevel, rng)):
+                            completeprompt += ":" + rng.choice(hybridlist) + ":" + str(rng.randint(1,5)) +  "] "
                         else:
-                            completeprompt += ":" + chosenanimalwildcard +  ":" + str(random.randint(1,5)) +  "] "
+                            completeprompt += ":" + chosenanimalwildcard +  ":" + str(rng.randint(1,5)) +  "] "
                 else:
                     completeprompt += " " + givensubject + " "
                 
@@ -2313,10 +2428,10 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
 
              # move job or activity logic here. We want to place it at 2 different places maybe
             
-            if((animalashuman or subjectchooser in ["human","fictional", "non fictional", "humanoid", "manwomanrelation", "manwomanmultiple","firstname"])  and chance_roll(insanitylevel, joboractivitychance) and humanspecial != 1 and generatesubject == True):
+            if((animalashuman or subjectchooser in ["human","fictional", "non fictional", "humanoid", "manwomanrelation", "manwomanmultiple","firstname"])  and chance_roll(insanitylevel, joboractivitychance, rng) and humanspecial != 1 and generatesubject == True):
                 genjoboractivity = True
                 genjoboractivitylocationslist = ["front","middle", "middle","back","back", "back"]
-                genjoboractivitylocation = random.choice(genjoboractivitylocationslist)
+                genjoboractivitylocation = rng.choice(genjoboractivitylocationslist)
     
 
             if(genjoboractivity and genjoboractivitylocation=="front"):
@@ -2359,60 +2474,60 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
                         completeprompt += "-job-"
 
                     if(subjectchooser == "fictional"):
-                        if(rare_dist(insanitylevel) and advancedprompting == True and buildingfullmode == False):
+                        if(rare_dist(insanitylevel, rng) and advancedprompting == True and buildingfullmode == False):
                             hybridorswaplist = ["hybrid", "swap"]
-                            hybridorswap = random.choice(hybridorswaplist)
+                            hybridorswap = rng.choice(hybridorswaplist)
                             completeprompt += "["
                         
                         # Sometimes, we do a gender swap. Much fun!
-                        if(novel_dist(insanitylevel)):
+                        if(novel_dist(insanitylevel, rng)):
                             completeprompt += gender + " version of -oppositefictional-"
                         else:
                             completeprompt += "-fictional-"
 
                         if(hybridorswap == "hybrid"):
-                            completeprompt += "|" + random.choice(hybridhumanlist) + " ] "
+                            completeprompt += "|" + rng.choice(hybridhumanlist) + " ] "
                         if(hybridorswap == "swap"):
-                            completeprompt += ":" + random.choice(hybridhumanlist) + ":" + str(random.randint(1,5)) +  "] "
+                            completeprompt += ":" + rng.choice(hybridhumanlist) + ":" + str(rng.randint(1,5)) +  "] "
                         hybridorswap = ""
 
                     if(subjectchooser == "non fictional"):
-                        if(rare_dist(insanitylevel)  and advancedprompting == True and buildingfullmode == False):
+                        if(rare_dist(insanitylevel, rng)  and advancedprompting == True and buildingfullmode == False):
                             hybridorswaplist = ["hybrid", "swap"]
-                            hybridorswap = random.choice(hybridorswaplist)
+                            hybridorswap = rng.choice(hybridorswaplist)
                             completeprompt += "["
                         # Sometimes, we do a gender swap. Much fun!
-                        if(novel_dist(insanitylevel)):
+                        if(novel_dist(insanitylevel, rng)):
                             completeprompt += gender + " version of -oppositenonfictional-"
                         else:
                             completeprompt += "-nonfictional-"
 
                         if(hybridorswap == "hybrid"):
-                            completeprompt += "|" + random.choice(hybridhumanlist) + "] "
+                            completeprompt += "|" + rng.choice(hybridhumanlist) + "] "
                         if(hybridorswap == "swap"):
-                            completeprompt += ":" + random.choice(hybridhumanlist) + ":" + str(random.randint(1,5)) +  "] "
+                            completeprompt += ":" + rng.choice(hybridhumanlist) + ":" + str(rng.randint(1,5)) +  "] "
                         hybridorswap = ""
 
                     if(subjectchooser == "humanoid"):
                         if(gender != "all"):
                             completeprompt += "-malefemale- "
-                        if(rare_dist(insanitylevel)  and advancedprompting == True and buildingfullmode == False):
+                        if(rare_dist(insanitylevel, rng)  and advancedprompting == True and buildingfullmode == False):
                             hybridorswaplist = ["hybrid", "swap"]
-                            hybridorswap = random.choice(hybridorswaplist)
+                            hybridorswap = rng.choice(hybridorswaplist)
                             completeprompt += "["
                         
                         completeprompt += "-humanoid-"
 
                         if(hybridorswap == "hybrid"):
-                            completeprompt += "|" + random.choice(hybridhumanlist) + "] "
+                            completeprompt += "|" + rng.choice(hybridhumanlist) + "] "
                         if(hybridorswap == "swap"):
-                            completeprompt += ":" + random.choice(hybridhumanlist) + ":" + str(random.randint(1,5)) +  "] "
+                            completeprompt += ":" + rng.choice(hybridhumanlist) + ":" + str(rng.randint(1,5)) +  "] "
                         hybridorswap = ""
 
                     if(subjectchooser == "firstname"):
-                        if(rare_dist(insanitylevel)  and advancedprompting == True and buildingfullmode == False):
+                        if(rare_dist(insanitylevel, rng)  and advancedprompting == True and buildingfullmode == False):
                             hybridorswaplist = ["hybrid", "swap"]
-                            hybridorswap = random.choice(hybridorswaplist)
+                            hybridorswap = rng.choice(hybridorswaplist)
                             completeprompt += "["
                         
                         completeprompt += "-firstname-"
@@ -2420,7 +2535,7 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
                         if(hybridorswap == "hybrid"):
                             completeprompt += "|" + "-firstname-" + "] "
                         if(hybridorswap == "swap"):
-                            completeprompt += ":" + "-firstname-" + ":" + str(random.randint(1,5)) +  "] "
+                            completeprompt += ":" + "-firstname-" + ":" + str(rng.randint(1,5)) +  "] "
                         hybridorswap = ""
                     if(buildingfullmode == True):
                         completeprompt += "s"
@@ -2428,7 +2543,7 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
 
                 else:
                     if(subjectchooser == "manwomanmultiple" and subtypehumanoid != "multiple humans" and givensubject not in ["1girl", "1boy", "solo"]):
-                        if(random.randint(0,1) == 1):
+                        if(rng.randint(0,1) == 1):
                             completeprompt +=  " " + givensubject + " and a -manwomanmultiple- "
                         else:
                             completeprompt +=  " a OR(group;couple;crowd;bunch) of " + givensubject + " "
@@ -2437,14 +2552,14 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
  
             
              # sometimes add a suffix for more fun!
-            if( (mainchooser == "humanoid" or mainchooser == "animal" or mainchooser == "object") and  chance_roll(insanitylevel, subjectconceptsuffixchance)):
+            if( (mainchooser == "humanoid" or mainchooser == "animal" or mainchooser == "object") and  chance_roll(insanitylevel, subjectconceptsuffixchance, rng)):
                 completeprompt += " of -conceptsuffix- "
 
             if(mainchooser == "humanoid" or mainchooser == "animal" or mainchooser == "object"):
             # completion of strenght end
                 completeprompt += "-objectstrengthend-"  
             
-            if(mainchooser == 'animal' and legendary_dist(insanitylevel)):
+            if(mainchooser == 'animal' and legendary_dist(insanitylevel, rng)):
                 animaladdedsomething = 1
                 completeprompt += " -animalsuffixaddition- "
             
@@ -2455,9 +2570,9 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
                 
                 # if we have a given subject, we should skip making an actual subject
                 if(givensubject == "" or (subjectingivensubject and givensubject != "")):
-                    if(rare_dist(insanitylevel) and advancedprompting == True):
+                    if(rare_dist(insanitylevel, rng) and advancedprompting == True):
                         hybridorswaplist = ["hybrid", "swap"]
-                        hybridorswap = random.choice(hybridorswaplist)
+                        hybridorswap = rng.choice(hybridorswaplist)
                         completeprompt += "["
                     
                     if(subtypelocation != "all"):
@@ -2475,13 +2590,13 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
                             locationwildcardlist = ["-locationcity-"]
 
                     
-                    chosenlocationwildcard = random.choice(locationwildcardlist)
+                    chosenlocationwildcard = rng.choice(locationwildcardlist)
                     completeprompt += chosenlocationwildcard + " "
 
                     if(hybridorswap == "hybrid"):
                         completeprompt += "|" + chosenlocationwildcard  + "] "
                     if(hybridorswap == "swap"):
-                        completeprompt += ":" + chosenlocationwildcard + ":" + str(random.randint(1,5)) +  "] "        
+                        completeprompt += ":" + chosenlocationwildcard + ":" + str(rng.randint(1,5)) +  "] "        
                 else:
                     completeprompt += " " + givensubject + " " 
                 
@@ -2491,27 +2606,27 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
                 completeprompt += "-objectstrengthend-"
 
                 # shots from inside can create cool effects in landscapes
-                if(chance_roll(max(1,insanitylevel-2), subjectlandscapeaddonlocationchance) and insideshot == 0):
+                if(chance_roll(max(1,insanitylevel-2), subjectlandscapeaddonlocationchance, rng) and insideshot == 0):
                     insideshot = 1
                     # lets cheat a bit here, we can do something cool I saw on reddit
-                    if(mainchooser=="humanoid" and legendary_dist(insanitylevel)):
+                    if(mainchooser=="humanoid" and legendary_dist(insanitylevel, rng)):
                         completeprompt += " looking at a -addontolocationinside- "
-                    elif(mainchooser=="humanoid" and legendary_dist(insanitylevel)):
+                    elif(mainchooser=="humanoid" and legendary_dist(insanitylevel, rng)):
                         completeprompt += " facing a -addontolocationinside- "
-                    elif(legendary_dist(insanitylevel)):
+                    elif(legendary_dist(insanitylevel, rng)):
                         completeprompt += " in the distance there is a -addontolocationinside- "
                     else:
                         completeprompt += " from inside of a -addontolocationinside- "
 
-                if(chance_roll(insanitylevel, subjectlandscapeaddonlocationchance) and insideshot == 0):
+                if(chance_roll(insanitylevel, subjectlandscapeaddonlocationchance, rng) and insideshot == 0):
                     completeprompt += " and "
-                    if(chance_roll(insanitylevel, subjectlandscapeaddonlocationdescriptorchance)):
+                    if(chance_roll(insanitylevel, subjectlandscapeaddonlocationdescriptorchance, rng)):
                         completeprompt += "-locationdescriptor- " 
-                    if(chance_roll(insanitylevel, subjectlandscapeaddonlocationculturechance)):
+                    if(chance_roll(insanitylevel, subjectlandscapeaddonlocationculturechance, rng)):
                         completeprompt += "-culture- "
 
                     #addontolocation = [locationlist,buildinglist, vehiclelist]
-                    if(random.randint(0,1) == 1):
+                    if(rng.randint(0,1) == 1):
                         completeprompt += "-addontolocation- "
                     else:
                         completeprompt += "-background- "
@@ -2522,7 +2637,7 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
                 completeprompt += " -objectstrengthstart- "
                 if(subjectchooser == "conceptmixer"):
                         
-                        chosenconceptmixerprelist = random.choice(conceptmixerlist)
+                        chosenconceptmixerprelist = rng.choice(conceptmixerlist)
                         chosenconceptmixerlist = chosenconceptmixerprelist.split("@")
                         chosenconceptmixer = ''.join([chosenconceptmixerlist[0]])
                         chosenconceptmixersubject = ''.join([chosenconceptmixerlist[1]])
@@ -2562,7 +2677,7 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
                     
                 # making subject override work with X and Y concepts, much fun!
                 elif(givensubject != "" and subjectchooser == "concept" and subjectingivensubject == False):
-                        if(random.randint(0,3) == 0):
+                        if(rng.randint(0,3) == 0):
                             completeprompt += " \"The -conceptprefix- of " + givensubject + "\" "
                         else:
                             completeprompt += " \"The " + givensubject + " of -conceptsuffix-\" "
@@ -2577,18 +2692,18 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
             
             if(genjoboractivity and genjoboractivitylocation=="middle"):
                 joboractivitylist = [joblist,humanactivitylist]
-                completeprompt += random.choice(random.choice(joboractivitylist)) + ", "
+                completeprompt += rng.choice(rng.choice(joboractivitylist)) + ", "
             
             if(descriptorsintheback == 2):
                 # Common to have 1 description, uncommon to have 2
-                if(chance_roll(insanitylevel, subjectdescriptor1chance) and generatedescriptors == True):
+                if(chance_roll(insanitylevel, subjectdescriptor1chance, rng) and generatedescriptors == True):
                     if(animalashuman or subjectchooser in ["human", "job", "fictional", "non fictional", "humanoid", "manwomanrelation","manwomanmultiple", "firstname"]):
                         if(less_verbose):
-                            if(anime_mode and random.randint(0,2)<2):
+                            if(anime_mode and rng.randint(0,2)<2):
                                 completeprompt += ", -basicbitchdescriptor- "
                             else:
                                 completeprompt += ", -humandescriptor- "
-                        elif(random.randint(0,3) > 0):
+                        elif(rng.randint(0,3) > 0):
                             completeprompt += ", OR(;-heshe- is;normal) OR(;very;rare) -humandescriptor- "
                         elif(subjectchooser == "manwomanmultiple"):
                             completeprompt += ", the -samehumansubject- are OR(;very;rare) -humandescriptor-"
@@ -2610,7 +2725,7 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
                         else:
                             completeprompt += ", OR(;-heshe- is;normal) OR(;very;rare) -descriptor- "
 
-                    if(chance_roll(insanitylevel, subjectdescriptor2chance) and generatedescriptors == True):
+                    if(chance_roll(insanitylevel, subjectdescriptor2chance, rng) and generatedescriptors == True):
                         if(animalashuman or subjectchooser in ["human", "job", "fictional", "non fictional", "humanoid", "manwomanrelation","manwomanmultiple","firstname"]):
                             if(less_verbose):
                                 completeprompt += ", -humandescriptor- "
@@ -2639,19 +2754,19 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
         if(thetokinatormode == False):
             # object additions
             for i in range(objectadditionsrepeats):
-                if(mainchooser == "object" and chance_roll(insanitylevel, objectadditionschance) and generateobjectaddition == True):
+                if(mainchooser == "object" and chance_roll(insanitylevel, objectadditionschance, rng) and generateobjectaddition == True):
                     completeprompt += ", -objectaddition- , "
             
             
             # riding an animal, holding an object or driving a vehicle, rare
-            if((animalashuman or subjectchooser in ["human","fictional", "non fictional", "humanoid", "manwomanrelation","manwomanmultiple","firstname"]) and chance_roll(insanitylevel, humanadditionchance) and generatehumanaddition == True):
+            if((animalashuman or subjectchooser in ["human","fictional", "non fictional", "humanoid", "manwomanrelation","manwomanmultiple","firstname"]) and chance_roll(insanitylevel, humanadditionchance, rng) and generatehumanaddition == True):
                 humanspecial = 1
                 completeprompt += "-humanaddition- "
                 
             completeprompt += ", "
 
             # unique additions for all types:
-            if(chance_roll(insanitylevel, overalladditionchance) and generateoveralladdition == True):
+            if(chance_roll(insanitylevel, overalladditionchance, rng) and generateoveralladdition == True):
                 completeprompt += "-overalladdition- "
 
 
@@ -2660,24 +2775,24 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
 
             # SD understands emoji's. Can be used to manipulate facial expressions.
             # emoji, legendary
-            if((animalashuman or subjectchooser in ["human","fictional", "non fictional", "humanoid", "manwomanrelation","manwomanmultiple","firstname"]) and chance_roll(insanitylevel, emojichance) and generateemoji== True):
+            if((animalashuman or subjectchooser in ["human","fictional", "non fictional", "humanoid", "manwomanrelation","manwomanmultiple","firstname"]) and chance_roll(insanitylevel, emojichance, rng) and generateemoji== True):
                 completeprompt += "-emoji-, "
 
             # human expressions
-            if((animalashuman or subjectchooser in ["animal as human,","human","fictional", "non fictional", "humanoid", "manwomanrelation","manwomanmultiple","firstname"]) and chance_roll(insanitylevel, humanexpressionchance) and generatehumanexpression== True):
+            if((animalashuman or subjectchooser in ["animal as human,","human","fictional", "non fictional", "humanoid", "manwomanrelation","manwomanmultiple","firstname"]) and chance_roll(insanitylevel, humanexpressionchance, rng) and generatehumanexpression== True):
                 completeprompt += "-humanexpression-, "
                 
 
             # cosplaying
             #if(subjectchooser in ["animal as human", "non fictional", "humanoid"] and rare_dist(insanitylevel) and humanspecial != 1):
-            #    completeprompt += "cosplaying as " + random.choice(fictionallist) + ", "
+            #    completeprompt += "cosplaying as " + rng.choice(fictionallist) + ", "
 
             # Job 
             # either go job or activity, not both
 
             if(genjoboractivity and genjoboractivitylocation=="back"):
-                if(random.randint(0,1)==0):
-                    completeprompt +=  ", " + random.choice(humanactivitylist)+ ", "
+                if(rng.randint(0,1)==0):
+                    completeprompt +=  ", " + rng.choice(humanactivitylist)+ ", "
                 else:
                     completeprompt +=  ", OR(,; as a;rare) -job-, "
 
@@ -2685,57 +2800,57 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
         
 
             # add face builder sometimes on generic humans
-            if(subjectchooser in ["human", "humanoid", "manwomanrelation","firstname"] and chance_roll(insanitylevel, buildfacechance) and generateface== True):
-                completeprompt += random.choice(buildfacelist) + ", "
+            if(subjectchooser in ["human", "humanoid", "manwomanrelation","firstname"] and chance_roll(insanitylevel, buildfacechance, rng) and generateface== True):
+                completeprompt += rng.choice(buildfacelist) + ", "
 
 
 
 
             # custom mid list
             for i in range(custominputmidrepeats):
-                if(chance_roll(insanitylevel, custominputmidchance) and generatecustominputmid == True):
-                    completeprompt += random.choice(custominputmidlist) + ", "
+                if(chance_roll(insanitylevel, custominputmidchance, rng) and generatecustominputmid == True):
+                    completeprompt += rng.choice(custominputmidlist) + ", "
             
             # add in some more mini vomits
-            if(chance_roll(insanitylevel, minivomitmidchance) and generateminivomit == True):
+            if(chance_roll(insanitylevel, minivomitmidchance, rng) and generateminivomit == True):
                 completeprompt += " -minivomit-, "
             
             # outfit builder
            
             if(outfitmode == 2):
-                completeprompt += " " + random.choice(buildoutfitlist) + ", "
-                if(extraordinary_dist(insanitylevel)):
+                completeprompt += " " + rng.choice(buildoutfitlist) + ", "
+                if(extraordinary_dist(insanitylevel, rng)):
                     completeprompt += " -outfitvomit-, "
             elif(outfitmode == 2 and overrideoutfit != "" and imagetype != "only templates mode"):
-                completeprompt += " " + random.choice(buildoutfitlist) + ", "
-                if(extraordinary_dist(insanitylevel)):
+                completeprompt += " " + rng.choice(buildoutfitlist) + ", "
+                if(extraordinary_dist(insanitylevel, rng)):
                     completeprompt += " -outfitvomit-, "
             
 
             
-            if((animalashuman or subjectchooser in ["human","fictional", "non fictional", "humanoid", "manwomanrelation","manwomanmultiple", "firstname"])  and chance_roll(insanitylevel, posechance) and humanspecial != 1 and generatepose == True):
-                completeprompt += random.choice(poselist) + ", "
+            if((animalashuman or subjectchooser in ["human","fictional", "non fictional", "humanoid", "manwomanrelation","manwomanmultiple", "firstname"])  and chance_roll(insanitylevel, posechance, rng) and humanspecial != 1 and generatepose == True):
+                completeprompt += rng.choice(poselist) + ", "
             
-            if(subjectchooser in ["human","job","fictional", "non fictional", "humanoid", "manwomanrelation","manwomanmultiple", "firstname"]  and chance_roll(insanitylevel, hairchance) and generatehairstyle == True):
-                completeprompt += random.choice(buildhairlist) + ", "
-                if(unique_dist(insanitylevel)):
+            if(subjectchooser in ["human","job","fictional", "non fictional", "humanoid", "manwomanrelation","manwomanmultiple", "firstname"]  and chance_roll(insanitylevel, hairchance, rng) and generatehairstyle == True):
+                completeprompt += rng.choice(buildhairlist) + ", "
+                if(unique_dist(insanitylevel, rng)):
                     completeprompt += " -hairvomit-, "
 
-            if((animalashuman or subjectchooser in ["human","fictional", "non fictional", "humanoid", "manwomanrelation","manwomanmultiple", "firstname"])  and chance_roll(insanitylevel, accessorychance) and generateaccessorie == True and generateaccessories == True):
-                completeprompt += random.choice(buildaccessorielist) + ", "
+            if((animalashuman or subjectchooser in ["human","fictional", "non fictional", "humanoid", "manwomanrelation","manwomanmultiple", "firstname"])  and chance_roll(insanitylevel, accessorychance, rng) and generateaccessorie == True and generateaccessories == True):
+                completeprompt += rng.choice(buildaccessorielist) + ", "
 
-            if(chance_roll(insanitylevel, humanoidinsideshotchance) and subjectchooser not in ["landscape", "concept"] and generateinsideshot == True):
+            if(chance_roll(insanitylevel, humanoidinsideshotchance, rng) and subjectchooser not in ["landscape", "concept"] and generateinsideshot == True):
                 insideshot = 1
-                completeprompt += random.choice(insideshotlist) + ", "
+                completeprompt += rng.choice(insideshotlist) + ", "
             
-            if(subjectchooser not in ["landscape", "concept"] and humanspecial != 1 and insideshot == 0 and chance_roll(insanitylevel, humanoidbackgroundchance) and generatebackground == True):
-                completeprompt += random.choice(backgroundtypelist) + ", "
+            if(subjectchooser not in ["landscape", "concept"] and humanspecial != 1 and insideshot == 0 and chance_roll(insanitylevel, humanoidbackgroundchance, rng) and generatebackground == True):
+                completeprompt += rng.choice(backgroundtypelist) + ", "
 
             # minilocation bit
-            if(subjectchooser in ["landscape"] and chance_roll(insanitylevel, landscapeminilocationchance) and generateminilocationaddition == True):
+            if(subjectchooser in ["landscape"] and chance_roll(insanitylevel, landscapeminilocationchance, rng) and generateminilocationaddition == True):
                 completeprompt += " -minilocationaddition-, "
                 
-            if(chance_roll(insanitylevel, generalminilocationchance) and generateminilocationaddition == True):
+            if(chance_roll(insanitylevel, generalminilocationchance, rng) and generateminilocationaddition == True):
                 completeprompt += " -minilocationaddition-, "
 
 
@@ -2748,11 +2863,11 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
                 completeprompt += "-quality-, "
 
             # landscapes it is nice to always have a time period
-            if(chance_roll(insanitylevel, timperiodchance) or subjectchooser=="landscape"):
+            if(chance_roll(insanitylevel, timperiodchance, rng) or subjectchooser=="landscape"):
                 if(generatetimeperiod == True):
                     completeprompt += "-timeperiod-, "
 
-            if(mainchooser not in ["landscape"]  and chance_roll(insanitylevel, focuschance) and generatefocus == True):
+            if(mainchooser not in ["landscape"]  and chance_roll(insanitylevel, focuschance, rng) and generatefocus == True):
                 completeprompt += "-focus-, "
                 
 
@@ -2763,36 +2878,36 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
             doartistnormal = True
             if(artists == "greg mode"):
                 artistbylist = ["art by", "designed by", "stylized by", "by"]
-                completeprompt += random.choice(artistbylist) + " -gregmode-, "
+                completeprompt += rng.choice(artistbylist) + " -gregmode-, "
                 doartistnormal = False
 
                 # in case we have ALL, we can also do a specific artist mode per chosen subject. sometimes
-            elif(originalartistchoice == "all" and random.randint(0,3) == 0):
+            elif(originalartistchoice == "all" and rng.randint(0,3) == 0):
                 if(mainchooser in ["humanoid", "animal"]):
                     artistbylist = ["art by", "designed by", "stylized by", "by"]
-                    completeprompt += random.choice(artistbylist) + " OR(-portraitartist-;-characterartist-), OR(-portraitartist-;-characterartist-) OR(;and OR(-fantasyartist-;-scifiartist-;-photographyartist-;-digitalartist-;-graphicdesignartist-);uncommon), "
+                    completeprompt += rng.choice(artistbylist) + " OR(-portraitartist-;-characterartist-), OR(-portraitartist-;-characterartist-) OR(;and OR(-fantasyartist-;-scifiartist-;-photographyartist-;-digitalartist-;-graphicdesignartist-);uncommon), "
                     doartistnormal = False
 
                 elif(mainchooser in ["landscape"]):
                     artistbylist = ["art by", "designed by", "stylized by", "by"]
-                    completeprompt += random.choice(artistbylist) + " OR(-landscapeartist-;-digitalartist-), OR(-landscapeartist-;-graphicdesignartist-) OR(;and OR(-fantasyartist-;-scifiartist-;-photographyartist-;-digitalartist-;-graphicdesignartist-);uncommon), "
+                    completeprompt += rng.choice(artistbylist) + " OR(-landscapeartist-;-digitalartist-), OR(-landscapeartist-;-graphicdesignartist-) OR(;and OR(-fantasyartist-;-scifiartist-;-photographyartist-;-digitalartist-;-graphicdesignartist-);uncommon), "
                     doartistnormal = False
 
                 elif(subjectchooser in ["building"]):
                     artistbylist = ["art by", "designed by", "stylized by", "by"]
-                    completeprompt += random.choice(artistbylist) + " OR(-landscapeartist-;-architectartist-), OR(-landscapeartist-;-architectartist-) OR(;and OR(-fantasyartist-;-scifiartist-;-photographyartist-;-digitalartist-;-graphicdesignartist-);uncommon), "
+                    completeprompt += rng.choice(artistbylist) + " OR(-landscapeartist-;-architectartist-), OR(-landscapeartist-;-architectartist-) OR(;and OR(-fantasyartist-;-scifiartist-;-photographyartist-;-digitalartist-;-graphicdesignartist-);uncommon), "
                     doartistnormal = False
             
             if(doartistnormal):
                 
                 # sometimes do this as well, but now in the front of the artists
-                if(giventypeofimage=="" and imagetype == "all" and random.randint(0, 2) == 0):
+                if(giventypeofimage=="" and imagetype == "all" and rng.randint(0, 2) == 0):
                     completeprompt += "-artiststyle- art, "
 
                 # take 1-3 artists, weighted to 1-2
-                step = random.randint(0, 1)
+                step = rng.randint(0, 1)
                 minstep = step
-                end = random.randint(1, insanitylevel3)
+                end = rng.randint(1, insanitylevel3)
 
 
 
@@ -2805,7 +2920,7 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
                 # stopping at step x ::X
 
                 
-                modeselector = random.randint(0,10)
+                modeselector = rng.randint(0,10)
                 if modeselector < 4 and end - step >= 2:
                     artistmodeslist = ["hybrid", "stopping", "adding", "switching"]
                     artistmode = artistmodeslist[modeselector]
@@ -2821,7 +2936,7 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
                     completeprompt += " ["
                     
                 while step < end: 
-                    if(normal_dist(insanitylevel) and remove_weights == False):
+                    if(normal_dist(insanitylevel, rng) and remove_weights == False):
                         isweighted = 1
                     
                     if isweighted == 1:
@@ -2830,7 +2945,7 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
                     #completeprompt = add_from_csv(completeprompt, "artists", 0, "art by ","")
                     if(step == minstep):
                         # sometimes do this
-                        if(giventypeofimage=="" and imagetype == "all" and random.randint(0, 1) == 0):
+                        if(giventypeofimage=="" and imagetype == "all" and rng.randint(0, 1) == 0):
                             if(artiststyleselectormode == "normal"):
                                 completeprompt += artiststyleselector + " art "
                             else:
@@ -2838,10 +2953,10 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
                         artistbylist = ["art by", "designed by", "stylized by", "by"]
                     else:
                         artistbylist = [""]
-                    completeprompt += random.choice(artistbylist) + " -artist-"
+                    completeprompt += rng.choice(artistbylist) + " -artist-"
                     
                     if isweighted == 1:
-                        completeprompt += ":" + str(1 + (random.randint(-3,3)/10)) + ")"       
+                        completeprompt += ":" + str(1 + (rng.randint(-3,3)/10)) + ")"       
                     
                     if artistmode in ["hybrid"] and not end - step == 1:
                         completeprompt += "|"
@@ -2857,10 +2972,10 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
 
                 if artistmode in ["stopping"]:
                     completeprompt += "::"
-                    completeprompt += str(random.randint(1,19))
+                    completeprompt += str(rng.randint(1,19))
                 
                 if artistmode in ["switching","adding"]:
-                    completeprompt += ":" + str(random.randint(1,18))
+                    completeprompt += ":" + str(rng.randint(1,18))
                 if artistmode in ["hybrid", "stopping","adding", "switching"]:
                     completeprompt += "] "
                 
@@ -2871,8 +2986,8 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
                 # todo
                 descriptivemode = False
                 # if we have artists, maybe go in artists descriptor mode
-                if(not anime_mode and not less_verbose and templatemode == False and specialmode == False and "-artist-" in completeprompt and uncommon_dist(max(8 - insanitylevel,3))):
-                    for i in range(random.randint(1,3)):
+                if(not anime_mode and not less_verbose and templatemode == False and specialmode == False and "-artist-" in completeprompt and uncommon_dist(max(8 - insanitylevel,3), rng)):
+                    for i in range(rng.randint(1,3)):
                         # print("adding artist stuff")
                         completeprompt += ", -artistdescription-"
                         descriptivemode = True
@@ -2881,82 +2996,82 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
                     
 
                 # if not, we could go in random styles descriptor mode
-                elif(not anime_mode and not less_verbose and templatemode == False and specialmode == False and legendary_dist(10 - insanitylevel)):
-                    for i in range(random.randint(1,max(7,insanitylevel + 2))):
+                elif(not anime_mode and not less_verbose and templatemode == False and specialmode == False and legendary_dist(10 - insanitylevel, rng)):
+                    for i in range(rng.randint(1,max(7,insanitylevel + 2))):
                         # print("adding random crap")
                         completeprompt += ", -allstylessuffix-"
                         descriptivemode = True
                     completeprompt += ", "
 
                 # and on high levels, DO EVERYTHING :D
-                if(descriptivemode == False or rare_dist(insanitylevel)):
+                if(descriptivemode == False or rare_dist(insanitylevel, rng)):
 
                     # Add more quality while in greg mode lol
                     if(originalartistchoice == "greg mode" and generatequality == True):
                         completeprompt += "-quality-, "
 
                     # others
-                    if(chance_roll(max(1,insanitylevel -1), directionchance) and generatedirection == True):
+                    if(chance_roll(max(1,insanitylevel -1), directionchance, rng) and generatedirection == True):
                         completeprompt += "-direction-, "
 
-                    if(chance_roll(insanitylevel, moodchance) and generatemood == True):
+                    if(chance_roll(insanitylevel, moodchance, rng) and generatemood == True):
                         completeprompt += "-mood-, " 
 
                     # add in some more mini vomits
-                    if(chance_roll(insanitylevel, minivomitsuffixchance) and generateminivomit == True):
+                    if(chance_roll(insanitylevel, minivomitsuffixchance, rng) and generateminivomit == True):
                         completeprompt += " -minivomit-, "
                 
-                    if(chance_roll(insanitylevel, artmovementchance) and generateartmovement == True):
+                    if(chance_roll(insanitylevel, artmovementchance, rng) and generateartmovement == True):
                         completeprompt += "-artmovement-, "  
                     
-                    if(chance_roll(insanitylevel, lightingchance) and generatelighting == True):
+                    if(chance_roll(insanitylevel, lightingchance, rng) and generatelighting == True):
                         completeprompt += "-lighting-, "  
 
                     # determine wether we have a photo or not
                     if("photo" in completeprompt.lower()):
                         isphoto = 1
                         
-                    if(chance_roll(insanitylevel, photoadditionchance) and isphoto == 1 and generatephotoaddition == True):
-                        completeprompt += random.choice(photoadditionlist) + ", "
+                    if(chance_roll(insanitylevel, photoadditionchance, rng) and isphoto == 1 and generatephotoaddition == True):
+                        completeprompt += rng.choice(photoadditionlist) + ", "
                             
                     if(isphoto == 1 and generatecamera == True):
                         completeprompt += "-camera-, "  
 
-                    if(chance_roll(insanitylevel, lenschance) or isphoto == 1):
+                    if(chance_roll(insanitylevel, lenschance, rng) or isphoto == 1):
                         if(generatelens == True):
                             completeprompt += "-lens-, "
 
-                    if(chance_roll(insanitylevel, colorschemechance) and generatecolorscheme == True):
+                    if(chance_roll(insanitylevel, colorschemechance, rng) and generatecolorscheme == True):
                         completeprompt += "-colorscheme-, "
 
                     # vomit some cool/wierd things into the prompt
-                    if(chance_roll(insanitylevel, vomit1chance) and generatevomit == True):
+                    if(chance_roll(insanitylevel, vomit1chance, rng) and generatevomit == True):
                         completeprompt += "-vomit-, "
-                        if(chance_roll(insanitylevel, vomit2chance)):
+                        if(chance_roll(insanitylevel, vomit2chance, rng)):
                             completeprompt += "-vomit-, "
 
                     # human specfic vomit
-                    if(mainchooser == "humanoid" and chance_roll(insanitylevel, humanvomitchance) and generatehumanvomit == True):
+                    if(mainchooser == "humanoid" and chance_roll(insanitylevel, humanvomitchance, rng) and generatehumanvomit == True):
                         completeprompt += "-humanvomit-, "
-                        if(chance_roll(insanitylevel, humanvomitchance)):
+                        if(chance_roll(insanitylevel, humanvomitchance, rng)):
                             completeprompt += "-humanvomit-, "
 
                     #adding a great work of art, like starry night has cool effects. But this should happen only very rarely.
-                    if(chance_roll(insanitylevel, greatworkchance) and generategreatwork == True):
+                    if(chance_roll(insanitylevel, greatworkchance, rng) and generategreatwork == True):
                         completeprompt += " in the style of -greatwork-, "
 
                     #adding a poemline. But this should happen only very rarely.
-                    if(chance_roll(insanitylevel, poemlinechance) and generatepoemline == True):
+                    if(chance_roll(insanitylevel, poemlinechance, rng) and generatepoemline == True):
                         completeprompt += " \"-poemline-\", "
 
                     #adding a songline. But this should happen only very rarely.
-                    if(chance_roll(insanitylevel, songlinechance) and generatesongline == True):
+                    if(chance_roll(insanitylevel, songlinechance, rng) and generatesongline == True):
                         completeprompt += " \"-songline-\", "
 
                     # everyone loves the adding quality. The better models don't need this, but lets add it anyway
-                    if((chance_roll(insanitylevel, quality1chance) or originalartistchoice == "greg mode") and generatequality == True):
+                    if((chance_roll(insanitylevel, quality1chance, rng) or originalartistchoice == "greg mode") and generatequality == True):
                         completeprompt += "-quality-, "
-                        if((chance_roll(insanitylevel, quality2chance) or originalartistchoice == "greg mode")):
+                        if((chance_roll(insanitylevel, quality2chance, rng) or originalartistchoice == "greg mode")):
                             completeprompt += "-quality-, "
 
         
@@ -2964,42 +3079,42 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
         # start second part of art blaster here
         if(artblastermode==True):
             step = 0
-            end = random.randint(1, insanitylevel) + 1
+            end = rng.randint(1, insanitylevel) + 1
             while step < end:
-                if(uncommon_dist(insanitylevel) and bool(artistlist)):
+                if(uncommon_dist(insanitylevel, rng) and bool(artistlist)):
                     completeprompt += "-artist-, "
-                if(uncommon_dist(insanitylevel) and bool(artmovementlist)):
+                if(uncommon_dist(insanitylevel, rng) and bool(artmovementlist)):
                     completeprompt += "-artmovement-, "
-                if(unique_dist(insanitylevel) and bool(vomitlist)):
+                if(unique_dist(insanitylevel, rng) and bool(vomitlist)):
                     completeprompt += "-vomit-, "
-                if(unique_dist(insanitylevel) and bool(imagetypelist)):
+                if(unique_dist(insanitylevel, rng) and bool(imagetypelist)):
                     completeprompt += "-imagetype-, "
-                if(unique_dist(insanitylevel) and bool(colorschemelist)):
+                if(unique_dist(insanitylevel, rng) and bool(colorschemelist)):
                     completeprompt += "-colorscheme-, "
                 step = step + 1 
         
          # start second part of unique art here
         if(uniqueartmode==True):
             step = 0
-            end = random.randint(1, insanitylevel) + 1
+            end = rng.randint(1, insanitylevel) + 1
             while step < end:
-                if(uncommon_dist(insanitylevel) and bool(artmovementlist)):
+                if(uncommon_dist(insanitylevel, rng) and bool(artmovementlist)):
                     completeprompt += "-artmovement-, "
-                if(uncommon_dist(insanitylevel) and bool(colorschemelist)):
+                if(uncommon_dist(insanitylevel, rng) and bool(colorschemelist)):
                     completeprompt += "-colorscheme-, "
-                if(rare_dist(insanitylevel) and bool(vomitlist)):
+                if(rare_dist(insanitylevel, rng) and bool(vomitlist)):
                     completeprompt += "-vomit-, "
-                if(rare_dist(insanitylevel) and bool(lightinglist)):
+                if(rare_dist(insanitylevel, rng) and bool(lightinglist)):
                     completeprompt += "-lighting-, "
-                if(unique_dist(insanitylevel) and bool(qualitylist)):
+                if(unique_dist(insanitylevel, rng) and bool(qualitylist)):
                     completeprompt += "-quality-, "
-                if(unique_dist(insanitylevel) and bool(artistlist)):
+                if(unique_dist(insanitylevel, rng) and bool(artistlist)):
                     completeprompt += "-artist-, "
-                if(novel_dist(insanitylevel) and bool(greatworklist)):
+                if(novel_dist(insanitylevel, rng) and bool(greatworklist)):
                     completeprompt += "in style of -greatwork-, "
-                if(novel_dist(insanitylevel) and bool(poemlinelist)):
+                if(novel_dist(insanitylevel, rng) and bool(poemlinelist)):
                     completeprompt += "\"-poemline-\", "
-                if(novel_dist(insanitylevel) and bool(songlinelist)):
+                if(novel_dist(insanitylevel, rng) and bool(songlinelist)):
                     completeprompt += "\"-songline-\", "
                 
                 step = step + 1 
@@ -3008,34 +3123,34 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
         # start second part of quality vomit here
         if(qualityvomitmode==True):
             step = 0
-            end = random.randint(1, insanitylevel) + 1
+            end = rng.randint(1, insanitylevel) + 1
             while step < end:
-                if(uncommon_dist(insanitylevel) and bool(vomitlist)):
+                if(uncommon_dist(insanitylevel, rng) and bool(vomitlist)):
                     completeprompt += "-vomit-, "
-                if(uncommon_dist(insanitylevel) and bool(qualitylist)):
+                if(uncommon_dist(insanitylevel, rng) and bool(qualitylist)):
                     completeprompt += "-quality-, "
-                if(unique_dist(insanitylevel) and bool(minivomitlist)):
+                if(unique_dist(insanitylevel, rng) and bool(minivomitlist)):
                     completeprompt += "-minivomit-, "
-                if(unique_dist(insanitylevel) and bool(artmovementlist)) :
+                if(unique_dist(insanitylevel, rng) and bool(artmovementlist)) :
                     completeprompt += "-artmovement-, "
-                if(unique_dist(insanitylevel) and bool(colorschemelist)):
+                if(unique_dist(insanitylevel, rng) and bool(colorschemelist)):
                     completeprompt += "-colorscheme-, "
                 step = step + 1 
         
         # start second part of mood color here
         if(colorcannonmode == True):
             step = 0
-            end = random.randint(1, insanitylevel) + 1
+            end = rng.randint(1, insanitylevel) + 1
             while step < end:
-                if(uncommon_dist(insanitylevel) and bool(moodlist)):
+                if(uncommon_dist(insanitylevel, rng) and bool(moodlist)):
                     completeprompt += "-mood-, "
-                if(uncommon_dist(insanitylevel) and bool(colorschemelist)):
+                if(uncommon_dist(insanitylevel, rng) and bool(colorschemelist)):
                     completeprompt += "-colorscheme-, "
-                if(rare_dist(insanitylevel) and bool(vomitlist)):
+                if(rare_dist(insanitylevel, rng) and bool(vomitlist)):
                     completeprompt += "-vomit-, "
-                if(unique_dist(insanitylevel) and bool(artmovementlist)):
+                if(unique_dist(insanitylevel, rng) and bool(artmovementlist)):
                     completeprompt += "-artmovement-, "
-                if(unique_dist(insanitylevel) and bool(lightinglist)):
+                if(unique_dist(insanitylevel, rng) and bool(lightinglist)):
                     completeprompt += "-lighting-, "
                 step = step + 1 
 
@@ -3043,17 +3158,17 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
         # start second part of photo fantasy here
         if(photofantasymode == True):
             step = 0
-            end = random.randint(1, insanitylevel) + 1
+            end = rng.randint(1, insanitylevel) + 1
             while step < end:
-                if(uncommon_dist(insanitylevel) and bool(lightinglist)):
+                if(uncommon_dist(insanitylevel, rng) and bool(lightinglist)):
                     completeprompt += "-lighting-, "
-                if(uncommon_dist(insanitylevel) and bool(cameralist)):
+                if(uncommon_dist(insanitylevel, rng) and bool(cameralist)):
                     completeprompt += "-camera-, "
-                if(rare_dist(insanitylevel) and bool(lenslist)):
+                if(rare_dist(insanitylevel, rng) and bool(lenslist)):
                     completeprompt += "-lens-, "
-                if(unique_dist(insanitylevel) and bool(moodlist)):
+                if(unique_dist(insanitylevel, rng) and bool(moodlist)):
                     completeprompt += "-mood-, "
-                if(unique_dist(insanitylevel) and bool(colorschemelist)):
+                if(unique_dist(insanitylevel, rng) and bool(colorschemelist)):
                     completeprompt += "-colorscheme-, "
                 step = step + 1 
         
@@ -3061,31 +3176,31 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
         if(massivemadnessmode == True):
             completeprompt += ", "
             step = 0
-            end = random.randint(1, insanitylevel) + 1
+            end = rng.randint(1, insanitylevel) + 1
             while step < end:
-                if(rare_dist(insanitylevel) and bool(artistlist)):
+                if(rare_dist(insanitylevel, rng) and bool(artistlist)):
                     completeprompt += "-artist-, "
-                if(rare_dist(insanitylevel) and bool(descriptorlist)):
+                if(rare_dist(insanitylevel, rng) and bool(descriptorlist)):
                     completeprompt += "-descriptor-, "
-                if(rare_dist(insanitylevel) and bool(moodlist)):
+                if(rare_dist(insanitylevel, rng) and bool(moodlist)):
                     completeprompt += "-mood-, "
-                if(rare_dist(insanitylevel) and bool(colorschemelist)):
+                if(rare_dist(insanitylevel, rng) and bool(colorschemelist)):
                     completeprompt += "-colorscheme-, "
-                if(rare_dist(insanitylevel) and bool(vomitlist)):
+                if(rare_dist(insanitylevel, rng) and bool(vomitlist)):
                     completeprompt += "-vomit-, "
-                if(rare_dist(insanitylevel) and bool(artmovementlist)):
+                if(rare_dist(insanitylevel, rng) and bool(artmovementlist)):
                     completeprompt += "-artmovement-, "
-                if(rare_dist(insanitylevel) and bool(lightinglist)):
+                if(rare_dist(insanitylevel, rng) and bool(lightinglist)):
                     completeprompt += "-lighting-, "
-                if(rare_dist(insanitylevel) and bool(minilocationadditionslist)):
+                if(rare_dist(insanitylevel, rng) and bool(minilocationadditionslist)):
                     completeprompt += "-minilocationaddition-, "
-                if(rare_dist(insanitylevel) and bool(materiallist)):
+                if(rare_dist(insanitylevel, rng) and bool(materiallist)):
                     completeprompt += "-material-, "
-                if(rare_dist(insanitylevel) and bool(conceptsuffixlist)):
+                if(rare_dist(insanitylevel, rng) and bool(conceptsuffixlist)):
                     completeprompt += "-conceptsuffix-, "
-                if(rare_dist(insanitylevel) and bool(qualitylist)):
+                if(rare_dist(insanitylevel, rng) and bool(qualitylist)):
                     completeprompt += "-quality-, "
-                if(rare_dist(insanitylevel) and bool(cameralist)):
+                if(rare_dist(insanitylevel, rng) and bool(cameralist)):
                     completeprompt += "-camera-, "
                 step = step + 1 
 
@@ -3094,16 +3209,16 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
             completeprompt += chosenstylesuffix
         
         templatesmodechance = 0
-        if(uncommon_dist(insanitylevel) and not anime_mode): # not for anime models!
+        if(uncommon_dist(insanitylevel, rng) and not anime_mode): # not for anime models!
            templatesmodechance = 1
 
         if(dynamictemplatesmode == True and templatesmodechance == 1):
-            for i in range(random.randint(1,max(2,insanitylevel))):
+            for i in range(rng.randint(1,max(2,insanitylevel))):
                 completeprompt += ", -allstylessuffix-"
             
 
        
-        if(dynamictemplatesmode == True and common_dist(insanitylevel) and templatesmodechance == 0):
+        if(dynamictemplatesmode == True and common_dist(insanitylevel, rng) and templatesmodechance == 0):
             if("-artist-" in completeprompt or artists == "none"):
                 dynamictemplatessuffixlist = [sentence for sentence in dynamictemplatessuffixlist if "-artist-" not in sentence.lower()]
                 dynamictemplatessuffixlist = [sentence for sentence in dynamictemplatessuffixlist if "-artiststyle-" not in sentence.lower()]
@@ -3123,10 +3238,10 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
             if("-mood-" in completeprompt or "-humanexpression" in completeprompt ):
                 dynamictemplatessuffixlist = [sentence for sentence in dynamictemplatessuffixlist if "-mood-" not in sentence.lower()]
                 dynamictemplatessuffixlist = [sentence for sentence in dynamictemplatessuffixlist if "-humanexpression-" not in sentence.lower()]
-            chosenstylesuffix = random.choice(dynamictemplatessuffixlist)
+            chosenstylesuffix = rng.choice(dynamictemplatessuffixlist)
             completeprompt += ". " + chosenstylesuffix
 
-            if(normal_dist(insanitylevel)):
+            if(normal_dist(insanitylevel, rng)):
                 if("-artist-" in completeprompt):
                     dynamictemplatessuffixlist = [sentence for sentence in dynamictemplatessuffixlist if "-artist-" not in sentence.lower()]
                 if("-lighting-" in completeprompt):
@@ -3144,26 +3259,26 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
                 if("-mood-" in completeprompt or "-humanexpression" in completeprompt ):
                     dynamictemplatessuffixlist = [sentence for sentence in dynamictemplatessuffixlist if "-mood-" not in sentence.lower()]
                     dynamictemplatessuffixlist = [sentence for sentence in dynamictemplatessuffixlist if "-humanexpression-" not in sentence.lower()]
-                chosenstylesuffix = random.choice(dynamictemplatessuffixlist)
+                chosenstylesuffix = rng.choice(dynamictemplatessuffixlist)
                 completeprompt += " " + chosenstylesuffix
 
         
         # custom style list
-        if(chance_roll(insanitylevel, customstyle1chance) and generatestyle == True):
+        if(chance_roll(insanitylevel, customstyle1chance, rng) and generatestyle == True):
             completeprompt += "-styletilora-, "
-            if(chance_roll(insanitylevel, customstyle2chance)):
+            if(chance_roll(insanitylevel, customstyle2chance, rng)):
                 completeprompt += "-styletilora-, "
 
 
         # custom suffix list
         for i in range(custominputsuffixrepeats):
-            if(chance_roll(insanitylevel, custominputsuffixchance) and generatecustominputsuffix == True):
-                completeprompt += random.choice(custominputsuffixlist) + ", "
+            if(chance_roll(insanitylevel, custominputsuffixchance, rng) and generatecustominputsuffix == True):
+                completeprompt += rng.choice(custominputsuffixlist) + ", "
 
 
 
         if artistmode in ["enhancing"]:
-            completeprompt += "::" + str(random.randint(1,17)) + "] "
+            completeprompt += "::" + str(rng.randint(1,17)) + "] "
 
 
 
@@ -3172,31 +3287,31 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
             doartistnormal = True
             if(artists == "greg mode"):
                 artistbylist = ["art by", "designed by", "stylized by", "by"]
-                completeprompt += random.choice(artistbylist) + " -gregmode- ,"
+                completeprompt += rng.choice(artistbylist) + " -gregmode- ,"
                 doartistnormal = False
 
                 # in case we have ALL, we can also do a specific artist mode per chosen subject. sometimes
-            elif(originalartistchoice == "all" and random.randint(0,3) == 0):
+            elif(originalartistchoice == "all" and rng.randint(0,3) == 0):
                 if(mainchooser in ["humanoid", "animal"]):
                     artistbylist = ["art by", "designed by", "stylized by", "by"]
-                    completeprompt += random.choice(artistbylist) + " OR(-portraitartist-;-characterartist-), OR(-portraitartist-;-characterartist-) OR(;and OR(-fantasyartist-;-scifiartist-;-photographyartist-;-digitalartist-;-graphicdesignartist-);uncommon), "
+                    completeprompt += rng.choice(artistbylist) + " OR(-portraitartist-;-characterartist-), OR(-portraitartist-;-characterartist-) OR(;and OR(-fantasyartist-;-scifiartist-;-photographyartist-;-digitalartist-;-graphicdesignartist-);uncommon), "
                     doartistnormal = False
 
                 elif(mainchooser in ["landscape"]):
                     artistbylist = ["art by", "designed by", "stylized by", "by"]
-                    completeprompt += random.choice(artistbylist) + " OR(-landscapeartist-;-digitalartist-), OR(-landscapeartist-;-graphicdesignartist-) OR(;and OR(-fantasyartist-;-scifiartist-;-photographyartist-;-digitalartist-;-graphicdesignartist-);uncommon), "
+                    completeprompt += rng.choice(artistbylist) + " OR(-landscapeartist-;-digitalartist-), OR(-landscapeartist-;-graphicdesignartist-) OR(;and OR(-fantasyartist-;-scifiartist-;-photographyartist-;-digitalartist-;-graphicdesignartist-);uncommon), "
                     doartistnormal = False
 
                 elif(subjectchooser in ["building"]):
                     artistbylist = ["art by", "designed by", "stylized by", "by"]
-                    completeprompt += random.choice(artistbylist) + " OR(-landscapeartist-;-architectartist-), OR(-landscapeartist-;-architectartist-) OR(;and OR(-fantasyartist-;-scifiartist-;-photographyartist-;-digitalartist-;-graphicdesignartist-);uncommon), "
+                    completeprompt += rng.choice(artistbylist) + " OR(-landscapeartist-;-architectartist-), OR(-landscapeartist-;-architectartist-) OR(;and OR(-fantasyartist-;-scifiartist-;-photographyartist-;-digitalartist-;-graphicdesignartist-);uncommon), "
                     doartistnormal = False
             
             if(doartistnormal):
                 # take 1-3 artists, weighted to 1-2
-                step = random.randint(0, 1)
+                step = rng.randint(0, 1)
                 minstep = step
-                end = random.randint(1, insanitylevel3)
+                end = rng.randint(1, insanitylevel3)
 
 
 
@@ -3209,7 +3324,7 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
                 # stopping at step x ::X
 
                 
-                modeselector = random.randint(0,10)
+                modeselector = rng.randint(0,10)
                 if modeselector < 4 and end - step >= 2:
                     artistmodeslist = ["hybrid", "stopping", "adding", "switching"]
                     artistmode = artistmodeslist[modeselector]
@@ -3225,7 +3340,7 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
                     completeprompt += " ["
                     
                 while step < end: 
-                    if(normal_dist(insanitylevel) and remove_weights == False):
+                    if(normal_dist(insanitylevel, rng) and remove_weights == False):
                         isweighted = 1
                     
                     if isweighted == 1:
@@ -3234,7 +3349,7 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
                     #completeprompt = add_from_csv(completeprompt, "artists", 0, "art by ","")
                     if(step == minstep):
                         # sometimes do this
-                        if(giventypeofimage=="" and imagetype == "all" and random.randint(0, 1) == 0):
+                        if(giventypeofimage=="" and imagetype == "all" and rng.randint(0, 1) == 0):
                             if(artiststyleselectormode == "normal"):
                                 completeprompt += artiststyleselector + " art "
                             else:
@@ -3242,10 +3357,10 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
                         artistbylist = ["art by", "designed by", "stylized by", "by"]
                     else:
                         artistbylist = [""]
-                    completeprompt += random.choice(artistbylist) + " -artist-"
+                    completeprompt += rng.choice(artistbylist) + " -artist-"
                     
                     if isweighted == 1:
-                        completeprompt += ":" + str(1 + (random.randint(-3,3)/10)) + ")"       
+                        completeprompt += ":" + str(1 + (rng.randint(-3,3)/10)) + ")"       
                     
                     if artistmode in ["hybrid"] and not end - step == 1:
                         completeprompt += "|"
@@ -3261,10 +3376,10 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
 
                 if artistmode in ["stopping"]:
                     completeprompt += "::"
-                    completeprompt += str(random.randint(1,19))
+                    completeprompt += str(rng.randint(1,19))
                 
                 if artistmode in ["switching","adding"]:
-                    completeprompt += ":" + str(random.randint(1,18))
+                    completeprompt += ":" + str(rng.randint(1,18))
                 if artistmode in ["hybrid", "stopping","adding", "switching"]:
                     completeprompt += "] "
                 # end of the artist stuff
@@ -3275,8 +3390,8 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
             # add a part of the style to the back
             chosenstylesuffixlist = chosenstylesuffix.split(",")
             for i in range(len(chosenstylesuffixlist)):
-                if(random.randint(3, 10)<insanitylevel):
-                    chosenstylesuffixlist.pop(random.randint(0, len(chosenstylesuffixlist)-1))
+                if(rng.randint(3, 10)<insanitylevel):
+                    chosenstylesuffixlist.pop(rng.randint(0, len(chosenstylesuffixlist)-1))
             chosenstylesuffixcomplete = ", ".join(chosenstylesuffixlist)
             
 
@@ -3284,13 +3399,13 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
             
         if(artifymode == True):
             amountofartists = "random"
-            if(unique_dist(insanitylevel)):
+            if(unique_dist(insanitylevel, rng)):
                mode = "super remix turbo"
-            elif(legendary_dist(insanitylevel)):
+            elif(legendary_dist(insanitylevel, rng)):
                  mode = "remix"
             else:
                 mode = "standard"
-            completeprompt = artify_prompt(insanitylevel=insanitylevel,prompt=completeprompt, artists=artists, amountofartists=amountofartists, mode=mode, seed=seed)
+            completeprompt = _artify_prompt(generator, insanitylevel=insanitylevel,prompt=completeprompt, artists=artists, amountofartists=amountofartists, mode=mode, seed=seed, rng=rng)
         
         completeprompt += " -tempnewwords- "
         completeprompt += ", "
@@ -3319,13 +3434,13 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
 
     # In front and the back?
     if(dynamictemplatesmode == False):
-        completeprompt = parse_custom_functions(completeprompt, insanitylevel)
+        completeprompt = parse_custom_functions(completeprompt, insanitylevel, rng=rng)
     
     # Sometimes change he/she to the actual subject
     # Doesnt work if someone puts in a manual subject
     if(mainchooser == "humanoid" and (givensubject == "" or subjectingivensubject and givensubject != "") and subjectchooser != "manwomanmultiple"):
         samehumanreplacementlist = ["-heshe-","-heshe-","-heshe-","-heshe-","-heshe-", "-samehumansubject-", "-samehumansubject-", "-samehumansubject-", "-samehumansubject-", "-samehumansubject-"]
-        random.shuffle(samehumanreplacementlist)
+        rng.shuffle(samehumanreplacementlist)
         
         # Convert completeprompt to a list to allow character-wise manipulation
         completeprompt_list = list(completeprompt)
@@ -3346,7 +3461,7 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
         # Sometimes change he/she to the actual subject
     if(mainchooser in  ["animal", "object"] and (givensubject == "" or subjectingivensubject and givensubject != "")):
         sameobjectreplacementlist = ["-heshe-","-heshe-","-heshe-","-heshe-","-heshe-", "-sameothersubject-", "-sameothersubject-", "-sameothersubject-", "-sameothersubject-", "-sameothersubject-"]
-        random.shuffle(sameobjectreplacementlist)
+        rng.shuffle(sameobjectreplacementlist)
         # Convert completeprompt to a list to allow character-wise manipulation
         completeprompt_list = list(completeprompt)
 
@@ -3364,40 +3479,40 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
         completeprompt = "".join(completeprompt_list)
 
     # hair descriptor
-    if(rare_dist(insanitylevel)): # Use base hair descriptor, until we are not.
+    if(rare_dist(insanitylevel, rng)): # Use base hair descriptor, until we are not.
         completeprompt = completeprompt.replace("-hairdescriptor-", "-descriptor-")
     
     # human descriptor
-    if(rare_dist(insanitylevel)): # Use base human descriptor, until we are not.
+    if(rare_dist(insanitylevel, rng)): # Use base human descriptor, until we are not.
         completeprompt = completeprompt.replace("-humandescriptor-", "-descriptor-")
     
     # location descriptor
-    if(rare_dist(insanitylevel)): # Use base location descriptor, until we are not.
+    if(rare_dist(insanitylevel, rng)): # Use base location descriptor, until we are not.
         completeprompt = completeprompt.replace("-locationdescriptor-", "-descriptor-")
     
     # animeal descriptor
-    if(rare_dist(insanitylevel)): # Use base animal descriptor, until we are not.
+    if(rare_dist(insanitylevel, rng)): # Use base animal descriptor, until we are not.
         completeprompt = completeprompt.replace("-animaldescriptor-", "-descriptor-")
 
 
     # sometimes, culture becomes traditional!
-    if(unique_dist(insanitylevel)):
+    if(unique_dist(insanitylevel, rng)):
         completeprompt = completeprompt.replace("-culture-", "traditional -culture-")
 
 
     # first some manual stuff for outfit
 
-    if(unique_dist(insanitylevel)): # sometimes, its just nice to have descriptor and a normal "outfit". We use mini outfits for this!
+    if(unique_dist(insanitylevel, rng)): # sometimes, its just nice to have descriptor and a normal "outfit". We use mini outfits for this!
         completeprompt = completeprompt.replace("-outfit-", "-minioutfit-",1)
-    if(rare_dist(insanitylevel)): # Use base outfit descriptor, until we are not.
+    if(rare_dist(insanitylevel, rng)): # Use base outfit descriptor, until we are not.
         completeprompt = completeprompt.replace("-outfitdescriptor-", "-descriptor-")
     
     # if -outfit- is in the override, we want a consistent result
     if("-outfit-" in overrideoutfit):
-        if(chance_roll(insanitylevel, "common")):
-            overrideoutfit = overrideoutfit.replace("-outfit-", random.choice(outfitlist))
+        if(chance_roll(insanitylevel, "common", rng)):
+            overrideoutfit = overrideoutfit.replace("-outfit-", rng.choice(outfitlist))
         else:
-            overrideoutfit = overrideoutfit.replace("-outfit-", random.choice(minioutfitlist))
+            overrideoutfit = overrideoutfit.replace("-outfit-", rng.choice(minioutfitlist))
 
     if(overrideoutfit != ""):
         completeprompt = completeprompt.replace("-sameoutfit-", overrideoutfit)
@@ -3415,11 +3530,11 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
     completeprompt = completeprompt.replace("-overrideoutfit-", "")
 
     # sometimes replace one descriptor with a artmovement, only on high insanitylevels
-    if(insanitylevel > 7 and unique_dist(insanitylevel)):
+    if(insanitylevel > 7 and unique_dist(insanitylevel, rng)):
         completeprompt = completeprompt.replace("-descriptor-", "-artmovement-",1)
 
     # On low insanity levels (lower than 5) ,a chance refer to the basic bitch list on some occasions
-    if(random.randint(0,insanitylevel) == 0 and insanitylevel < 5): 
+    if(rng.randint(0,insanitylevel) == 0 and insanitylevel < 5): 
         completeprompt = completeprompt.replace("-locationdescriptor-", "-basicbitchdescriptor-")
         completeprompt = completeprompt.replace("-humandescriptor-", "-basicbitchdescriptor-")
         completeprompt = completeprompt.replace("-outfitdescriptor-", "-basicbitchdescriptor-")
@@ -3427,11 +3542,11 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
         completeprompt = completeprompt.replace("-animaldescriptor-", "-basicbitchdescriptor-")
 
     # we now have color combinations, which are stronger than just color. So lets change them while we are at it.
-    if(random.randint(0,max(0, insanitylevel - 2)) <= 0):
+    if(rng.randint(0,max(0, insanitylevel - 2)) <= 0):
         completeprompt = completeprompt.replace("-color- and -color-", "-colorcombination-") # any color and color becomes a color combination
 
         colorreplacementlist = ["-color-","-color-","-color-","-colorcombination-","-colorcombination-", "-colorcombination-", "-colorcombination-", "-colorcombination-", "-colorcombination-", "-colorcombination-"]
-        random.shuffle(colorreplacementlist)
+        rng.shuffle(colorreplacementlist)
         
         # Convert completeprompt to a list to allow character-wise manipulation
         completeprompt_list = list(completeprompt)
@@ -3451,11 +3566,11 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
 
 
      # we now have material combinations, which are stronger than just one material. So lets change them while we are at it.
-    if(random.randint(0,max(0, insanitylevel - 4)) <= 0):
+    if(rng.randint(0,max(0, insanitylevel - 4)) <= 0):
         completeprompt = completeprompt.replace("-material- and -material-", "-materialcombination-") # any color and color becomes a color combination
 
         materialreplacementlist = ["-material-","-material-","-material-","-materialcombination-","-materialcombination-", "-materialcombination-", "-materialcombination-", "-materialcombination-", "-materialcombination-", "-materialcombination-"]
-        random.shuffle(materialreplacementlist)
+        rng.shuffle(materialreplacementlist)
         
         # Convert completeprompt to a list to allow character-wise manipulation
         completeprompt_list = list(completeprompt)
@@ -3476,172 +3591,21 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
         
     #    print(completeprompt)
     
-    # lol, this needs a rewrite :D
-    while (
-    "-color-" in completeprompt or
-    "-material-" in completeprompt or
-    "-animal-" in completeprompt or
-    "-object-" in completeprompt or
-    "-fictional-" in completeprompt or
-    "-nonfictional-" in completeprompt or
-    "-conceptsuffix-" in completeprompt or
-    "-building-" in completeprompt or
-    "-vehicle-" in completeprompt or
-    "-outfit-" in completeprompt or
-    "-location-" in completeprompt or
-    "-conceptprefix-" in completeprompt or
-    "-descriptor-" in completeprompt or
-    "-food-" in completeprompt or
-    "-haircolor-" in completeprompt or
-    "-hairstyle-" in completeprompt or
-    "-job-" in completeprompt or
-    "-culture-" in completeprompt or
-    "-accessory-" in completeprompt or
-    "-humanoid-" in completeprompt or
-    "-manwoman-" in completeprompt or
-    "-human-" in completeprompt or
-    "-colorscheme-" in completeprompt or
-    "-mood-" in completeprompt or
-    "-genderdescription-" in completeprompt or
-    "-artmovement-" in completeprompt or
-    "-malefemale-" in completeprompt or
-    "-objecttotal-" in completeprompt or
-    "-outfitprinttotal-" in completeprompt or
-    "-bodytype-" in completeprompt or
-    "-minilocation-" in completeprompt or
-    "-minilocationaddition-" in completeprompt or
-    "-pose-" in completeprompt or
-    "-season-" in completeprompt or
-    "-minioutfit-" in completeprompt or
-    "-elaborateoutfit-" in completeprompt or
-    "-minivomit-" in completeprompt or
-    "-vomit-" in completeprompt or
-    "-rpgclass-" in completeprompt or
-    "-subjectfromfile-" in completeprompt or
-    "-outfitfromfile-" in completeprompt or
-    "-brand-" in completeprompt or
-    "-space-" in completeprompt or
-    "-artist-" in completeprompt or
-    "-imagetype-" in completeprompt or
-    "-othertype-" in completeprompt or
-    "-quality-" in completeprompt or
-    "-lighting-" in completeprompt or
-    "-camera-" in completeprompt or
-    "-lens-" in completeprompt or
-    "-imagetypequality-" in completeprompt or
-    "-poemline-" in completeprompt or
-    "-songline-" in completeprompt or
-    "-greatwork-" in completeprompt or
-    "-fantasyartist-" in completeprompt or 
-    "-popularartist-" in completeprompt or 
-    "-romanticismartist-" in completeprompt or 
-    "-photographyartist-" in completeprompt or
-    "-emoji-" in completeprompt or
-    "-timeperiod-" in completeprompt or
-    "-shotsize-" in completeprompt or
-    "-musicgenre-" in completeprompt or
-    "-animaladdition-" in completeprompt or
-    "-addontolocationinside-" in completeprompt or
-    "-addontolocation-" in completeprompt or
-    "-objectaddition-" in completeprompt or
-    "-humanaddition-" in completeprompt or
-    "-overalladdition-" in completeprompt or
-    "-focus-" in completeprompt or
-    "-direction-" in completeprompt or
-    "-styletilora-" in completeprompt or
-    "-manwomanrelation-" in completeprompt or
-    "-manwomanmultiple-" in completeprompt or
-    "-waterlocation-" in completeprompt or
-    "-container-" in completeprompt or
-    "-firstname-" in completeprompt or
-    "-flora-" in completeprompt or
-    "-print-" in completeprompt or
-    "-miniactivity-" in completeprompt or
-    "-pattern-" in completeprompt or
-    "-animalsuffixaddition-" in completeprompt or
-    "-chair-" in completeprompt or
-    "-cardname-" in completeprompt or
-    "-covering-" in completeprompt or
-    "-heshe-" in completeprompt or
-    "-hisher-" in completeprompt or
-    "-himher-" in completeprompt or
-    "-outfitdescriptor-" in completeprompt or
-    "-hairdescriptor-" in completeprompt or
-    "-hairvomit-" in completeprompt or
-    "-humandescriptor-" in completeprompt or
-    "-facepart-" in completeprompt or
-    "-buildfacepart-" in completeprompt or
-    "-outfitvomit-" in completeprompt or
-    "-locationdescriptor-" in completeprompt or
-    "-basicbitchdescriptor-" in completeprompt or
-    "-animaldescriptor-" in completeprompt or
-    "-humanexpression-" in completeprompt or
-    "-humanvomit-" in completeprompt or
-    "-eyecolor-" in completeprompt or
-    "-fashiondesigner-" in completeprompt or
-    "-colorcombination-" in completeprompt or
-    "-materialcombination-" in completeprompt or
-    "-oppositefictional-" in completeprompt or
-    "-oppositenonfictional-" in completeprompt or
-    "-photoaddition-" in completeprompt or
-    "-age-" in completeprompt or
-    "-agecalculator-" in completeprompt or
-    "-gregmode-" in completeprompt or
-    "-portraitartist-" in completeprompt or
-    "-characterartist-" in completeprompt or
-    "-landscapeartist-" in completeprompt or
-    "-scifiartist-" in completeprompt or
-    "-graphicdesignartist-" in completeprompt or
-    "-digitalartist-" in completeprompt or
-    "-architectartist-" in completeprompt or
-    "-cinemaartist-" in completeprompt or
-    "-element-" in completeprompt or
-    "-setting-" in completeprompt or
-    "-charactertype-" in completeprompt or
-    "-objectstohold-" in completeprompt or
-    "-episodetitle-" in completeprompt or
-    "-token-" in completeprompt or
-    "-allstylessuffix-" in completeprompt or
-    "-fluff-" in completeprompt or
-    "-event-" in completeprompt or
-    "-background-" in completeprompt or
-    "-occult-" in completeprompt or
-    "-locationfantasy-" in completeprompt or
-    "-locationscifi-" in completeprompt or
-    "-locationvideogame-" in completeprompt or
-    "-locationbiome-" in completeprompt or
-    "-locationcity-" in completeprompt or
-    "-bird-" in completeprompt or
-    "-cat-" in completeprompt or
-    "-dog-" in completeprompt or
-    "-insect-" in completeprompt or
-    "-pokemon-" in completeprompt or
-    "-pokemontype-" in completeprompt or
-    "-marinelife-"  in completeprompt):
-        allwildcardslistnohybrid = [ "-color-","-object-", "-animal-", "-fictional-","-nonfictional-","-building-","-vehicle-","-location-","-conceptprefix-","-food-","-haircolor-","-hairstyle-","-job-", "-accessory-", "-humanoid-", "-manwoman-", "-human-", "-colorscheme-", "-mood-", "-genderdescription-", "-artmovement-", "-malefemale-", "-bodytype-", "-minilocation-", "-minilocationaddition-", "-pose-", "-season-", "-minioutfit-", "-elaborateoutfit-", "-minivomit-", "-vomit-", "-rpgclass-", "-subjectfromfile-","-outfitfromfile-", "-brand-", "-space-", "-artist-", "-imagetype-", "-othertype-", "-quality-", "-lighting-", "-camera-", "-lens-","-imagetypequality-", "-poemline-", "-songline-", "-greatwork-", "-fantasyartist-", "-popularartist-", "-romanticismartist-", "-photographyartist-", "-emoji-", "-timeperiod-", "-shotsize-", "-musicgenre-", "-animaladdition-", "-addontolocationinside-", "-addontolocation-", "-objectaddition-", "-humanaddition-", "-overalladdition-", "-focus-", "-direction-", "-styletilora-", "-manwomanrelation-", "-waterlocation-", "-container-", "-firstname-", "-flora-", "-print-", "-miniactivity-", "-pattern-", "-animalsuffixaddition-", "-chair-", "-cardname-", "-covering-", "-heshe-", "-hisher-", "-himher-", "-outfitdescriptor-", "-hairdescriptor-", "-hairvomit-", "-humandescriptor-", "-manwomanmultiple-", "-facepart-", "-buildfacepart-", "-outfitvomit-", "-locationdescriptor-", "-basicbitchdescriptor-", "-animaldescriptor-", "-humanexpression-", "-humanvomit-", "-eyecolor-", "-fashiondesigner-", "-colorcombination-", "-materialcombination-", "-oppositefictional-", "-oppositenonfictional-", "-photoaddition-", "-age-", "-agecalculator-", "-gregmode-"
-                                    ,"-portraitartist-", "-characterartist-" , "-landscapeartist-", "-scifiartist-", "-graphicdesignartist-", "-digitalartist-", "-architectartist-", "-cinemaartist-", "-setting-", "-charactertype-", "-objectstohold-", "-episodetitle-", "-token-", "-allstylessuffix-", "-fluff-", "-event-", "-background-"
-                                    , "-occult-", "-locationfantasy-", "-locationscifi-", "-locationvideogame-", "-locationbiome-", "-locationcity-", "-bird-", "-cat-", "-dog-", "-insect-", "-pokemon-", "-pokemontype-", "-marinelife-"]
-        allwildcardslistnohybridlists = [colorlist, objectlist, animallist, fictionallist, nonfictionallist, buildinglist, vehiclelist, locationlist,conceptprefixlist,foodlist,haircolorlist, hairstylelist,joblist, accessorielist, humanoidlist, manwomanlist, humanlist, colorschemelist, moodlist, genderdescriptionlist, artmovementlist, malefemalelist, bodytypelist, minilocationlist, minilocationadditionslist, poselist, seasonlist, minioutfitlist, elaborateoutfitlist, minivomitlist, vomitlist, rpgclasslist, customsubjectslist, customoutfitslist, brandlist, spacelist, artistlist, imagetypelist, othertypelist, qualitylist, lightinglist, cameralist, lenslist, imagetypequalitylist, poemlinelist, songlinelist, greatworklist, fantasyartistlist, popularartistlist, romanticismartistlist, photographyartistlist, emojilist, timeperiodlist, shotsizelist, musicgenrelist, animaladditionlist, addontolocationinsidelist, addontolocationlist, objectadditionslist, humanadditionlist, overalladditionlist, focuslist, directionlist, stylestiloralist, manwomanrelationlist, waterlocationlist, containerlist, firstnamelist, floralist, printlist, miniactivitylist, patternlist, animalsuffixadditionlist, chairlist, cardnamelist, coveringlist, heshelist, hisherlist, himherlist, outfitdescriptorlist, hairdescriptorlist, hairvomitlist, humandescriptorlist, manwomanmultiplelist, facepartlist, buildfacepartlist, outfitvomitlist, locationdescriptorlist, basicbitchdescriptorlist, animaldescriptorlist, humanexpressionlist, humanvomitlist, eyecolorlist, fashiondesignerlist, colorcombinationlist, materialcombinationlist, oppositefictionallist, oppositenonfictionallist, photoadditionlist, agelist, agecalculatorlist, gregmodelist
-                                         , portraitartistlist, characterartistlist, landscapeartistlist, scifiartistlist, graphicdesignartistlist, digitalartistlist, architectartistlist, cinemaartistlist, settinglist, charactertypelist, objectstoholdlist, episodetitlelist, tokenlist, allstylessuffixlist, flufferlist, eventlist, backgroundlist
-                                         , occultlist, locationfantasylist, locationscifilist, locationvideogamelist, locationbiomelist, locationcitylist, birdlist, catlist, doglist, insectlist, pokemonlist, pokemontypelist, marinelifelist]
-        
-        allwildcardslistwithhybrid = ["-material-", "-descriptor-", "-outfit-", "-conceptsuffix-","-culture-", "-objecttotal-", "-outfitprinttotal-", "-element-"]
-        allwildcardslistwithhybridlists = [materiallist, descriptorlist,outfitlist,conceptsuffixlist,culturelist, objecttotallist, outfitprinttotallist, elementlist]
-        
-        
-        #  keywordsinstring = any(word.lower() in givensubject.lower() for word in keywordslist)
-        for wildcard in allwildcardslistnohybrid:
-            attachedlist = allwildcardslistnohybridlists[allwildcardslistnohybrid.index(wildcard)]
-            completeprompt = replacewildcard(completeprompt, insanitylevel, wildcard, attachedlist,False, advancedprompting, artiststyleselector)
-
-
-        
-        for wildcard in allwildcardslistwithhybrid:
-            attachedlist = allwildcardslistwithhybridlists[allwildcardslistwithhybrid.index(wildcard)]
-            completeprompt = replacewildcard(completeprompt, insanitylevel, wildcard, attachedlist,True, advancedprompting, artiststyleselector)
-
+    # expand all wildcards, see expand_wildcards
+    allwildcardslistnohybrid = [ "-color-","-object-", "-animal-", "-fictional-","-nonfictional-","-building-","-vehicle-","-location-","-conceptprefix-","-food-","-haircolor-","-hairstyle-","-job-", "-accessory-", "-humanoid-", "-manwoman-", "-human-", "-colorscheme-", "-mood-", "-genderdescription-", "-artmovement-", "-malefemale-", "-bodytype-", "-minilocation-", "-minilocationaddition-", "-pose-", "-season-", "-minioutfit-", "-elaborateoutfit-", "-minivomit-", "-vomit-", "-rpgclass-", "-subjectfromfile-","-outfitfromfile-", "-brand-", "-space-", "-artist-", "-imagetype-", "-othertype-", "-quality-", "-lighting-", "-camera-", "-lens-","-imagetypequality-", "-poemline-", "-songline-", "-greatwork-", "-fantasyartist-", "-popularartist-", "-romanticismartist-", "-photographyartist-", "-emoji-", "-timeperiod-", "-shotsize-", "-musicgenre-", "-animaladdition-", "-addontolocationinside-", "-addontolocation-", "-objectaddition-", "-humanaddition-", "-overalladdition-", "-focus-", "-direction-", "-styletilora-", "-manwomanrelation-", "-waterlocation-", "-container-", "-firstname-", "-flora-", "-print-", "-miniactivity-", "-pattern-", "-animalsuffixaddition-", "-chair-", "-cardname-", "-covering-", "-heshe-", "-hisher-", "-himher-", "-outfitdescriptor-", "-hairdescriptor-", "-hairvomit-", "-humandescriptor-", "-manwomanmultiple-", "-facepart-", "-buildfacepart-", "-outfitvomit-", "-locationdescriptor-", "-basicbitchdescriptor-", "-animaldescriptor-", "-humanexpression-", "-humanvomit-", "-eyecolor-", "-fashiondesigner-", "-colorcombination-", "-materialcombination-", "-oppositefictional-", "-oppositenonfictional-", "-photoaddition-", "-age-", "-agecalculator-", "-gregmode-"
+                                ,"-portraitartist-", "-characterartist-" , "-landscapeartist-", "-scifiartist-", "-graphicdesignartist-", "-digitalartist-", "-architectartist-", "-cinemaartist-", "-setting-", "-charactertype-", "-objectstohold-", "-episodetitle-", "-token-", "-allstylessuffix-", "-fluff-", "-event-", "-background-"
+                                , "-occult-", "-locationfantasy-", "-locationscifi-", "-locationvideogame-", "-locationbiome-", "-locationcity-", "-bird-", "-cat-", "-dog-", "-insect-", "-pokemon-", "-pokemontype-", "-marinelife-"]
+    allwildcardslistnohybridlists = [colorlist, objectlist, animallist, fictionallist, nonfictionallist, buildinglist, vehiclelist, locationlist,conceptprefixlist,foodlist,haircolorlist, hairstylelist,joblist, accessorielist, humanoidlist, manwomanlist, humanlist, colorschemelist, moodlist, genderdescriptionlist, artmovementlist, malefemalelist, bodytypelist, minilocationlist, minilocationadditionslist, poselist, seasonlist, minioutfitlist, elaborateoutfitlist, minivomitlist, vomitlist, rpgclasslist, customsubjectslist, customoutfitslist, brandlist, spacelist, artistlist, imagetypelist, othertypelist, qualitylist, lightinglist, cameralist, lenslist, imagetypequalitylist, poemlinelist, songlinelist, greatworklist, fantasyartistlist, popularartistlist, romanticismartistlist, photographyartistlist, emojilist, timeperiodlist, shotsizelist, musicgenrelist, animaladditionlist, addontolocationinsidelist, addontolocationlist, objectadditionslist, humanadditionlist, overalladditionlist, focuslist, directionlist, stylestiloralist, manwomanrelationlist, waterlocationlist, containerlist, firstnamelist, floralist, printlist, miniactivitylist, patternlist, animalsuffixadditionlist, chairlist, cardnamelist, coveringlist, heshelist, hisherlist, himherlist, outfitdescriptorlist, hairdescriptorlist, hairvomitlist, humandescriptorlist, manwomanmultiplelist, facepartlist, buildfacepartlist, outfitvomitlist, locationdescriptorlist, basicbitchdescriptorlist, animaldescriptorlist, humanexpressionlist, humanvomitlist, eyecolorlist, fashiondesignerlist, colorcombinationlist, materialcombinationlist, oppositefictionallist, oppositenonfictionallist, photoadditionlist, agelist, agecalculatorlist, gregmodelist
+                                     , portraitartistlist, characterartistlist, landscapeartistlist, scifiartistlist, graphicdesignartistlist, digitalartistlist, architectartistlist, cinemaartistlist, settinglist, charactertypelist, objectstoholdlist, episodetitlelist, tokenlist, allstylessuffixlist, flufferlist, eventlist, backgroundlist
+                                     , occultlist, locationfantasylist, locationscifilist, locationvideogamelist, locationbiomelist, locationcitylist, birdlist, catlist, doglist, insectlist, pokemonlist, pokemontypelist, marinelifelist]
+    
+    allwildcardslistwithhybrid = ["-material-", "-descriptor-", "-outfit-", "-conceptsuffix-","-culture-", "-objecttotal-", "-outfitprinttotal-", "-element-"]
+    allwildcardslistwithhybridlists = [materiallist, descriptorlist,outfitlist,conceptsuffixlist,culturelist, objecttotallist, outfitprinttotallist, elementlist]
+    wildcardlists = dict(zip(allwildcardslistnohybrid, [(attachedlist, False) for attachedlist in allwildcardslistnohybridlists]))
+    wildcardlists.update(zip(allwildcardslistwithhybrid, [(attachedlist, True) for attachedlist in allwildcardslistwithhybridlists]))
+    completeprompt = expand_wildcards(completeprompt, wildcardlists, insanitylevel, advancedprompting, artiststyleselector, rng=rng)
 
-    completeprompt = replace_user_wildcards(completeprompt)  
+    completeprompt = replace_user_wildcards(completeprompt, rng=rng)  
     # prompt strenght stuff
 
     # if the given subject already is formed like this ( :1.x)
@@ -3678,17 +3642,17 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
     # OR(;foo;bar;uncommon) --> empty unless it hits uncommon roll. Then take foo or bar
     
     
-    completeprompt = parse_custom_functions(completeprompt, insanitylevel)
+    completeprompt = parse_custom_functions(completeprompt, insanitylevel, rng=rng)
 
     # prompt enhancer!
     if(templatemode == False and specialmode == False and base_model != "Stable Cascade"):
         # how insane do we want it?
 
-        maxamountofwords = max(0, -1 + random.randint(0,4),6 - insanitylevel)
-        amountofwords = random.randint(0,maxamountofwords)
+        maxamountofwords = max(0, -1 + rng.randint(0,4),6 - insanitylevel)
+        amountofwords = rng.randint(0,maxamountofwords)
 
         if(amountofwords > 0):
-            enhance_positive_words = enhance_positive(completeprompt, amountofwords)
+            enhance_positive_words = enhance_positive(completeprompt, amountofwords, rng=rng)
             completeprompt = completeprompt.replace("-tempnewwords-", enhance_positive_words)
     completeprompt = completeprompt.replace("-tempnewwords-", "")
        
@@ -3706,7 +3670,7 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
         subjectprompt = cleanup(promptlist[1], advancedprompting, insanitylevel)
         startprompt = cleanup(promptlist[0], advancedprompting, insanitylevel)
         endprompt = cleanup(promptlist[2], advancedprompting, insanitylevel)
-        superpromptresult = one_button_superprompt(insanitylevel=insanitylevel, prompt=subjectprompt, seed=seed, override_subject=givensubject, override_outfit=overrideoutfit, chosensubject=subjectchooser, gender=gender, restofprompt = startprompt + endprompt)
+        superpromptresult = one_button_superprompt(insanitylevel=insanitylevel, prompt=subjectprompt, seed=seed, override_subject=givensubject, override_outfit=overrideoutfit, chosensubject=subjectchooser, gender=gender, restofprompt = startprompt + endprompt, rng=rng)
         completeprompt = startprompt + ", " + superpromptresult + ", " + endprompt
         prompt_g = superpromptresult
         prompt_l = startprompt + endprompt
@@ -3721,13 +3685,15 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
     completeprompt = cleanup(completeprompt, advancedprompting, insanitylevel)
 
     #just for me, some fun with posting fake dev messages (ala old sim games)
-    if(random.randint(1, 50)==1):
+    if(rng.randint(1, 50)==1):
         print("")
-        print(random.choice(devmessagelist))
+        print(rng.choice(devmessagelist))
         print("")
 
     print(completeprompt) # keep this! :D 
 
+    if(returndetails == True):
+        return completeprompt, prompt_g, prompt_l, subjectchooser, seed
     if(prompt_g_and_l == False):
         return completeprompt
     else:
@@ -3735,21 +3701,132 @@ def build_dynamic_prompt(insanitylevel = 5, forcesubject = "all", artists = "all
 
 
 # function that takes an existing prompt and tries to create a variant out of it
-def createpromptvariant(prompt = "", insanitylevel = 5, antivalues = "" , gender = "all", artists = "all", advancedprompting = True):
-    # first load the lists, all copied from above (can that be done better?)
-    # do we want to use the same settings or keep it open??
-
-    # strip the prompt, for EVO in ruinedfooocus:
-    prompt = prompt.strip()
-
-    # first build up a complete anti list. Those values are removing during list building
-    # this uses the antivalues string AND the antilist.csv
-    emptylist = []
-    antilist = csv_to_list("antilist",emptylist , "./userfiles/",1)
-    antivaluelist = antivalues.split(",")
-
-    antilist += antivaluelist
-
+# The wildcards createpromptvariant looks for in a prompt, with the chance a match gets turned into that wildcard.
+# In this order, a word that is in more than one list gets a roll for each of them in turn.
+VARIANT_CHECKS = [
+    ("-human-", "rare"),
+    ("-objecttotal-", "rare"),
+    ("-artist-", "rare"),
+    ("-color-", "uncommon"),
+    ("-animal-", "uncommon"),
+    ("-object-", "uncommon"),
+    ("-fictional-", "uncommon"),
+    ("-nonfictional-", "uncommon"),
+    ("-building-", "uncommon"),
+    ("-vehicle-", "uncommon"),
+    ("-outfit-", "uncommon"),
+    ("-location-", "uncommon"),
+    ("-background-", "uncommon"),
+    ("-accessory-", "uncommon"),
+    ("-artmovement-", "uncommon"),
+    ("-bodytype-", "uncommon"),
+    ("-camera-", "uncommon"),
+    ("-colorscheme-", "uncommon"),
+    ("-eyecolor-", "uncommon"),
+    ("-fashiondesigner-", "uncommon"),
+    ("-colorcombination-", "uncommon"),
+    ("-materialcombination-", "uncommon"),
+    ("-photoaddition-", "uncommon"),
+    ("-age-", "uncommon"),
+    ("-agecalculator-", "uncommon"),
+    ("-gregmode-", "uncommon"),
+    ("-element-", "uncommon"),
+    ("-setting-", "uncommon"),
+    ("-charactertype-", "uncommon"),
+    ("-objectstohold-", "uncommon"),
+    ("-episodetitle-", "uncommon"),
+    ("-fluff-", "uncommon"),
+    ("-occult-", "uncommon"),
+    ("-locationfantasy-", "uncommon"),
+    ("-locationscifi-", "uncommon"),
+    ("-locationvideogame-", "uncommon"),
+    ("-locationbiome-", "uncommon"),
+    ("-locationcity-", "uncommon"),
+    ("-bird-", "uncommon"),
+    ("-cat-", "uncommon"),
+    ("-dog-", "uncommon"),
+    ("-insect-", "uncommon"),
+    ("-pokemon-", "uncommon"),
+    ("-marinelife-", "uncommon"),
+    ("-pokemontype-", "uncommon"),
+    ("-culture-", "uncommon"),
+    ("-descriptor-", "uncommon"),
+    ("-outfitdescriptor-", "rare"),
+    ("-hairdescriptor-", "rare"),
+    ("-hairvomit-", "rare"),
+    ("-humandescriptor-", "rare"),
+    ("-locationdescriptor-", "rare"),
+    ("-basicbitchdescriptor-", "rare"),
+    ("-animaldescriptor-", "rare"),
+    ("-direction-", "uncommon"),
+    ("-emoji-", "uncommon"),
+    ("-humanexpression-", "uncommon"),
+    ("-humanvomit-", "uncommon"),
+    ("-event-", "uncommon"),
+    ("-focus-", "uncommon"),
+    ("-greatwork-", "uncommon"),
+    ("-haircolor-", "uncommon"),
+    ("-hairstyle-", "uncommon"),
+    ("-direction-", "uncommon"),
+    ("-humanoid-", "uncommon"),
+    ("-job-", "uncommon"),
+    ("-lens-", "uncommon"),
+    ("-lighting-", "uncommon"),
+    ("-malefemale-", "uncommon"),
+    ("-manwoman-", "uncommon"),
+    ("-mood-", "uncommon"),
+    ("-othertype-", "uncommon"),
+    ("-pose-", "uncommon"),
+    ("-quality-", "uncommon"),
+    ("-shotsize-", "uncommon"),
+    ("-timeperiod-", "uncommon"),
+    ("-vomit-", "uncommon"),
+    ("-food-", "uncommon"),
+    ("-genderdescription-", "uncommon"),
+    ("-minilocation-", "uncommon"),
+    ("-minioutfit-", "uncommon"),
+    ("-lens-", "uncommon"),
+    ("-season-", "uncommon"),
+    ("-imagetypequality-", "uncommon"),
+    ("-rpgclass-", "uncommon"),
+    ("-brand-", "uncommon"),
+    ("-space-", "uncommon"),
+    ("-poemline-", "uncommon"),
+    ("-songline-", "uncommon"),
+    ("-musicgenre-", "uncommon"),
+    ("-manwomanrelation-", "uncommon"),
+    ("-manwomanmultiple-", "uncommon"),
+    ("-waterlocation-", "uncommon"),
+    ("-container-", "uncommon"),
+    ("-firstname-", "uncommon"),
+    ("-flora-", "uncommon"),
+    ("-print-", "uncommon"),
+    ("-miniactivity-", "uncommon"),
+    ("-pattern-", "uncommon"),
+    ("-chair-", "uncommon"),
+    ("-cardname-", "uncommon"),
+    ("-covering-", "uncommon"),
+    ("-facepart-", "uncommon"),
+    ("-fantasyartist-", "uncommon"),
+    ("-popularartist-", "uncommon"),
+    ("-romanticismartist-", "uncommon"),
+    ("-photographyartist-", "uncommon"),
+    ("-portraitartist-", "uncommon"),
+    ("-characterartist-", "uncommon"),
+    ("-landscapeartist-", "uncommon"),
+    ("-scifiartist-", "uncommon"),
+    ("-graphicdesignartist-", "uncommon"),
+    ("-architectartist-", "uncommon"),
+    ("-cinemaartist-", "uncommon"),
+    ("-styletilora-", "uncommon"),
+    ("-waterlocation-", "uncommon"),
+    ("-allstylessuffix-", "uncommon"),
+    ]
+
+# The lists of createpromptvariant, made once per antilist, gender and artists by PromptGenerator.variant_lists()
+# wildcardlists: wildcard -> (list, activatehybridorswap), in the order expand_wildcards replaces them
+# matches: lowercased value -> the (wildcard, chance) of every list it is in, in the order of VARIANT_CHECKS
+def _build_variant_lists(generator, antilist, gender, artists):
     # build all lists here
 
     colorlist = csv_to_list("colors",antilist)
@@ -3850,11 +3927,7 @@ def createpromptvariant(prompt = "", insanitylevel = 5, antivalues = "" , gender
     objecttotallist = objectlist + buildinglist + vehiclelist + foodlist + spacelist + floralist + containerlist
     outfitprinttotallist = objecttotallist + locationlist + colorlist + musicgenrelist + seasonlist + animallist + patternlist
 
-    styleslist = csv_to_list("styles", antilist,"./csvfiles/templates/",0,"?")
-    stylessuffix = [item.split('-subject-')[1] for item in styleslist]
-    breakstylessuffix = [item.split(',') for item in stylessuffix]
-    allstylessuffixlist = [value for sublist in breakstylessuffix for value in sublist]
-    allstylessuffixlist = list(set(allstylessuffixlist))
+    allstylessuffixlist = list(generator.templates(antilist).stylesuffixes)
 
     # build artists list
     if artists == "wild":
@@ -3902,16 +3975,6 @@ def createpromptvariant(prompt = "", insanitylevel = 5, antivalues = "" , gender
 
     # add any other custom lists
     stylestiloralist = csv_to_list("styles_ti_lora",antilist,"./userfiles/")
-    generatestyle = bool(stylestiloralist) # True of not empty
-
-    custominputprefixlist = csv_to_list("custom_input_prefix",antilist,"./userfiles/")
-    generatecustominputprefix = bool(custominputprefixlist) # True of not empty
-
-    custominputmidlist = csv_to_list("custom_input_mid",antilist,"./userfiles/")
-    generatecustominputmid = bool(custominputmidlist) # True of not empty
-
-    custominputsuffixlist = csv_to_list("custom_input_suffix",antilist,"./userfiles/")
-    generatecustominputsuffix = bool(custominputsuffixlist) # True of not empty
 
     customsubjectslist = csv_to_list("custom_subjects",antilist,"./userfiles/")
     customoutfitslist = csv_to_list("custom_outfits",antilist,"./userfiles/")
@@ -3931,6 +3994,45 @@ def createpromptvariant(prompt = "", insanitylevel = 5, antivalues = "" , gender
     imagetypemodelist = csv_to_list("imagetypemodes", antilist,"./csvfiles/special_lists/",0,"?")
     miniactivitylist = csv_to_list("miniactivity", antilist,"./csvfiles/special_lists/",0,"?")
 
+    allwildcardslistnohybrid = [ "-color-","-object-", "-animal-", "-fictional-","-nonfictional-","-building-","-vehicle-","-location-","-conceptprefix-","-food-","-haircolor-","-hairstyle-","-job-", "-accessory-", "-humanoid-", "-manwoman-", "-human-", "-colorscheme-", "-mood-", "-genderdescription-", "-artmovement-", "-malefemale-", "-bodytype-", "-minilocation-", "-minilocationaddition-", "-pose-", "-season-", "-minioutfit-", "-elaborateoutfit-", "-minivomit-", "-vomit-", "-rpgclass-", "-subjectfromfile-", "-outfitfromfile-", "-brand-", "-space-", "-artist-", "-imagetype-", "-othertype-", "-quality-", "-lighting-", "-camera-", "-lens-","-imagetypequality-", "-poemline-", "-songline-", "-greatwork-", "-fantasyartist-", "-popularartist-", "-romanticismartist-", "-photographyartist-", "-emoji-", "-timeperiod-", "-shotsize-", "-musicgenre-", "-animaladdition-", "-objectaddition-", "-humanaddition-", "-overalladdition-", "-focus-", "-direction-", "-styletilora-", "-manwomanrelation-", "-waterlocation-", "-container-", "-firstname-", "-flora-", "-print-", "-miniactivity-", "-pattern-", "-chair-", "-cardname-", "-covering-", "-outfitdescriptor-", "-hairdescriptor-", "-hairvomit-", "-humandescriptor-", "-manwomanmultiple-", "-facepart-", "-locationdescriptor-", "-basicbitchdescriptor-", "-animaldescriptor-", "-humanexpression-", "-humanvomit-", "-eyecolor-", "-fashiondesigner-", "-colorcombination-", "-materialcombination-", "-photoaddition-", "-age-", "-agecalculator-", "-gregmode-"
+                                ,"-portraitartist-", "-characterartist-" , "-landscapeartist-", "-scifiartist-", "-graphicdesignartist-", "-digitalartist-", "-architectartist-", "-cinemaartist-", "-setting-", "-charactertype-", "-objectstohold-", "-episodetitle-", "-allstylessuffix-", "-fluff-", "-event-", "-background-"
+                                , "-occult-", "-locationfantasy-", "-locationscifi-", "-locationvideogame-", "-locationbiome-", "-locationcity-", "-bird-", "-cat-", "-dog-", "-insect-", "-pokemon-", "-pokemontype-", "-marinelife-"]
+    allwildcardslistnohybridlists = [colorlist, objectlist, animallist, fictionallist, nonfictionallist, buildinglist, vehiclelist, locationlist,conceptprefixlist,foodlist,haircolorlist, hairstylelist,joblist, accessorielist, humanoidlist, manwomanlist, humanlist, colorschemelist, moodlist, genderdescriptionlist, artmovementlist, malefemalelist, bodytypelist, minilocationlist, minilocationadditionslist, poselist, seasonlist, minioutfitlist, elaborateoutfitlist, minivomitlist, vomitlist, rpgclasslist, customsubjectslist, customoutfitslist, brandlist, spacelist, artistlist, imagetypelist, othertypelist, qualitylist, lightinglist, cameralist, lenslist, imagetypequalitylist, poemlinelist, songlinelist, greatworklist, fantasyartistlist, popularartistlist, romanticismartistlist, photographyartistlist, emojilist, timeperiodlist, shotsizelist, musicgenrelist, animaladditionlist, objectadditionslist, humanadditionlist, overalladditionlist, focuslist, directionlist, stylestiloralist, manwomanrelationlist, waterlocationlist, containerlist, firstnamelist, floralist, printlist, miniactivitylist, patternlist, chairlist, cardnamelist, coveringlist, outfitdescriptorlist, hairdescriptorlist, hairvomitlist, humandescriptorlist, manwomanmultiplelist, facepartlist, locationdescriptorlist, basicbitchdescriptorlist, animaldescriptorlist, humanexpressionlist, humanvomitlist, eyecolorlist, fashiondesignerlist, colorcombinationlist, materialcombinationlist, photoadditionlist, agelist, agecalculatorlist, gregmodelist
+                                     , portraitartistlist, characterartistlist, landscapeartistlist, scifiartistlist, graphicdesignartistlist, digitalartistlist, architectartistlist, cinemaartistlist, settinglist, charactertypelist, objectstoholdlist, episodetitlelist, allstylessuffixlist, flufferlist, eventlist, backgroundlist
+                                     , occultlist, locationfantasylist, locationscifilist, locationvideogamelist, locationbiomelist, locationcitylist, birdlist, catlist, doglist, insectlist, pokemonlist, pokemontypelist, marinelifelist]
+    
+    allwildcardslistwithhybrid = ["-material-", "-descriptor-", "-outfit-", "-conceptsuffix-","-culture-", "-objecttotal-", "-outfitprinttotal-", "-element-"]
+    allwildcardslistwithhybridlists = [materiallist, descriptorlist,outfitlist,conceptsuffixlist,culturelist, objecttotallist, outfitprinttotallist, elementlist]
+    wildcardlists = dict(zip(allwildcardslistnohybrid, [(attachedlist, False) for attachedlist in allwildcardslistnohybridlists]))
+    wildcardlists.update(zip(allwildcardslistwithhybrid, [(attachedlist, True) for attachedlist in allwildcardslistwithhybridlists]))
+
+    matches = {}
+    for wildcard, chance in VARIANT_CHECKS:
+        for value in set(x.lower() for x in wildcardlists[wildcard][0]):
+            matches.setdefault(value, []).append((wildcard, chance))
+    matches = {value: tuple(valuematches) for value, valuematches in matches.items()}
+    return wildcardlists, matches
+
+def createpromptvariant(prompt = "", insanitylevel = 5, antivalues = "" , gender = "all", artists = "all", advancedprompting = True, seed = -1, rng=None):
+    return get_prompt_generator().create_variant(prompt=prompt, insanitylevel=insanitylevel, antivalues=antivalues, gender=gender, artists=artists, advancedprompting=advancedprompting, seed=seed, rng=rng)
+
+# creates an amount of variants of one prompt in one go, see PromptGenerator.create_variants
+def createpromptvariants(prompt = "", amount = 1, seed = -1, **params):
+    return get_prompt_generator().create_variants(prompt, amount, seed, **params)
+
+def _createpromptvariant(generator, prompt = "", insanitylevel = 5, antivalues = "" , gender = "all", artists = "all", advancedprompting = True, seed = -1, rng=None):
+    # same seed handling as build_dynamic_prompt
+    rng = get_rng(seed, rng)
+
+    # strip the prompt, for EVO in ruinedfooocus:
+    prompt = prompt.strip()
+
+    # first build up a complete anti list. Those values are removing during list building
+    # this uses the antivalues string AND the antilist.csv
+    antilist = generator.antilist(antivalues)
+
+    # all lists come ready from the generator
+    wildcardlists, matches = generator.variant_lists(antilist, gender, artists)
 
     prompt = prompt.replace(",", " , ")
     prompt = prompt.replace("(", " ( ")
@@ -3952,22 +4054,22 @@ def createpromptvariant(prompt = "", insanitylevel = 5, antivalues = "" , gender
 
     words = prompt.split()
     num_words = len(words)
-    if(num_words < 15 and common_dist(insanitylevel)):
+    if(num_words < 15 and common_dist(insanitylevel, rng)):
         # add some random words maybe?
-        if(common_dist(insanitylevel)):
+        if(common_dist(insanitylevel, rng)):
             
-            if(random.randint(0,1)== 0):
+            if(rng.randint(0,1)== 0):
                 prompt += basicenhance
             else:
                 prompt = basicenhance + prompt
-            if(common_dist(insanitylevel)):
+            if(common_dist(insanitylevel, rng)):
                 prompt += basicenhance
-            prompt = parse_custom_functions(prompt, insanitylevel)
+            prompt = parse_custom_functions(prompt, insanitylevel, rng=rng)
 
         # then add some enhanced words
-        amountofwords = random.randint(0,3)
+        amountofwords = rng.randint(0,3)
         if(amountofwords > 0):
-            enhance_positive_words = enhance_positive(prompt, amountofwords)
+            enhance_positive_words = enhance_positive(prompt, amountofwords, rng=rng)
             prompt += enhance_positive_words
 
 
@@ -3993,331 +4095,28 @@ def createpromptvariant(prompt = "", insanitylevel = 5, antivalues = "" , gender
                 lowercase_combination = combination.lower()
                 combination = " " + combination + " "
 
-               # some rare changes if needed
-                if lowercase_combination in [x.lower() for x in humanlist] and chance_roll(insanitylevel, "rare"):
-                    prompt = prompt.replace(combination," -human- ")
-
-                if lowercase_combination in [x.lower() for x in objecttotallist] and chance_roll(insanitylevel, "rare"):
-                    prompt = prompt.replace(combination," -objecttotal- ")
-                
-                if lowercase_combination in [x.lower() for x in artistlist] and chance_roll(insanitylevel, "rare"):
-                    prompt = prompt.replace(combination," -artist- ")
-                
-
-                if lowercase_combination in [x.lower() for x in colorlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -color- ")
-
-                if lowercase_combination in [x.lower() for x in animallist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -animal- ")
-                
-                if lowercase_combination in [x.lower() for x in objectlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -object- ")
-                            
-                if lowercase_combination in [x.lower() for x in fictionallist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -fictional- ")
-
-                
-                if lowercase_combination in [x.lower() for x in nonfictionallist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -nonfictional- ")
-
-                
-                #if lowercase_combination in [x.lower() for x in conceptsuffixlist] and chance_roll(insanitylevel, "uncommon"):
-                #   prompt = prompt.replace(combination," -conceptsuffix- ")
-
-                
-                if lowercase_combination in [x.lower() for x in buildinglist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -building- ")
-
-                
-                if lowercase_combination in [x.lower() for x in vehiclelist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -vehicle- ")
-
-                
-                if lowercase_combination in [x.lower() for x in outfitlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -outfit- ")
-
-                
-                if lowercase_combination in [x.lower() for x in locationlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -location- ")
-
-                if lowercase_combination in [x.lower() for x in backgroundlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -background- ")
-
-                
-                if lowercase_combination in [x.lower() for x in accessorielist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -accessory- ")
-
-                
-                if lowercase_combination in [x.lower() for x in artmovementlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -artmovement- ")
-
-                
-                if lowercase_combination in [x.lower() for x in bodytypelist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -bodytype- ")
-
-                
-                if lowercase_combination in [x.lower() for x in cameralist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -camera- ")
-
-                
-                if lowercase_combination in [x.lower() for x in colorschemelist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -colorscheme- ")
-
-                if lowercase_combination in [x.lower() for x in eyecolorlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -eyecolor- ")
-
-                if lowercase_combination in [x.lower() for x in fashiondesignerlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -fashiondesigner- ")
-
-                if lowercase_combination in [x.lower() for x in colorcombinationlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -colorcombination- ")
-
-                if lowercase_combination in [x.lower() for x in materialcombinationlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -materialcombination- ")
-
-                if lowercase_combination in [x.lower() for x in photoadditionlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -photoaddition- ")
-
-                if lowercase_combination in [x.lower() for x in agelist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -age- ")
-
-                if lowercase_combination in [x.lower() for x in agecalculatorlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -agecalculator- ")
-
-                if lowercase_combination in [x.lower() for x in gregmodelist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -gregmode- ")
-
-                if lowercase_combination in [x.lower() for x in elementlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -element- ")
-
-                if lowercase_combination in [x.lower() for x in settinglist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -setting- ")
-                
-                if lowercase_combination in [x.lower() for x in charactertypelist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -charactertype- ")
-                if lowercase_combination in [x.lower() for x in objectstoholdlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -objectstohold- ")
-                if lowercase_combination in [x.lower() for x in episodetitlelist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -episodetitle- ")
-                
-                if lowercase_combination in [x.lower() for x in flufferlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -fluff- ")
-
-                if lowercase_combination in [x.lower() for x in occultlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -occult- ")
-                if lowercase_combination in [x.lower() for x in locationfantasylist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -locationfantasy- ")
-                if lowercase_combination in [x.lower() for x in locationscifilist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -locationscifi- ")
-                if lowercase_combination in [x.lower() for x in locationvideogamelist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -locationvideogame- ")
-                if lowercase_combination in [x.lower() for x in locationbiomelist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -locationbiome- ")
-                if lowercase_combination in [x.lower() for x in locationcitylist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -locationcity- ")
-
-                if lowercase_combination in [x.lower() for x in birdlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -bird- ")              
-                if lowercase_combination in [x.lower() for x in catlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -cat- ")
-                if lowercase_combination in [x.lower() for x in doglist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -dog- ")
-                if lowercase_combination in [x.lower() for x in insectlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -insect- ")
-                if lowercase_combination in [x.lower() for x in pokemonlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -pokemon- ")
-                if lowercase_combination in [x.lower() for x in marinelifelist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -marinelife- ")
-
-                if lowercase_combination in [x.lower() for x in pokemontypelist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -pokemontype- ")
-                
-                #if lowercase_combination in [x.lower() for x in conceptprefixlist] and chance_roll(insanitylevel, "uncommon"):
-                #    prompt = prompt.replace(combination," -conceptprefix- ")
-
-                
-                if lowercase_combination in [x.lower() for x in culturelist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -culture- ")
-
-                
-                if lowercase_combination in [x.lower() for x in descriptorlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -descriptor- ")
-
-                if lowercase_combination in [x.lower() for x in outfitdescriptorlist] and chance_roll(insanitylevel, "rare"):
-                    prompt = prompt.replace(combination," -outfitdescriptor- ")
-                if lowercase_combination in [x.lower() for x in hairdescriptorlist] and chance_roll(insanitylevel, "rare"):
-                    prompt = prompt.replace(combination," -hairdescriptor- ")
-                if lowercase_combination in [x.lower() for x in hairvomitlist] and chance_roll(insanitylevel, "rare"):
-                    prompt = prompt.replace(combination," -hairvomit- ")
-                if lowercase_combination in [x.lower() for x in humandescriptorlist] and chance_roll(insanitylevel, "rare"):
-                    prompt = prompt.replace(combination," -humandescriptor- ")
-                if lowercase_combination in [x.lower() for x in locationdescriptorlist] and chance_roll(insanitylevel, "rare"):
-                    prompt = prompt.replace(combination," -locationdescriptor- ")
-                if lowercase_combination in [x.lower() for x in basicbitchdescriptorlist] and chance_roll(insanitylevel, "rare"):
-                    prompt = prompt.replace(combination," -basicbitchdescriptor- ")
-                if lowercase_combination in [x.lower() for x in animaldescriptorlist] and chance_roll(insanitylevel, "rare"):
-                    prompt = prompt.replace(combination," -animaldescriptor- ")
-
-                if lowercase_combination in [x.lower() for x in directionlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -direction- ")
-
-                if lowercase_combination in [x.lower() for x in emojilist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -emoji- ")
-
-                if lowercase_combination in [x.lower() for x in humanexpressionlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -humanexpression- ")
-                if lowercase_combination in [x.lower() for x in humanvomitlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -humanvomit- ")
-                
-                if lowercase_combination in [x.lower() for x in eventlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -event- ")
-
-                if lowercase_combination in [x.lower() for x in focuslist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -focus- ")
-
-                if lowercase_combination in [x.lower() for x in greatworklist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -greatwork- ")
-
-                if lowercase_combination in [x.lower() for x in haircolorlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -haircolor- ")
-
-                if lowercase_combination in [x.lower() for x in hairstylelist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -hairstyle- ")
-
-                if lowercase_combination in [x.lower() for x in directionlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -direction- ")
-
-                if lowercase_combination in [x.lower() for x in humanoidlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -humanoid- ")
-
-                if lowercase_combination in [x.lower() for x in joblist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -job- ")
-
-                if lowercase_combination in [x.lower() for x in lenslist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -lens- ")
-                if lowercase_combination in [x.lower() for x in lightinglist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -lighting- ")
-                if lowercase_combination in [x.lower() for x in malefemalelist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -malefemale- ")
-                if lowercase_combination in [x.lower() for x in manwomanlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -manwoman- ")
-                if lowercase_combination in [x.lower() for x in moodlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -mood- ")
-                if lowercase_combination in [x.lower() for x in othertypelist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -othertype- ")
-                if lowercase_combination in [x.lower() for x in poselist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -pose- ")
-                if lowercase_combination in [x.lower() for x in qualitylist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -quality- ")
-                if lowercase_combination in [x.lower() for x in shotsizelist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -shotsize- ")
-                if lowercase_combination in [x.lower() for x in timeperiodlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -timeperiod- ")
-                if lowercase_combination in [x.lower() for x in vomitlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -vomit- ")
-                if lowercase_combination in [x.lower() for x in foodlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -food- ")
-                if lowercase_combination in [x.lower() for x in genderdescriptionlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -genderdescription- ")
-                if lowercase_combination in [x.lower() for x in minilocationlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -minilocation- ")
-                if lowercase_combination in [x.lower() for x in minioutfitlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -minioutfit- ")
-                if lowercase_combination in [x.lower() for x in lenslist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -lens- ")
-                if lowercase_combination in [x.lower() for x in seasonlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -season- ")
-                if lowercase_combination in [x.lower() for x in imagetypequalitylist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -imagetypequality- ")
-                if lowercase_combination in [x.lower() for x in rpgclasslist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -rpgclass- ")
-                if lowercase_combination in [x.lower() for x in brandlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -brand- ")
-                if lowercase_combination in [x.lower() for x in spacelist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -space- ")
-                if lowercase_combination in [x.lower() for x in poemlinelist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -poemline- ")
-                if lowercase_combination in [x.lower() for x in songlinelist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -songline- ")
-                if lowercase_combination in [x.lower() for x in musicgenrelist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -musicgenre- ")
-                if lowercase_combination in [x.lower() for x in manwomanrelationlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -manwomanrelation- ")
-                if lowercase_combination in [x.lower() for x in manwomanmultiplelist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -manwomanmultiple- ")
-                if lowercase_combination in [x.lower() for x in waterlocationlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -waterlocation- ")
-                if lowercase_combination in [x.lower() for x in containerlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -container- ")
-                if lowercase_combination in [x.lower() for x in firstnamelist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -firstname- ")
-                if lowercase_combination in [x.lower() for x in floralist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -flora- ")
-                if lowercase_combination in [x.lower() for x in printlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -print- ")
-                if lowercase_combination in [x.lower() for x in miniactivitylist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -miniactivity- ")
-                if lowercase_combination in [x.lower() for x in patternlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -pattern- ")
-                if lowercase_combination in [x.lower() for x in chairlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -chair- ")
-                if lowercase_combination in [x.lower() for x in cardnamelist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -cardname- ")
-                if lowercase_combination in [x.lower() for x in coveringlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -covering- ")
-                if lowercase_combination in [x.lower() for x in facepartlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -facepart- ")
-
-
-                if lowercase_combination in [x.lower() for x in fantasyartistlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -fantasyartist- ")
-                if lowercase_combination in [x.lower() for x in popularartistlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -popularartist- ")
-                if lowercase_combination in [x.lower() for x in romanticismartistlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -romanticismartist- ")
-                if lowercase_combination in [x.lower() for x in photographyartistlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -photographyartist- ")
-                if lowercase_combination in [x.lower() for x in portraitartistlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -portraitartist- ")
-                if lowercase_combination in [x.lower() for x in characterartistlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -characterartist- ")
-                if lowercase_combination in [x.lower() for x in landscapeartistlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -landscapeartist- ")
-                if lowercase_combination in [x.lower() for x in scifiartistlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -scifiartist- ")
-                if lowercase_combination in [x.lower() for x in graphicdesignartistlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -graphicdesignartist- ")
-                if lowercase_combination in [x.lower() for x in architectartistlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -architectartist- ")
-                if lowercase_combination in [x.lower() for x in cinemaartistlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -cinemaartist- ")
-
-
-                if lowercase_combination in [x.lower() for x in stylestiloralist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -styletilora- ")
-                if lowercase_combination in [x.lower() for x in waterlocationlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -waterlocation- ")
-
-                if lowercase_combination in [x.lower() for x in allstylessuffixlist] and chance_roll(insanitylevel, "uncommon"):
-                    prompt = prompt.replace(combination," -allstylessuffix- ")
+                # every list this combination is in, gets a roll to turn it into its wildcard
+                for wildcard, chance in matches.get(lowercase_combination, ()):
+                    if(chance_roll(insanitylevel, chance, rng)):
+                        prompt = prompt.replace(combination," " + wildcard + " ")
 
             runs += 1
     
     # If nothing changed...  Lets do at least something
     if(prompt.lower().strip() == originaloriginalprompt.lower().strip()):
-        if(random.randint(0,1)==0):
+        if(rng.randint(0,1)==0):
             prompt += basicenhance
         else:
             prompt = basicenhance + ", " + prompt
 
-        if(chance_roll(insanitylevel, "common")):
+        if(chance_roll(insanitylevel, "common", rng)):
             prompt += basicenhance
 
-        if(chance_roll(insanitylevel, "common")):
-            enhance_positive_words = enhance_positive(prompt, 1)
+        if(chance_roll(insanitylevel, "common", rng)):
+            enhance_positive_words = enhance_positive(prompt, 1, rng=rng)
             prompt += enhance_positive_words
 
-        prompt = parse_custom_functions(prompt, insanitylevel)
+        prompt = parse_custom_functions(prompt, insanitylevel, rng=rng)
 
 
     prompt = prompt.replace(" :", ":")
@@ -4326,158 +4125,7 @@ def createpromptvariant(prompt = "", insanitylevel = 5, antivalues = "" , gender
     completeprompt = prompt
 
 
-    while (
-        "-color-" in completeprompt or
-        "-material-" in completeprompt or
-        "-animal-" in completeprompt or
-        "-object-" in completeprompt or
-        "-fictional-" in completeprompt or
-        "-nonfictional-" in completeprompt or
-        "-conceptsuffix-" in completeprompt or
-        "-building-" in completeprompt or
-        "-vehicle-" in completeprompt or
-        "-outfit-" in completeprompt or
-        "-location-" in completeprompt or
-        "-conceptprefix-" in completeprompt or
-        "-descriptor-" in completeprompt or
-        "-food-" in completeprompt or
-        "-haircolor-" in completeprompt or
-        "-hairstyle-" in completeprompt or
-        "-job-" in completeprompt or
-        "-culture-" in completeprompt or
-        "-accessory-" in completeprompt or
-        "-humanoid-" in completeprompt or
-        "-manwoman-" in completeprompt or
-        "-human-" in completeprompt or
-        "-colorscheme-" in completeprompt or
-        "-mood-" in completeprompt or
-        "-genderdescription-" in completeprompt or
-        "-artmovement-" in completeprompt or
-        "-malefemale-" in completeprompt or
-        "-objecttotal-" in completeprompt or
-        "-outfitprinttotal-" in completeprompt or
-        "-bodytype-" in completeprompt or
-        "-minilocation-" in completeprompt or
-        "-minilocationaddition-" in completeprompt or
-        "-pose-" in completeprompt or
-        "-season-" in completeprompt or
-        "-minioutfit-" in completeprompt or
-        "-elaborateoutfit-" in completeprompt or
-        "-minivomit-" in completeprompt or
-        "-vomit-" in completeprompt or
-        "-rpgclass-" in completeprompt or
-        "-subjectfromfile-" in completeprompt or
-        "-outfitfromfile-" in completeprompt or
-        "-brand-" in completeprompt or
-        "-space-" in completeprompt or
-        "-artist-" in completeprompt or
-        "-imagetype-" in completeprompt or
-        "-othertype-" in completeprompt or
-        "-quality-" in completeprompt or
-        "-lighting-" in completeprompt or
-        "-camera-" in completeprompt or
-        "-lens-" in completeprompt or
-        "-imagetypequality-" in completeprompt or
-        "-poemline-" in completeprompt or
-        "-songline-" in completeprompt or
-        "-greatwork-" in completeprompt or
-        "-fantasyartist-" in completeprompt or 
-        "-popularartist-" in completeprompt or 
-        "-romanticismartist-" in completeprompt or 
-        "-photographyartist-" in completeprompt or
-        "-emoji-" in completeprompt or
-        "-timeperiod-" in completeprompt or
-        "-shotsize-" in completeprompt or
-        "-musicgenre-" in completeprompt or
-        "-animaladdition-" in completeprompt or
-        "-objectaddition-" in completeprompt or
-        "-humanaddition-" in completeprompt or
-        "-overalladdition-" in completeprompt or
-        "-focus-" in completeprompt or
-        "-direction-" in completeprompt or
-        "-styletilora-" in completeprompt or
-        "-manwomanrelation-" in completeprompt or
-        "-manwomanmultiple-" in completeprompt or
-        "-waterlocation-" in completeprompt or
-        "-container-" in completeprompt or
-        "-firstname-" in completeprompt or
-        "-flora-" in completeprompt or
-        "-print-" in completeprompt or
-        "-miniactivity-" in completeprompt or
-        "-pattern-" in completeprompt or
-        "-chair-" in completeprompt or
-        "-cardname-" in completeprompt or
-        "-covering-" in completeprompt or
-        "-outfitdescriptor-" in completeprompt or
-        "-hairdescriptor-" in completeprompt or
-        "-hairvomit-" in completeprompt or
-        "-humandescriptor-" in completeprompt or
-        "-facepart-" in completeprompt or
-        "-locationdescriptor-" in completeprompt or
-        "-basicbitchdescriptor-" in completeprompt or
-        "-animaldescriptor-" in completeprompt or
-        "-humanexpression-" in completeprompt or
-        "-humanvomit-" in completeprompt or
-        "-eyecolor-" in completeprompt or
-        "-fashiondesigner-" in completeprompt or
-        "-colorcombination-" in completeprompt or
-        "-materialcombination-" in completeprompt or
-        "-photoaddition-" in completeprompt or
-        "-age-" in completeprompt or
-        "-agecalculator-" in completeprompt or
-        "-gregmode-" in completeprompt or
-        "-portraitartist-" in completeprompt or
-        "-characterartist-" in completeprompt or
-        "-landscapeartist-" in completeprompt or
-        "-scifiartist-" in completeprompt or
-        "-graphicdesignartist-" in completeprompt or
-        "-digitalartist-" in completeprompt or
-        "-architectartist-" in completeprompt or
-        "-cinemaartist-" in completeprompt or
-        "-element-" in completeprompt or
-        "-setting-" in completeprompt or
-        "-charactertype-" in completeprompt or
-        "-objectstohold-" in completeprompt or
-        "-episodetitle-" in completeprompt or
-        "-allstylessuffix-" in completeprompt or
-        "-fluff-" in completeprompt or
-        "-event-" in completeprompt or
-        "-background-" in completeprompt or
-        "-occult-" in completeprompt or
-        "-locationfantasy-" in completeprompt or
-        "-locationscifi-" in completeprompt or
-        "-locationvideogame-" in completeprompt or
-        "-locationbiome-" in completeprompt or
-        "-locationcity-" in completeprompt or
-         "-bird-" in completeprompt or
-        "-cat-" in completeprompt or
-        "-dog-" in completeprompt or
-        "-insect-" in completeprompt or
-        "-pokemon-" in completeprompt or
-        "-pokemontype-" in completeprompt or
-        "-marinelife-" in completeprompt
-        ):
-            allwildcardslistnohybrid = [ "-color-","-object-", "-animal-", "-fictional-","-nonfictional-","-building-","-vehicle-","-location-","-conceptprefix-","-food-","-haircolor-","-hairstyle-","-job-", "-accessory-", "-humanoid-", "-manwoman-", "-human-", "-colorscheme-", "-mood-", "-genderdescription-", "-artmovement-", "-malefemale-", "-bodytype-", "-minilocation-", "-minilocationaddition-", "-pose-", "-season-", "-minioutfit-", "-elaborateoutfit-", "-minivomit-", "-vomit-", "-rpgclass-", "-subjectfromfile-", "-outfitfromfile-", "-brand-", "-space-", "-artist-", "-imagetype-", "-othertype-", "-quality-", "-lighting-", "-camera-", "-lens-","-imagetypequality-", "-poemline-", "-songline-", "-greatwork-", "-fantasyartist-", "-popularartist-", "-romanticismartist-", "-photographyartist-", "-emoji-", "-timeperiod-", "-shotsize-", "-musicgenre-", "-animaladdition-", "-objectaddition-", "-humanaddition-", "-overalladdition-", "-focus-", "-direction-", "-styletilora-", "-manwomanrelation-", "-waterlocation-", "-container-", "-firstname-", "-flora-", "-print-", "-miniactivity-", "-pattern-", "-chair-", "-cardname-", "-covering-", "-outfitdescriptor-", "-hairdescriptor-", "-hairvomit-", "-humandescriptor-", "-manwomanmultiple-", "-facepart-", "-locationdescriptor-", "-basicbitchdescriptor-", "-animaldescriptor-", "-humanexpression-", "-humanvomit-", "-eyecolor-", "-fashiondesigner-", "-colorcombination-", "-materialcombination-", "-photoaddition-", "-age-", "-agecalculator-", "-gregmode-"
-                                        ,"-portraitartist-", "-characterartist-" , "-landscapeartist-", "-scifiartist-", "-graphicdesignartist-", "-digitalartist-", "-architectartist-", "-cinemaartist-", "-setting-", "-charactertype-", "-objectstohold-", "-episodetitle-", "-allstylessuffix-", "-fluff-", "-event-", "-background-"
-                                        , "-occult-", "-locationfantasy-", "-locationscifi-", "-locationvideogame-", "-locationbiome-", "-locationcity-", "-bird-", "-cat-", "-dog-", "-insect-", "-pokemon-", "-pokemontype-", "-marinelife-"]
-            allwildcardslistnohybridlists = [colorlist, objectlist, animallist, fictionallist, nonfictionallist, buildinglist, vehiclelist, locationlist,conceptprefixlist,foodlist,haircolorlist, hairstylelist,joblist, accessorielist, humanoidlist, manwomanlist, humanlist, colorschemelist, moodlist, genderdescriptionlist, artmovementlist, malefemalelist, bodytypelist, minilocationlist, minilocationadditionslist, poselist, seasonlist, minioutfitlist, elaborateoutfitlist, minivomitlist, vomitlist, rpgclasslist, customsubjectslist, customoutfitslist, brandlist, spacelist, artistlist, imagetypelist, othertypelist, qualitylist, lightinglist, cameralist, lenslist, imagetypequalitylist, poemlinelist, songlinelist, greatworklist, fantasyartistlist, popularartistlist, romanticismartistlist, photographyartistlist, emojilist, timeperiodlist, shotsizelist, musicgenrelist, animaladditionlist, objectadditionslist, humanadditionlist, overalladditionlist, focuslist, directionlist, stylestiloralist, manwomanrelationlist, waterlocationlist, containerlist, firstnamelist, floralist, printlist, miniactivitylist, patternlist, chairlist, cardnamelist, coveringlist, outfitdescriptorlist, hairdescriptorlist, hairvomitlist, humandescriptorlist, manwomanmultiplelist, facepartlist, locationdescriptorlist, basicbitchdescriptorlist, animaldescriptorlist, humanexpressionlist, humanvomitlist, eyecolorlist, fashiondesignerlist, colorcombinationlist, materialcombinationlist, photoadditionlist, agelist, agecalculatorlist, gregmodelist
-                                             , portraitartistlist, characterartistlist, landscapeartistlist, scifiartistlist, graphicdesignartistlist, digitalartistlist, architectartistlist, cinemaartistlist, settinglist, charactertypelist, objectstoholdlist, episodetitlelist, allstylessuffixlist, flufferlist, eventlist, backgroundlist
-                                             , occultlist, locationfantasylist, locationscifilist, locationvideogamelist, locationbiomelist, locationcitylist, birdlist, catlist, doglist, insectlist, pokemonlist, pokemontypelist, marinelifelist]
-            
-            allwildcardslistwithhybrid = ["-material-", "-descriptor-", "-outfit-", "-conceptsuffix-","-culture-", "-objecttotal-", "-outfitprinttotal-", "-element-"]
-            allwildcardslistwithhybridlists = [materiallist, descriptorlist,outfitlist,conceptsuffixlist,culturelist, objecttotallist, outfitprinttotallist, elementlist]
-            
-            
-            #  keywordsinstring = any(word.lower() in givensubject.lower() for word in keywordslist)
-            for wildcard in allwildcardslistnohybrid:
-                attachedlist = allwildcardslistnohybridlists[allwildcardslistnohybrid.index(wildcard)]
-                completeprompt = replacewildcard(completeprompt, insanitylevel, wildcard, attachedlist,False, advancedprompting)
-
-
-            
-            for wildcard in allwildcardslistwithhybrid:
-                attachedlist = allwildcardslistwithhybridlists[allwildcardslistwithhybrid.index(wildcard)]
-                completeprompt = replacewildcard(completeprompt, insanitylevel, wildcard, attachedlist,True, advancedprompting)
+    completeprompt = expand_wildcards(completeprompt, wildcardlists, insanitylevel, advancedprompting, rng=rng)
 
 
         
@@ -4490,38 +4138,140 @@ def createpromptvariant(prompt = "", insanitylevel = 5, antivalues = "" , gender
 
     return completeprompt
 
+# finds every -wildcard- in a prompt, also when they are written against each other
+wildcardpattern = re.compile(r'(?=(-[a-z]+-))')
+
+# the wildcards that replacing another wildcard looks for, they are split out of the prompt as well
+OVERRIDE_WILDCARDS = ["-artiststyle-", "-artistmedium-", "-artistdescription-", "-sameoutfit-", "-samehumansubject-", "-sameothersubject-"]
+
+# A prompt split once into text and the wildcards in it, every wildcard is a part of its own.
+# Replacing a wildcard only splits the value that goes in, the rest of the prompt isn't scanned or rebuilt again.
+# The prompt is put back together once, with text(). The methods work like the ones of str.
+class WildcardPrompt:
+    def __init__(self, text, wildcards):
+        # wildcards: what to split out, anything else that looks like a wildcard stays text
+        self.wildcards = wildcards
+        self.counts = collections.Counter()
+        self.parts = self.split(text)
+
+    def split(self, text):
+        parts = []
+        start = 0
+        for match in wildcardpattern.finditer(text):
+            wildcard = match.group(1)
+            # when two of them share a -, like -a-b-, the first one wins
+            if(match.start() >= start and wildcard in self.wildcards):
+                if(match.start() > start):
+                    parts.append(text[start:match.start()])
+                parts.append(wildcard)
+                self.counts[wildcard] += 1
+                start = match.start() + len(wildcard)
+        if(start < len(text)):
+            parts.append(text[start:])
+        return parts
+
+    def __contains__(self, wildcard):
+        return self.counts[wildcard] > 0
+
+    def index(self, wildcard):
+        # only to compare with the index of another wildcard
+        return self.parts.index(wildcard)
+
+    def replace(self, wildcard, value, count=-1):
+        if(count < 0):
+            parts = []
+            for part in self.parts:
+                if(part == wildcard):
+                    self.counts[wildcard] -= 1
+                    parts += self.split(value)
+                else:
+                    parts.append(part)
+            self.parts = parts
+            return
+        while(count > 0 and self.counts[wildcard] > 0):
+            position = self.parts.index(wildcard)
+            self.parts[position:position + 1] = self.split(value)
+            self.counts[wildcard] -= 1
+            count -= 1
+
+    def text(self):
+        return "".join(self.parts)
+
+# expands the wildcards of wildcardlists, a dict of wildcard: (list, activatehybridorswap) in the order they get replaced
+# Same result as going through all of them with replacewildcard until none are left,
+# but the prompt is split into its wildcards once, and only the values that go in are split after that
+def expand_wildcards(completeprompt, wildcardlists, insanitylevel, advancedprompting, artiststyleselector = "", rng=random):
+    wildcards = list(wildcardlists)
+    order = {wildcard: position for position, wildcard in enumerate(wildcards)}
+    prompt = WildcardPrompt(completeprompt, set(wildcards).union(OVERRIDE_WILDCARDS))
+    # one deck per list, so a value isn't drawn twice in the same prompt
+    decks = {}
+    position = 0
+    while(True):
+        # replacements can bring in new wildcards, so look at what is left every time
+        found = [order[wildcard] for wildcard, count in prompt.counts.items() if count > 0 and wildcard in order]
+        if(not found):
+            break
+        # next wildcard in line, or start a new round if the rest is done
+        nextpositions = [foundposition for foundposition in found if foundposition >= position]
+        if(not nextpositions):
+            position = 0
+            continue
+        position = min(nextpositions)
+        wildcard = wildcards[position]
+        attachedlist, activatehybridorswap = wildcardlists[wildcard]
+        if(id(attachedlist) not in decks):
+            decks[id(attachedlist)] = Deck(attachedlist, rng)
+        _replace_wildcard(prompt, insanitylevel, wildcard, decks[id(attachedlist)], activatehybridorswap, advancedprompting, artiststyleselector, rng=rng)
+        position += 1
+
+    return prompt.text()
+
     # function
-def replacewildcard(completeprompt, insanitylevel, wildcard,listname, activatehybridorswap, advancedprompting, artiststyleselector = ""):
+def replacewildcard(completeprompt, insanitylevel, wildcard,listname, activatehybridorswap, advancedprompting, artiststyleselector = "", rng=random):
+
+    # nothing to do, and this way lists of wildcards that aren't used don't get loaded
+    if(wildcard not in completeprompt):
+        return completeprompt
+
+    prompt = WildcardPrompt(completeprompt, set([wildcard] + OVERRIDE_WILDCARDS))
+    _replace_wildcard(prompt, insanitylevel, wildcard, listname, activatehybridorswap, advancedprompting, artiststyleselector, rng=rng)
+    return prompt.text()
+
+# replaces every wildcard of one kind in a WildcardPrompt
+def _replace_wildcard(prompt, insanitylevel, wildcard, listname, activatehybridorswap, advancedprompting, artiststyleselector = "", rng=random):
+
+    # values are drawn from a deck, so the list itself is left alone
+    if(not isinstance(listname, Deck)):
+        listname = Deck(listname, rng)
 
     if(len(listname) == 0):
         # handling empty lists
-        completeprompt = completeprompt.replace(wildcard, "",1)
+        prompt.replace(wildcard, "", 1)
     else:
 
-        while wildcard in completeprompt:
-            if(unique_dist(insanitylevel) and activatehybridorswap == True and len(listname)>2 and advancedprompting==True):
+        while wildcard in prompt:
+            if(unique_dist(insanitylevel, rng) and activatehybridorswap == True and len(listname)>2 and advancedprompting==True):
                 hybridorswaplist = ["hybrid", "swap"]
-                hybridorswap = random.choice(hybridorswaplist)
-                replacementvalue = random.choice(listname)
-                listname.remove(replacementvalue)
+                hybridorswap = rng.choice(hybridorswaplist)
+                replacementvalue = listname.draw()
                 hybridorswapreplacementvalue = "[" + replacementvalue
                 
                 if(hybridorswap == "hybrid"):
-                        replacementvalue = random.choice(listname)
-                        listname.remove(replacementvalue)
+                        replacementvalue = listname.draw()
                         hybridorswapreplacementvalue += "|" + replacementvalue + "] "
                 if(hybridorswap == "swap"):
-                        replacementvalue = random.choice(listname)
-                        listname.remove(replacementvalue)
-                        hybridorswapreplacementvalue += ":" + replacementvalue + ":" + str(random.randint(1,20)) +  "] "
+                        replacementvalue = listname.draw()
+                        hybridorswapreplacementvalue += ":" + replacementvalue + ":" + str(rng.randint(1,20)) +  "] "
                 
-                completeprompt = completeprompt.replace(wildcard, hybridorswapreplacementvalue,1)
+                prompt.replace(wildcard, hybridorswapreplacementvalue, 1)
 
             #if list is not empty
             if(bool(listname)):
-                replacementvalue = random.choice(listname)
-                if(wildcard not in ["-heshe-", "-himher-","-hisher-"]):
-                    listname.remove(replacementvalue)
+                if(wildcard in ["-heshe-", "-himher-","-hisher-"]):
+                    replacementvalue = listname.choice()
+                else:
+                    replacementvalue = listname.draw()
 
 
                 
@@ -4529,7 +4279,7 @@ def replacewildcard(completeprompt, insanitylevel, wildcard,listname, activatehy
                 replacementvalue = ""
 
             # override for artist and artiststyle, only for first artist
-            if(wildcard == "-artist-" and ("-artiststyle-" in completeprompt or "-artistmedium-" in completeprompt or "-artistdescription-" in completeprompt)):
+            if(wildcard == "-artist-" and ("-artiststyle-" in prompt or "-artistmedium-" in prompt or "-artistdescription-" in prompt)):
                 artiststyles = []
                 artiststyle = []
                 chosenartiststyle = ""
@@ -4550,23 +4300,23 @@ def replacewildcard(completeprompt, insanitylevel, wildcard,listname, activatehy
 
                 # keep on looping until we have no more wildcards or no more styles to choose from
                 # leftovers will be removed in the cleaning step
-                while bool(artiststyle) and "-artiststyle-" in completeprompt:
+                while bool(artiststyle) and "-artiststyle-" in prompt:
                 
-                    chosenartiststyle = random.choice(artiststyle)
-                    completeprompt = completeprompt.replace("-artiststyle-",chosenartiststyle ,1)
+                    chosenartiststyle = rng.choice(artiststyle)
+                    prompt.replace("-artiststyle-", chosenartiststyle, 1)
                     artiststyle.remove(chosenartiststyle)
 
-                if("-artistmedium-" in completeprompt):
-                    if(artistmediums[0].lower() not in completeprompt.lower()):
-                        completeprompt = completeprompt.replace("-artistmedium-",artistmediums[0] ,1)
+                if("-artistmedium-" in prompt):
+                    if(artistmediums[0].lower() not in prompt.text().lower()):
+                        prompt.replace("-artistmedium-", artistmediums[0], 1)
 
-                if("-artistdescription-" in completeprompt):
-                    completeprompt = completeprompt.replace("-artistdescription-",artistdescriptions[0] ,1)
+                if("-artistdescription-" in prompt):
+                    prompt.replace("-artistdescription-", artistdescriptions[0], 1)
                 
-                while bool(artiststyle) and "-artiststyle-" in completeprompt:
+                while bool(artiststyle) and "-artiststyle-" in prompt:
                 
-                    chosenartiststyle = random.choice(artiststyle)
-                    completeprompt = completeprompt.replace("-artiststyle-",chosenartiststyle ,1)
+                    chosenartiststyle = rng.choice(artiststyle)
+                    prompt.replace("-artiststyle-", chosenartiststyle, 1)
                     artiststyle.remove(chosenartiststyle)
 
             
@@ -4574,7 +4324,7 @@ def replacewildcard(completeprompt, insanitylevel, wildcard,listname, activatehy
             # Sneaky overrides for "same" wildcards
             # Are overwritten with their first parent
             if(wildcard == "-outfit-" or wildcard == "-minioutfit-"):
-                completeprompt = completeprompt.replace("-sameoutfit-", replacementvalue,1)
+                prompt.replace("-sameoutfit-", replacementvalue, 1)
 
             # Why do it in this detail?? Because we can:
             # Check if "from" exists in the string. For example Chun Li from Streetfighter, becomes Chun li
@@ -4592,31 +4342,31 @@ def replacewildcard(completeprompt, insanitylevel, wildcard,listname, activatehy
                             , "-manwoman-"                            
                             , "-manwomanrelation-"
                             , "-manwomanmultiple-"]
-                            and "-samehumansubject-" in completeprompt):
-                            if(completeprompt.index(wildcard) < completeprompt.index("-samehumansubject-")):
-                                completeprompt = completeprompt.replace("-samehumansubject-", "the " + replacementvalueforoverrides)
+                            and "-samehumansubject-" in prompt):
+                            if(prompt.index(wildcard) < prompt.index("-samehumansubject-")):
+                                prompt.replace("-samehumansubject-", "the " + replacementvalueforoverrides)
             
             if(wildcard in ["-fictional-"
                             , "-nonfictional-"
                             , "-firstname-"
                             , "-oppositefictional-"
                             , "-oppositenonfictional-"]
-                            and "-samehumansubject-" in completeprompt):
-                            if(completeprompt.index(wildcard) < completeprompt.index("-samehumansubject-")):
-                                completeprompt = completeprompt.replace("-samehumansubject-", replacementvalueforoverrides)
+                            and "-samehumansubject-" in prompt):
+                            if(prompt.index(wildcard) < prompt.index("-samehumansubject-")):
+                                prompt.replace("-samehumansubject-", replacementvalueforoverrides)
             
             # job is here, to prevent issue with a job outfit being replace. So doing it later solves that issue
             if(wildcard in ["-job-"]
-                            and "-samehumansubject-" in completeprompt):
-                            if(completeprompt.index(wildcard) < completeprompt.index("-samehumansubject-")):
-                                completeprompt = completeprompt.replace("-samehumansubject-", "the " + replacementvalueforoverrides)
+                            and "-samehumansubject-" in prompt):
+                            if(prompt.index(wildcard) < prompt.index("-samehumansubject-")):
+                                prompt.replace("-samehumansubject-", "the " + replacementvalueforoverrides)
             
             
             # This one last, since then it is the only subject we have left
             if(wildcard in ["-malefemale-"]
-               and "-samehumansubject-" in completeprompt):
-               if(completeprompt.index(wildcard) < completeprompt.index("-samehumansubject-")):
-                    completeprompt = completeprompt.replace("-samehumansubject-", "the " + replacementvalueforoverrides)
+               and "-samehumansubject-" in prompt):
+               if(prompt.index(wildcard) < prompt.index("-samehumansubject-")):
+                    prompt.replace("-samehumansubject-", "the " + replacementvalueforoverrides)
 
             if(wildcard in ["-animal-"                         
                             , "-object-"
@@ -4627,24 +4377,21 @@ def replacewildcard(completeprompt, insanitylevel, wildcard,listname, activatehy
                             , "-flora-"
                             , "-location-"
                             , "-building-"]
-                        and "-sameothersubject-" in completeprompt):
-                if(completeprompt.index(wildcard) < completeprompt.index("-sameothersubject-")):
-                            completeprompt = completeprompt.replace("-sameothersubject-", "the " + replacementvalueforoverrides)
+                        and "-sameothersubject-" in prompt):
+                if(prompt.index(wildcard) < prompt.index("-sameothersubject-")):
+                            prompt.replace("-sameothersubject-", "the " + replacementvalueforoverrides)
 
 
 
-            completeprompt = completeprompt.replace(wildcard, replacementvalue,1)
+            prompt.replace(wildcard, replacementvalue, 1)
             
             
 
 
-    return completeprompt
 
-def build_dynamic_negative(positive_prompt = "", insanitylevel = 0, enhance = False, existing_negative_prompt = "", base_model="SD1.5"):
+def build_dynamic_negative(positive_prompt = "", insanitylevel = 0, enhance = False, existing_negative_prompt = "", base_model="SD1.5", rng=random):
 
 
-    negative_primer = []
-    negative_result = []
     all_negative_words_list = []
     remove_weights = False
 
@@ -4658,36 +4405,18 @@ def build_dynamic_negative(positive_prompt = "", insanitylevel = 0, enhance = Fa
     if base_model == "Stable Cascade":
         remove_weights = True
     
-    # negavite_primer, all words that should trigger a negative result
-    # the negative words to put in the negative prompt
-    negative_primer, negative_result = load_negative_list()
+    # the primer words that should trigger a negative result, and the negative words to put in the negative prompt
+    negativewordtable = get_negative_word_table()
 
     # do a trick for artists, replace with their tags instead
-    artistlist, categorylist = load_all_artist_and_category()
-    # lower them
-    artist_names = [artist.strip().lower() for artist in artistlist]
-
-    # note, should we find a trick for some shorthands of artists??
-    artistshorthands = csv_to_list(csvfilename="artistshorthands",directory="./csvfiles/special_lists/",delimiter="?")
-    for shorthand in artistshorthands:
-        parts = shorthand.split(';')
-        if parts[0] in positive_prompt:
-            positive_prompt = positive_prompt.lower().replace(parts[0].lower(), parts[1].lower())
-
-
-    for artist_name, category in zip(artist_names, categorylist):
-        positive_prompt = positive_prompt.lower().replace(artist_name, category)
+    # this also turns shorthands of artists into their tags, and lowers the prompt
+    positive_prompt = get_artist_rewriter().rewrite(positive_prompt)
 
 
     allwords = split_prompt_to_words(positive_prompt)
 
     
-    #lower all!
-    
-    for word in allwords:
-        if(word.lower() in negative_primer):
-            index_of_word = negative_primer.index(word.lower())
-            all_negative_words_list.append(negative_result[index_of_word])
+    all_negative_words_list = negativewordtable.match(allwords)
     
     all_negative_words = ", ".join(all_negative_words_list)
     all_negative_words_list = all_negative_words.split(",")
@@ -4706,8 +4435,8 @@ def build_dynamic_negative(positive_prompt = "", insanitylevel = 0, enhance = Fa
     removalchance = int((insanitylevel) * 10)
 
     for i in range(len(all_negative_words_list)):
-        if(random.randint(1, 100)<removalchance):
-            all_negative_words_list.pop(random.randint(0, len(all_negative_words_list)-1))
+        if(rng.randint(1, 100)<removalchance):
+            all_negative_words_list.pop(rng.randint(0, len(all_negative_words_list)-1))
 
     # remove anything that is in the prompt itself, so no conflict of words!
             
@@ -4740,26 +4469,14 @@ def build_dynamic_negative(positive_prompt = "", insanitylevel = 0, enhance = Fa
 
     return negative_result
 
-def enhance_positive(positive_prompt = "", amountofwords = 3):
+def enhance_positive(positive_prompt = "", amountofwords = 3, rng=random):
 
  
     wordcombilist = csv_to_list(csvfilename="wordcombis", directory="./csvfiles/special_lists/",delimiter="?")
 
     # do a trick for artists, replace with their tags instead
-    artistlist, categorylist = load_all_artist_and_category()
-    # lower them
-    artist_names = [artist.strip().lower() for artist in artistlist]
-
-    # note, should we find a trick for some shorthands of artists??
-    artistshorthands = csv_to_list(csvfilename="artistshorthands",directory="./csvfiles/special_lists/",delimiter="?")
-    for shorthand in artistshorthands:
-        parts = shorthand.split(';')
-        if parts[0] in positive_prompt:
-            positive_prompt = positive_prompt.lower().replace(parts[0].lower(), parts[1].lower())
-
-
-    for artist_name, category in zip(artist_names, categorylist):
-        positive_prompt = positive_prompt.lower().replace(artist_name, category)
+    # this also turns shorthands of artists into their tags, and lowers the prompt
+    positive_prompt = get_artist_rewriter().rewrite(positive_prompt)
 
     allwords = split_prompt_to_words(positive_prompt)
     allwords = [elem.strip().lower() for elem in allwords] # lower them
@@ -4772,93 +4489,96 @@ def enhance_positive(positive_prompt = "", amountofwords = 3):
 
     for combiset in wordcombilist:
 
-        combiwords = set(combiset.split(', '))
+        combiwords = dict.fromkeys(combiset.split(', '))
         for combiword in combiwords:
             for word in allwords:
                 if(word.lower() == combiword.lower()):
 
                     wordsfound += 1
-                    combiwords2 = set(combiset.split(', '))
+                    combiwords2 = dict.fromkeys(combiset.split(', '))
                     # remove and only take one
                     combiwords2 = [word for word in combiwords2 if word not in allwords]
                     #for combiword2 in combiwords2:
                     if(combiwords2):
-                        newwordlist.append(random.choice(combiwords2))
+                        newwordlist.append(rng.choice(combiwords2))
                     
     
     
     newwordlist = [word for word in newwordlist if word not in allwords]
-    newwordlist = list(set(newwordlist)) # make unique
+    newwordlist = list(dict.fromkeys(newwordlist)) # make unique, in a fixed order
     
     
     for i in range(0,amountofwords):
         if(len(newwordlist) > 0):
-               addwords += ", " + newwordlist.pop(random.randrange(len(newwordlist)))
+               addwords += ", " + newwordlist.pop(rng.randrange(len(newwordlist)))
                #print(addwords)
     
 
     return addwords
 
-def artify_prompt(insanitylevel = 5, prompt = "", artists = "all", amountofartists = "1", mode="standard", seed = -1):
-    if(amountofartists=="random"):
-        intamountofartists = random.randint(1,int((insanitylevel/3) + 1.20))
-    else:    
-        intamountofartists = int(amountofartists)
-
-
-    # set seed
-    # For use in ComfyUI (might bring to Automatic1111 as well)
-    # lets do it when its larger than 0
-    # Otherwise, just do nothing and it will keep on working based on an earlier set seed
-    if(seed > 0):
-        random.seed(seed)
-
+# the artist categories that artify_prompt picks an artist style from, and can take its artists from
+ARTIFY_ARTIST_TYPES = ["popular", "3D",	"abstract",	"angular", "anime"	,"architecture",	"art nouveau",	"art deco",	"baroque",	"bauhaus", 	"cartoon",	"character",	"children's illustration", 	"cityscape", "cinema",	"clean",	"cloudscape",	"collage",	"colorful",	"comics",	"cubism",	"dark",	"detailed", 	"digital",	"expressionism",	"fantasy",	"fashion",	"fauvism",	"figurativism",	"graffiti",	"graphic design",	"high contrast",	"horror",	"impressionism",	"installation",	"landscape",	"light",	"line drawing",	"low contrast",	"luminism",	"magical realism",	"manga",	"melanin",	"messy",	"monochromatic",	"nature",	"photography",	"pop art",	"portrait",	"primitivism",	"psychedelic",	"realism",	"renaissance",	"romanticism",	"scene",	"sci-fi",	"sculpture",	"seascape",	"space",	"stained glass",	"still life",	"storybook realism",	"street art",	"streetscape",	"surrealism",	"symbolism",	"textile",	"ukiyo-e",	"vibrant",	"watercolor",	"whimsical"]
 
-    # first build up a complete anti list. Those values are removing during list building
-    # this uses the antivalues string AND the antilist.csv
-    emptylist = []
-    antilist = csv_to_list("antilist",emptylist , "./userfiles/",1)
-    
-    # clean up antivalue list:
-    antilist = [s.strip().lower() for s in antilist]
-
-     # build artists list
+# the artists of artify_prompt, for PromptGenerator.artify_artists()
+def _build_artify_artists(antilist, artists):
+    # build artists list
     if artists == "wild":
         artists = "all (wild)"
 
-    # we want to create more cohorence, so we are adding all (wild) mode for the old logic
-    
-    artisttypes = ["popular", "3D",	"abstract",	"angular", "anime"	,"architecture",	"art nouveau",	"art deco",	"baroque",	"bauhaus", 	"cartoon",	"character",	"children's illustration", 	"cityscape", "cinema",	"clean",	"cloudscape",	"collage",	"colorful",	"comics",	"cubism",	"dark",	"detailed", 	"digital",	"expressionism",	"fantasy",	"fashion",	"fauvism",	"figurativism",	"graffiti",	"graphic design",	"high contrast",	"horror",	"impressionism",	"installation",	"landscape",	"light",	"line drawing",	"low contrast",	"luminism",	"magical realism",	"manga",	"melanin",	"messy",	"monochromatic",	"nature",	"photography",	"pop art",	"portrait",	"primitivism",	"psychedelic",	"realism",	"renaissance",	"romanticism",	"scene",	"sci-fi",	"sculpture",	"seascape",	"space",	"stained glass",	"still life",	"storybook realism",	"street art",	"streetscape",	"surrealism",	"symbolism",	"textile",	"ukiyo-e",	"vibrant",	"watercolor",	"whimsical"]
-    artiststyleselector = ""
-    artiststyleselectormode = "normal"
-    artiststyleselector = random.choice(artisttypes)
-
     artistlist = []
     # create artist list to use in the code, maybe based on category  or personal lists
-    if(artists != "all (wild)" and artists != "all" and artists != "none" and artists.startswith("personal_artists") == False and artists.startswith("personal artists") == False and artists in artisttypes):
+    if(artists != "all (wild)" and artists != "all" and artists != "none" and artists.startswith("personal_artists") == False and artists.startswith("personal artists") == False and artists in ARTIFY_ARTIST_TYPES):
         artistlist = artist_category_csv_to_list("artists_and_category",artists)
     elif(artists.startswith("personal_artists") == True or artists.startswith("personal artists") == True):
         artists = artists.replace(" ","_",-1) # add underscores back in
         artistlist = csv_to_list(artists,antilist,"./userfiles/")
     elif(artists != "none"):
         artistlist = csv_to_list("artists",antilist)
-    
+    return artistlist
+
+def artify_prompt(insanitylevel = 5, prompt = "", artists = "all", amountofartists = "1", mode="standard", seed = -1, rng=None):
+    return get_prompt_generator().artify(insanitylevel=insanitylevel, prompt=prompt, artists=artists, amountofartists=amountofartists, mode=mode, seed=seed, rng=rng)
+
+# artifies a list of prompts in one go, see PromptGenerator.artify_batch
+def artify_prompts(prompts, insanitylevel = 5, artists = "all", amountofartists = "1", mode = "standard", seed = -1):
+    return get_prompt_generator().artify_batch(prompts, seed, insanitylevel=insanitylevel, artists=artists, amountofartists=amountofartists, mode=mode)
+
+def _artify_prompt(generator, insanitylevel = 5, prompt = "", artists = "all", amountofartists = "1", mode="standard", seed = -1, rng=None):
+    # set seed
+    # For use in ComfyUI (might bring to Automatic1111 as well)
+    # lets do it when its larger than 0
+    # Otherwise, just do nothing and it will keep on working based on an earlier set seed
+    # Everything is drawn from rng, so parallel prompts with their own seed don't get in each others way
+    # A prompt that passes its rng (artify mode) gets the amount of artists from it before the seed is set, as it always did
+    # On its own, the amount of artists comes from the seed as well
+    intamountofartists = None
+    if(amountofartists!="random"):
+        intamountofartists = int(amountofartists)
+    elif(rng is not None):
+        intamountofartists = rng.randint(1,int((insanitylevel/3) + 1.20))
+
+    rng = get_rng(seed, rng)
+
+    if(intamountofartists is None):
+        intamountofartists = rng.randint(1,int((insanitylevel/3) + 1.20))
 
-    # load up the styles list for the other modes
-    styleslist = csv_to_list("styles", antilist,"./csvfiles/templates/",0,"?")
-    stylessuffix = [item.split('-subject-')[1] for item in styleslist]
-    breakstylessuffix = [item.split(',') for item in stylessuffix]
-    allstylessuffixlist = [value for sublist in breakstylessuffix for value in sublist]
-    allstylessuffixlist = list(set(allstylessuffixlist))
 
-    artistsuffix = artist_descriptions_csv_to_list("artists_and_category")
-    breakartiststylessuffix = [item.split(',') for item in artistsuffix]
-    artiststylessuffixlist = [value for sublist in breakartiststylessuffix for value in sublist]
-    artiststylessuffixlist = list(set(artiststylessuffixlist))
-    allstylessuffixlist += artiststylessuffixlist
+    # first build up a complete anti list. Those values are removing during list building
+    # this uses the antilist.csv
+    antilist = generator.antilist()
+
+    # we want to create more cohorence, so we are adding all (wild) mode for the old logic
+    artiststyleselector = ""
+    artiststyleselectormode = "normal"
+    artiststyleselector = rng.choice(ARTIFY_ARTIST_TYPES)
+
+    # the artists and the styles come ready from the generator
+    artistlist = generator.artify_artists(antilist, artists)
+    allstylessuffixlist = generator.style_suffixes(antilist)
+    artistsuffix = generator.artist_descriptions()
 
     completeprompt = ""
-    if(common_dist(insanitylevel)):
+    if(common_dist(insanitylevel, rng)):
         completeprompt += "-artiststyle- "
     completeprompt += "art by "
     #Lets go effing artify this MF'er
@@ -4869,19 +4589,21 @@ def artify_prompt(insanitylevel = 5, prompt = "", artists = "all", amountofartis
         else:
             completeprompt += "-artist-, "
     
-    if(uncommon_dist(insanitylevel)):
+    if(uncommon_dist(insanitylevel, rng)):
         completeprompt += "-artistmedium-, " 
             
     # now add the prompt in
     completeprompt += prompt
 
     if(mode.lower() == "remix"):
+        artistsuffixdeck = Deck(artistsuffix, rng)
         for i in range(0,intamountofartists):
-            completeprompt += ", " + artistsuffix.pop(artistsuffix.index(random.choice(artistsuffix)))
+            completeprompt += ", " + artistsuffixdeck.draw()
 
     elif(mode.lower() == "super remix turbo"):
+        allstylessuffixdeck = Deck(allstylessuffixlist, rng)
         for i in range(0,intamountofartists*4):
-            completeprompt += ", " + allstylessuffixlist.pop(allstylessuffixlist.index(random.choice(allstylessuffixlist)))
+            completeprompt += ", " + allstylessuffixdeck.draw()
 
     else:
         # else just go standard
@@ -4893,13 +4615,13 @@ def artify_prompt(insanitylevel = 5, prompt = "", artists = "all", amountofartis
     
     while ("-artist-" in completeprompt):
 
-        completeprompt = replacewildcard(completeprompt,5,"-artist-", artistlist,"","",artiststyleselector)
+        completeprompt = replacewildcard(completeprompt,5,"-artist-", artistlist,"","",artiststyleselector, rng=rng)
 
 
     return completeprompt
 
 
-def flufferizer(prompt = "", amountoffluff = "dynamic", seed = -1, reverse_polarity = False):
+def flufferizer(prompt = "", amountoffluff = "dynamic", seed = -1, reverse_polarity = False, rng=None):
     if(amountoffluff == "none"):
         return prompt
     
@@ -4907,8 +4629,8 @@ def flufferizer(prompt = "", amountoffluff = "dynamic", seed = -1, reverse_polar
     # For use in ComfyUI (might bring to Automatic1111 as well)
     # lets do it when its larger than 0
     # Otherwise, just do nothing and it will keep on working based on an earlier set seed
-    if(seed > 0):
-        random.seed(seed)
+    # Everything is drawn from rng, so parallel prompts with their own seed don't get in each others way
+    rng = get_rng(seed, rng)
     
     if(reverse_polarity):
         flufferlist = csv_to_list("antifluff") # all negative words
@@ -4937,8 +4659,9 @@ def flufferizer(prompt = "", amountoffluff = "dynamic", seed = -1, reverse_polar
         minfluff = 5
         maxfluff = 8
     
-    for i in range(0,random.randint(minfluff, maxfluff)):
-        prompt += ", " + flufferlist.pop(flufferlist.index(random.choice(flufferlist)))
+    flufferdeck = Deck(flufferlist, rng)
+    for i in range(0,rng.randint(minfluff, maxfluff)):
+        prompt += ", " + flufferdeck.draw()
     
     return prompt
 
@@ -4950,6 +4673,218 @@ def replace_match(match):
     words = match.group(0)[1:-1].split('|')
     return words[0]
 
+def space_before_bracket(match):
+    # same as re.sub(r'(?<!\()\s?\(', ' (', ...), but a pattern that starts with a lookbehind is tried on every character
+    start = match.start()
+    if(start > 0 and match.string[start - 1] == "("):
+        if(len(match.group(0)) == 2):
+            return match.group(0)[0] + " ("
+        return "("
+    return " ("
+
+# the rules of cleanup, they work as if they are applied one after the other in this order
+# plain text is replaced with str.replace, compiled patterns with sub(), which is a lot cheaper than going through re.sub() for every rule
+# the order matters, rules often clean up what an earlier rule left behind
+# rules that don't affect each other are run together in one pass, see group_cleanup_rules()
+CLEANUP_RULES = [
+    # all cleanup steps moved here
+    ("[ ", "["),
+    ("[,", "["),
+    (" ]", "]"),
+    (" |", "|"),
+    ("( ", "("),
+    (" (", "("),
+    (") ", ")"),
+    (" )", ")"),
+
+    (" :", ":"),
+    (",::", "::"),
+    (",:", ":"),
+
+    (",,", ", "),
+    (",,", ", "),
+    (",,,", ", "),
+    (", ,", ","),
+    (" , ", ", "),
+    (" ,", ","),
+    (" ,", ","),
+    (" ,", ","),
+    (",(", ", ("),
+
+    # every run of spaces becomes one space
+    (re.compile("  +"), " "),
+    ("a The", "The"),
+    ("the the", "the"),
+    (", ,", ","),
+    (",,", ","),
+
+    (", of a", " of a"),
+    ("of a,", "of a"),
+    ("of a of a", "of a"),
+    (" a a ", " a "),
+
+    # a / an
+    (" a a", " an a"),
+    (" a e", " an e"),
+    (" a i", " an i"),
+    (" a u", " an u"),
+    (" a o", " an o"),
+
+    ("art art", "art"),
+    ("Art art", "art"),
+    ("lighting lighting", "lighting"),
+    ("Lighting lighting", "lighting"),
+    ("light lighting", "light"),
+    ("-artiststyle- art,", ""),
+    ("-artiststyle- art", ""),
+    ("-artiststyle-", ""),
+    ("-artistmedium-", ""),
+    ("-artistdescription-", ""),
+    ("- art ", ""),
+
+    ("anime anime", "anime"),
+    ("anime, anime", "anime"),
+
+    ("shot shot", "shot"),
+
+    ("a his", "his"),
+    ("a her", "her"),
+    ("they is", "they are"),
+    ("they has", "they have"),
+
+    # some space tricks
+    ("- shaped", "-shaped"),
+    ("echa- ", "echa-"),
+    ("style -", "style-"),
+    (", as a", " as a"),
+
+    #small fix for multisubject thing
+    ("a 2", "2"),
+    ("a 3", "3"),
+    ("a 4", "4"),
+    ("a 5", "5"),
+
+    # clean up some hacky multiples with adding a s to the end
+    ("fs ", "ves "),
+    ("fs,", "ves,"),
+    ("sss ", "ss "),
+    ("sss,", "ss,"),
+    (" Mans", " Men,"),
+    (" mans", " men"),
+    (" Womans,", " Women"),
+    (" womans,", " women,"),
+    ("(Mans", "(Men,"),
+    ("(mans", "(men"),
+    ("(Womans", "(Women"),
+    ("(womans", "(women"),
+
+    ("-sameothersubject-", "it"),
+    ("-samehumansubject-", "the person"),
+
+    (re.compile(r"\s?\("), space_before_bracket),
+    (re.compile(r"\)(?![\s)])"), ") "),
+
+    (" . ", ". "),
+    (", . ", ". "),
+    (",. ", ". "),
+    ("., ", ". "),
+    (". . ", ". "),
+]
+
+def cleanup_rules_overlap(first, second):
+    # True when the two can share characters somewhere in a text: one is in the other, or one ends with the start of the other
+    if(first in second or second in first):
+        return True
+    for length in range(1, min(len(first), len(second))):
+        if(first.endswith(second[:length]) or second.endswith(first[:length])):
+            return True
+    return False
+
+def cleanup_rules_independent(earlier, later):
+    # True when running earlier and then later gives the same as one pass that replaces both:
+    # they never match overlapping text, and what earlier puts back can't become (part of) a match of later
+    pattern, replacement = earlier
+    if(cleanup_rules_overlap(pattern, later[0])):
+        return False
+    if(replacement == ""):
+        # the text on both sides comes together, anything longer than one character could match across it
+        return len(later[0]) == 1
+    return not cleanup_rules_overlap(replacement, later[0])
+
+def group_cleanup_rules(rules):
+    # puts the rules into as few passes as it can, without changing what comes out
+    # A plain text rule moves up into an earlier pass, as long as it is independent of every rule it moves past (both ways),
+    # and of the rules already in that pass. Compiled patterns stay a pass of their own, and nothing moves past them.
+    groups = []
+    for rule in rules:
+        pattern, replacement = rule
+        if(not isinstance(pattern, str) or not isinstance(replacement, str)):
+            # a rule on its own, kept as the tuple it is
+            groups.append(rule)
+            continue
+        target = None
+        for position in range(len(groups) - 1, -1, -1):
+            group = groups[position]
+            if(isinstance(group, tuple)):
+                break
+            if(all(cleanup_rules_independent(member, rule) for member in group)):
+                target = position
+            if(not all(cleanup_rules_independent(member, rule) and cleanup_rules_independent(rule, member) for member in group)):
+                break
+        if(target is None):
+            groups.append([rule])
+        else:
+            groups[target].append(rule)
+
+    passes = []
+    for group in groups:
+        if(isinstance(group, tuple)):
+            passes.append(group)
+        elif(len(group) < CLEANUP_MIN_GROUP):
+            # a str.replace is a lot cheaper than a pattern that has to be tried at every character, so small groups stay as they are
+            passes.extend(group)
+        else:
+            # one pattern for all of them, none of them overlap so the order of the alternatives doesn't matter
+            table = dict(group)
+            passes.append((re.compile(cleanup_rules_pattern(list(table))), lambda match, table=table: table[match.group()]))
+    return passes
+
+def cleanup_rules_pattern(patterns):
+    # one pattern for a list of plain texts, with the texts that start the same put together: a a|a e becomes a [ae]
+    trie = {}
+    for pattern in patterns:
+        node = trie
+        for character in pattern:
+            node = node.setdefault(character, {})
+        node[""] = {}
+    def alternatives(node):
+        branches = []
+        characters = []
+        for character, child in node.items():
+            if(character == ""):
+                continue
+            if(list(child) == [""]):
+                characters.append(re.escape(character))
+            else:
+                branches.append(re.escape(character) + alternatives(child))
+        if(len(characters) == 1):
+            branches.append(characters[0])
+        elif(characters):
+            branches.append("[" + "".join(characters) + "]")
+        if(len(branches) == 1 and "" not in node):
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")" + ("?" if "" in node else "")
+    return alternatives(trie)
+
+# groups of fewer rules than this stay separate str.replace passes
+CLEANUP_MIN_GROUP = 8
+
+# CLEANUP_RULES grouped into passes, this is what cleanup() runs
+CLEANUP_PASSES = group_cleanup_rules(CLEANUP_RULES)
+
+hybridpattern = re.compile(r'\[\w+\|\w+\]')
+emptyweightpattern = re.compile(r'\(\:\d+\.\d+\)')
+
 def cleanup(completeprompt, advancedprompting, insanitylevel = 5):
 
     # This part is turned off, will bring it back later as an option
@@ -4965,9 +4900,8 @@ def cleanup(completeprompt, advancedprompting, insanitylevel = 5):
 
     # if we are not using advanced prompting, remove any hybrid stuff:
     if(advancedprompting==False):
-        hybridpattern = r'\[\w+\|\w+\]'
         # Replace the matched pattern with the first word in the group
-        completeprompt = re.sub(hybridpattern, replace_match, completeprompt)
+        completeprompt = hybridpattern.sub(replace_match, completeprompt)
 
         # Doesnt work if there are multiple words, so then just get rid of things as is :D
         completeprompt = completeprompt.replace("[", " ")
@@ -4975,133 +4909,27 @@ def cleanup(completeprompt, advancedprompting, insanitylevel = 5):
         completeprompt = completeprompt.replace("|", " ")
 
     # sometimes if there are not enough artist, we get left we things formed as (:1.2)
-    completeprompt = re.sub(r'\(\:\d+\.\d+\)', '', completeprompt)
+    completeprompt = emptyweightpattern.sub('', completeprompt)
 
     # lets also remove some wierd stuff on lower insanitylevels
     if(insanitylevel < 7):
         completeprompt = completeprompt.replace("DayGlo", " ")
         completeprompt = completeprompt.replace("fluorescent", " ")
 
-    # all cleanup steps moved here
-    completeprompt = re.sub(r'\[ ', '[', completeprompt)
-    completeprompt = re.sub(r'\[,', '[', completeprompt)
-    completeprompt = re.sub(r' \]', ']', completeprompt)
-    completeprompt = re.sub(r' \|', '|', completeprompt)
-    #completeprompt = re.sub(r' \"', '\"', completeprompt)
-    #completeprompt = re.sub(r'\" ', '\"', completeprompt)
-    completeprompt = re.sub(r'\( ', '(', completeprompt)
-    completeprompt = re.sub(r' \(', '(', completeprompt)
-    completeprompt = re.sub(r'\) ', ')', completeprompt)
-    completeprompt = re.sub(r' \)', ')', completeprompt)
-
-    completeprompt = re.sub(' :', ':', completeprompt)
-    completeprompt = re.sub(',::', '::', completeprompt)
-    completeprompt = re.sub(',:', ':', completeprompt)
-
-    completeprompt = re.sub(',,', ', ', completeprompt)
-    completeprompt = re.sub(',,', ', ', completeprompt)
-    completeprompt = re.sub(',,,', ', ', completeprompt)
-    completeprompt = re.sub(', ,', ',', completeprompt)
-    completeprompt = re.sub(' , ', ', ', completeprompt)
-    completeprompt = re.sub(' ,', ',', completeprompt)
-    completeprompt = re.sub(' ,', ',', completeprompt)
-    completeprompt = re.sub(' ,', ',', completeprompt)
-    completeprompt = re.sub(r',\(', ', (', completeprompt)
-
-
-
-    while "  " in completeprompt:
-        completeprompt = re.sub('  ', ' ', completeprompt)
-    completeprompt = re.sub('a The', 'The', completeprompt)
-    completeprompt = re.sub('the the', 'the', completeprompt)
-    completeprompt = re.sub(', ,', ',', completeprompt)
-    completeprompt = re.sub(',,', ',', completeprompt)
-
-    completeprompt = re.sub(', of a', ' of a', completeprompt)
-    completeprompt = re.sub('of a,', 'of a', completeprompt)
-    completeprompt = re.sub('of a of a', 'of a', completeprompt)
-    completeprompt = re.sub(' a a ', ' a ', completeprompt)
-
-    # a / an
-    completeprompt = re.sub(' a a', ' an a', completeprompt)
-    completeprompt = re.sub(' a e', ' an e', completeprompt)
-    completeprompt = re.sub(' a i', ' an i', completeprompt)
-    completeprompt = re.sub(' a u', ' an u', completeprompt)
-    completeprompt = re.sub(' a o', ' an o', completeprompt)
-
-
-    completeprompt = re.sub('art art', 'art', completeprompt)
-    completeprompt = re.sub('Art art', 'art', completeprompt)
-    completeprompt = re.sub('lighting lighting', 'lighting', completeprompt)
-    completeprompt = re.sub('Lighting lighting', 'lighting', completeprompt)
-    completeprompt = re.sub('light lighting', 'light', completeprompt)
-    completeprompt = re.sub('-artiststyle- art,', '', completeprompt)
-    completeprompt = re.sub('-artiststyle- art', '', completeprompt)
-    completeprompt = re.sub('-artiststyle-', '', completeprompt)
-    completeprompt = re.sub('-artistmedium-', '', completeprompt)
-    completeprompt = re.sub('-artistdescription-', '', completeprompt)
-    completeprompt = re.sub('- art ', '', completeprompt)
-
-    completeprompt = re.sub('anime anime', 'anime', completeprompt)
-    completeprompt = re.sub('anime, anime', 'anime', completeprompt)
-
-    completeprompt = re.sub('shot shot', 'shot', completeprompt)
-    
-
-    completeprompt = re.sub('a his', 'his', completeprompt)
-    completeprompt = re.sub('a her', 'her', completeprompt)
-    completeprompt = re.sub('they is', 'they are', completeprompt)
-    completeprompt = re.sub('they has', 'they have', completeprompt)
-
-    # some space tricks
-    completeprompt = re.sub('- shaped', '-shaped', completeprompt)
-    completeprompt = re.sub('echa- ', 'echa-', completeprompt)
-    completeprompt = re.sub('style -', 'style-', completeprompt)
-    completeprompt = re.sub(', as a', ' as a', completeprompt)
-
-
-    #small fix for multisubject thing
-    completeprompt = re.sub('a 2', '2', completeprompt)
-    completeprompt = re.sub('a 3', '3', completeprompt)
-    completeprompt = re.sub('a 4', '4', completeprompt)
-    completeprompt = re.sub('a 5', '5', completeprompt)
-
-
-    # clean up some hacky multiples with adding a s to the end
-    completeprompt = re.sub('fs ', 'ves ', completeprompt)
-    completeprompt = re.sub('fs,', 'ves,', completeprompt)
-    completeprompt = re.sub('sss ', 'ss ', completeprompt)
-    completeprompt = re.sub('sss,', 'ss,', completeprompt)
-    completeprompt = re.sub(' Mans', ' Men,', completeprompt)
-    completeprompt = re.sub(' mans', ' men', completeprompt)
-    completeprompt = re.sub(' Womans,', ' Women', completeprompt)
-    completeprompt = re.sub(' womans,', ' women,', completeprompt)
-    completeprompt = re.sub(r'\(Mans', '(Men,', completeprompt)
-    completeprompt = re.sub(r'\(mans', '(men', completeprompt)
-    completeprompt = re.sub(r'\(Womans', '(Women', completeprompt)
-    completeprompt = re.sub(r'\(womans', '(women', completeprompt)
-
-    completeprompt = re.sub('-sameothersubject-', 'it', completeprompt)
-    completeprompt = re.sub('-samehumansubject-', 'the person', completeprompt)
-
-    
-    completeprompt = re.sub(r'(?<!\()\s?\(', ' (', completeprompt)
-    completeprompt = re.sub(r'\)(?![\s)])', ') ', completeprompt)
+    for pattern, replacement in CLEANUP_PASSES:
+        if(isinstance(pattern, str)):
+            completeprompt = completeprompt.replace(pattern, replacement)
+        else:
+            completeprompt = pattern.sub(replacement, completeprompt)
 
     # Move the extracted LoRA's to the end of completeprompt
     #completeprompt += " " + " ".join(allLoRA)   
 
-    completeprompt = completeprompt.replace(' . ', '. ')
-    completeprompt = completeprompt.replace(', . ', '. ')
-    completeprompt = completeprompt.replace(',. ', '. ')
-    completeprompt = completeprompt.replace('., ', '. ')
-    completeprompt = completeprompt.replace('. . ', '. ')
-
     completeprompt = completeprompt.strip(", ")
 
     return completeprompt
 
-def custom_or(values, insanitylevel = 5):
+def custom_or(values, insanitylevel = 5, rng=random):
     # Check if the last element is one of the specific values
     last_element = values[-1]
     first_element = values[0]
@@ -5109,65 +4937,129 @@ def custom_or(values, insanitylevel = 5):
    
     if last_element in ['always', 'common', 'normal','uncommon', 'rare', 'legendary','unique', 'extraordinary', 'novel', 'never']:
         # If we do not hit the change roll, then take the first element.
-        if not(chance_roll(insanitylevel, last_element)):
+        if not(chance_roll(insanitylevel, last_element, rng)):
             return first_element
         # Else anything but the first or last element
         else:
             values.remove(first_element)
             values.remove(last_element)
-            selected_value = random.choice(values)
+            selected_value = rng.choice(values)
             return selected_value
 
 
     else:
         # Randomly select one element from the list
-        selected_value = random.choice(values)
+        selected_value = rng.choice(values)
     return selected_value
 
-def parse_custom_functions(completeprompt, insanitylevel = 5):
+# OR() functions
+# A prompt is parsed into parts, a part is either text or an OR() call. An OR() call is a tuple of its arguments,
+# and every argument is a tuple of parts again, so OR() calls can be nested as deep as needed.
+# Brackets that are not an OR() call are just text, so OR((red:1.2);blue) picks between "(red:1.2)" and "blue".
+# An OR( that is never closed stays in the prompt as it is.
+ORtokens = re.compile(r'OR\(|[();]')
+ORparsecache = {}
+ORparsecachesize = 1024
+
+def parse_or_functions(completeprompt):
+    # the same prompt or template always gives the same parts, so those are cached
+    parts = ORparsecache.get(completeprompt)
+    if(parts is None):
+        parts = parse_or_parts(completeprompt, 0, False)[0]
+        if(len(ORparsecache) >= ORparsecachesize):
+            ORparsecache.clear()
+        ORparsecache[completeprompt] = parts
+    return parts
+
+def parse_or_parts(text, position, inOR):
+    # parses from position, until the end of the text or, when inOR, until the ; or ) that ends the current argument
+    # returns the parts and the position it stopped at, which is None when the end of the text was reached
+    parts = []
+    textstart = position
+    depth = 0
+    while(True):
+        token = ORtokens.search(text, position)
+        if(token is None):
+            break
+        position = token.end()
+        if(token.group() == "OR("):
+            call, end = parse_or_call(text, position)
+            if(call is not None):
+                if(token.start() > textstart):
+                    parts.append(text[textstart:token.start()])
+                parts.append(call)
+                position = end
+                textstart = end
+        elif(inOR):
+            if(token.group() == "("):
+                depth += 1
+            elif(token.group() == ")" and depth > 0):
+                depth -= 1
+            elif(depth == 0):
+                if(token.start() > textstart):
+                    parts.append(text[textstart:token.start()])
+                return tuple(parts), token.start()
+    if(len(text) > textstart):
+        parts.append(text[textstart:])
+    return tuple(parts), None
+
+def parse_or_call(text, position):
+    # parses the arguments of an OR( that ends just before position
+    # returns the arguments and the position after the closing ), or None when it is never closed
+    arguments = []
+    while(True):
+        argument, end = parse_or_parts(text, position, True)
+        if(end is None):
+            return None, None
+        arguments.append(argument)
+        if(text[end] == ")"):
+            return tuple(arguments), end + 1
+        position = end + 1
+
+def evaluate_or_parts(parts, insanitylevel, rng, chosen, rolls):
+    # goes from right to left and does nested OR() calls first, same order of rolls as it has always been
+    # An OR() that reads exactly the same as one further to the right, once the OR() calls inside of it are done,
+    # gets the same value, as long as those were already done at the time the one to the right was rolled.
+    # chosen keeps every roll per OR() text as (moment, value), rolls counts the moments
+    # returns the text and the moment it was complete
+    values = []
+    complete = 0
+    for part in reversed(parts):
+        if(isinstance(part, str)):
+            values.append(part)
+            continue
+        arguments = []
+        argumentscomplete = 0
+        for argument in reversed(part):
+            argumentvalue, argumentcomplete = evaluate_or_parts(argument, insanitylevel, rng, chosen, rolls)
+            arguments.append(argumentvalue)
+            argumentscomplete = max(argumentscomplete, argumentcomplete)
+        arguments.reverse()
+        ORtext = ";".join(arguments)
+        # the first roll of the same text after this one was complete
+        earlierrolls = chosen.setdefault(ORtext, [])
+        rolled = None
+        for earlierrolled, earliervalue in earlierrolls:
+            if(earlierrolled > argumentscomplete):
+                rolled, value = earlierrolled, earliervalue
+                break
+        if(rolled is None):
+            value = custom_or([argument.strip() for argument in arguments], insanitylevel, rng=rng)
+            rolls[0] += 1
+            rolled = rolls[0]
+            earlierrolls.append((rolled, value))
+        values.append(value)
+        complete = max(complete, rolled)
+    values.reverse()
+    return "".join(values), complete
+
+def parse_custom_functions(completeprompt, insanitylevel = 5, rng=random):
     #print(completeprompt)
 
-    # Regular expression pattern to match 'or()' function calls and their arguments
-    ORpattern = r'OR\((.*?)\)'
-    ORbasesearch = 'OR('
-
-
-
-    while re.findall(ORpattern, completeprompt):
-
-        # basically start from right to left to start replacing, so we can do nesting
-        # probably not very stable, but seems to work :)
-        startofOR = completeprompt.rfind(ORbasesearch)
-
-        lastpartofcompleteprompt = completeprompt[startofOR:]
- 
-        # Find all 'or()' function calls and their arguments in the text
-        matches = re.findall(ORpattern, lastpartofcompleteprompt)
-
-        # Sort the matches based on the length of the OR expressions
-        matches.sort(key=len)
-
-
-        match = matches[0] # get the first value, so smallest goes first!
-
-        or_replacement = ""
-
-
-        # Split the arguments by ';'
-        arguments = [arg.strip() for arg in match.split(';')]
-        
-        # Evaluate the 'or()' function and append the result to the results list
-
-        # For debugging, enable these lines
-        #print(completeprompt)
-        #print(arguments)
-        or_replacement = custom_or(arguments, insanitylevel)
-        completematch = 'OR(' + match + ')'
-        completeprompt = completeprompt.replace(completematch, or_replacement)
-
-    
+    if("OR(" not in completeprompt):
+        return completeprompt
 
-    return completeprompt
+    return evaluate_or_parts(parse_or_functions(completeprompt), insanitylevel, rng, {}, [0])[0]
 
 def split_prompt_to_words(text):
         # first get all the words
@@ -5183,8 +5075,8 @@ def split_prompt_to_words(text):
         # Filter out empty words
         words = [word for word in words if word]
 
-        # Convert the list to a set to remove duplicates, then convert it back to a list
-        listsinglewords = list(set(words))
+        # Remove duplicates, keeping the order of the words
+        listsinglewords = list(dict.fromkeys(words))
 
         # now get all words clumped together by commas
         if ',' in text:
@@ -5195,18 +5087,19 @@ def split_prompt_to_words(text):
         words = [word.strip().lower() for word in allwords]
 
         # Filter out empty words and duplicates
-        listwords = list(set(filter(None, words)))
+        listwords = list(dict.fromkeys(filter(None, words)))
 
         totallist = listsinglewords + listwords
 
-        totallist = list(set(filter(None, totallist)))
+        totallist = list(dict.fromkeys(filter(None, totallist)))
 
         return totallist
 
-def one_button_superprompt(insanitylevel = 5, prompt = "", seed = -1, override_subject = "" , override_outfit = "", chosensubject ="", gender = "", restofprompt = "", superpromptstyle = "", setnewtokens = 0, remove_bias = True):
+def one_button_superprompt(insanitylevel = 5, prompt = "", seed = -1, override_subject = "" , override_outfit = "", chosensubject ="", gender = "", restofprompt = "", superpromptstyle = "", setnewtokens = 0, remove_bias = True, rng=None):
+    rng = get_rng(rng=rng)
 
     if(seed <= 0):
-        seed = random.randint(1,1000000)
+        seed = rng.randint(1,1000000)
     
     done = False
     load_models()
@@ -5328,7 +5221,7 @@ def one_button_superprompt(insanitylevel = 5, prompt = "", seed = -1, override_s
         if "fantasy" in restofprompt or "d&d" in restofprompt or "dungeons and dragons" in restofprompt or "dungeons and dragons" in restofprompt:
             superpromptstyle = "fantasy style"
         elif "sci-fi" in restofprompt or "scifi" in restofprompt or "science fiction" in restofprompt:
-            superpromptstyle = random.choice(["sci-fi style","futuristic"])
+            superpromptstyle = rng.choice(["sci-fi style","futuristic"])
         elif "cyberpunk" in restofprompt:
             superpromptstyle = "cyberpunk"
         elif "horror" in restofprompt:
@@ -5336,14 +5229,14 @@ def one_button_superprompt(insanitylevel = 5, prompt = "", seed = -1, override_s
         elif "evil" in restofprompt:
             superpromptstyle = "evil"
         elif "cinestill" in restofprompt or "movie still" in restofprompt or "cinematic" in restofprompt or "epic" in restofprompt:
-            superpromptstyle = random.choice(["cinematic","epic"])
+            superpromptstyle = rng.choice(["cinematic","epic"])
         elif "fashion" in restofprompt:
-            superpromptstyle = random.choice(["elegant","glamourous"])
+            superpromptstyle = rng.choice(["elegant","glamourous"])
         elif "cute" in restofprompt or "adorable" in restofprompt or "kawaii" in restofprompt:
-            superpromptstyle = random.choice(["cute","adorable", "kawaii"])
+            superpromptstyle = rng.choice(["cute","adorable", "kawaii"])
 
         else:
-            superpromptstyle = random.choice(superprompterstyleslist)
+            superpromptstyle = rng.choice(superprompterstyleslist)
 
     if(words_to_check):
         question += "Make sure the subject is used: " + ', '.join(words_to_check) + " \n"
@@ -5362,11 +5255,11 @@ def one_button_superprompt(insanitylevel = 5, prompt = "", seed = -1, override_s
     elif "game" in restofprompt:
         imagetype = "video game artwork"
     
-    if imagetype != "" and (normal_dist(insanitylevel) or usestyle == True):
+    if imagetype != "" and (normal_dist(insanitylevel, rng) or usestyle == True):
         question += "Expand the following " + gender + " " + subject_to_generate + " prompt to describe " + superpromptstyle + " " + imagetype + ": "
     elif imagetype != "":
         question += "Expand the following " + gender + " " + subject_to_generate + " prompt to describe " + imagetype + ": "
-    elif(normal_dist(insanitylevel) or usestyle == True):
+    elif(normal_dist(insanitylevel, rng) or usestyle == True):
         question += "Expand the following " + gender + " " + subject_to_generate + " prompt to make it more " + superpromptstyle
     else:
         question += "Expand the following " + gender + " " + subject_to_generate + " prompt to add more detail: "
@@ -5406,8 +5299,8 @@ def one_button_superprompt(insanitylevel = 5, prompt = "", seed = -1, override_s
 
         # piercing green eyes problem
         # basically, the model has some biasses, lets get rid of it, OBP style!
-        if(common_dist(insanitylevel) and remove_bias): # but not always
-            superpromptresult = remove_superprompt_bias(superpromptresult=superpromptresult, insanitylevel=insanitylevel, override_outfit=override_outfit)
+        if(common_dist(insanitylevel, rng) and remove_bias): # but not always
+            superpromptresult = remove_superprompt_bias(superpromptresult=superpromptresult, insanitylevel=insanitylevel, override_outfit=override_outfit, rng=rng)
             
        
         #print(words_to_check)
@@ -5425,17 +5318,17 @@ def one_button_superprompt(insanitylevel = 5, prompt = "", seed = -1, override_s
             seed += 100
             j += 1
             if(temperature < 0.5):
-                temperature += 0.05 + round((1/random.randint(15,25)),2)
+                temperature += 0.05 + round((1/rng.randint(15,25)),2)
             else:
                 temperature -= 0.1
 
             if(top_p < 1.0):
-                top_p += 0.2 + round((1/random.randint(25,35)),2)
+                top_p += 0.2 + round((1/rng.randint(25,35)),2)
             else:
                 top_p -= 0.3
             max_new_tokens += 3
             print("")
-            print(random.choice(devmessagessuperpromptlist) + "... Retrying...")
+            print(rng.choice(devmessagessuperpromptlist) + "... Retrying...")
             print("")
             
         
@@ -5444,12 +5337,12 @@ def one_button_superprompt(insanitylevel = 5, prompt = "", seed = -1, override_s
 
     return superpromptresult
 
-def remove_superprompt_bias(superpromptresult = "", insanitylevel = 5, override_outfit = ""):
+def remove_superprompt_bias(superpromptresult = "", insanitylevel = 5, override_outfit = "", rng=random):
 
     if(" green eye" in superpromptresult):
         eyecolorslist = csv_to_list("eyecolors")
         eyecolorslist = [x for x in eyecolorslist if not x.startswith('-')]
-        neweyecolor = " " + random.choice(eyecolorslist).lower() + " eye"
+        neweyecolor = " " + rng.choice(eyecolorslist).lower() + " eye"
         #print(neweyecolor)
         superpromptresult = superpromptresult.replace(" green eye", neweyecolor)
     #  white gown  or white dress
@@ -5460,14 +5353,14 @@ def remove_superprompt_bias(superpromptresult = "", insanitylevel = 5, override_
         colorcombinationslist = [x for x in colorcombinationslist if not x.startswith('-')]
         colorslist = csv_to_list("colors")
         colorslist = [x for x in colorslist if not x.startswith('-')]
-        if(normal_dist(insanitylevel)):
-            newcolordress = " " + random.choice(colorcombinationslist).lower() + " dress"
-            newcolorgown = " " + random.choice(colorcombinationslist).lower() + " gown"
-            newcolorsuit = " " + random.choice(colorcombinationslist).lower() + " suit"
+        if(normal_dist(insanitylevel, rng)):
+            newcolordress = " " + rng.choice(colorcombinationslist).lower() + " dress"
+            newcolorgown = " " + rng.choice(colorcombinationslist).lower() + " gown"
+            newcolorsuit = " " + rng.choice(colorcombinationslist).lower() + " suit"
         else:
-            newcolordress = " " + random.choice(colorslist).lower() + " dress"
-            newcolorgown = " " + random.choice(colorslist).lower() + " gown"
-            newcolorsuit = " " + random.choice(colorcombinationslist).lower() + " suit"
+            newcolordress = " " + rng.choice(colorslist).lower() + " dress"
+            newcolorgown = " " + rng.choice(colorslist).lower() + " gown"
+            newcolorsuit = " " + rng.choice(colorcombinationslist).lower() + " suit"
         #print(newcolordress)                
         #print(newcolorgown)                
         #print(newcolorsuit)
@@ -5485,7 +5378,7 @@ def remove_superprompt_bias(superpromptresult = "", insanitylevel = 5, override_
         if(override_outfit == ""):
             outfitslist = csv_to_list("outfits")
             outfitslist = [x for x in outfitslist if not x.startswith('-')]
-            newoutfit = " " + random.choice(outfitslist).lower()
+            newoutfit = " " + rng.choice(outfitslist).lower()
         else:
             newoutfit = " " + override_outfit
         superpromptresult = superpromptresult.replace(" dress", newoutfit)
@@ -5495,7 +5388,7 @@ def remove_superprompt_bias(superpromptresult = "", insanitylevel = 5, override_
         
         descriptorslist = csv_to_list("descriptors")
         descriptorslist = [x for x in descriptorslist if not x.startswith('-')]
-        newdescriptor = " " + random.choice(descriptorslist).lower() + " "
+        newdescriptor = " " + rng.choice(descriptorslist).lower() + " "
         #print(newdescriptor)
 
         superpromptresult = superpromptresult.replace(" sleek ", newdescriptor)
@@ -5505,7 +5398,7 @@ def remove_superprompt_bias(superpromptresult = "", insanitylevel = 5, override_
         
         backgroundlist = csv_to_list("backgrounds")
         backgroundlist = [x for x in backgroundlist if not x.startswith('-')]
-        newbackground = random.choice(backgroundlist).lower()
+        newbackground = rng.choice(backgroundlist).lower()
         #print(newbackground)
 
         superpromptresult = superpromptresult.replace("lush green meadow", newbackground)
@@ -5514,21 +5407,21 @@ def remove_superprompt_bias(superpromptresult = "", insanitylevel = 5, override_
         
         hairstylelist = csv_to_list("hairstyles2")
         hairstylelist = [x for x in hairstylelist if not x.startswith('-')]
-        newhairstyle = random.choice(hairstylelist).lower()
+        newhairstyle = rng.choice(hairstylelist).lower()
         #print(newhairstyle)
 
         superpromptresult = superpromptresult.replace("long, flowing hair", newhairstyle)
     
     return superpromptresult
 
-def replace_user_wildcards(completeprompt):
+def replace_user_wildcards(completeprompt, rng=random):
     for i in range(0,10):
         user_wildcards_list = re.findall(r'-[\w_]*-', completeprompt)
         for user_wildcard in user_wildcards_list:
             user_wildcard_clean = user_wildcard.strip("-")
             wordlist = csv_to_list(csvfilename=user_wildcard_clean, directory="./userfiles/wildcards/")
             if(wordlist):
-                completeprompt = completeprompt.replace(user_wildcard, random.choice(wordlist),1)
+                completeprompt = completeprompt.replace(user_wildcard, rng.choice(wordlist),1)
 
     return completeprompt
 
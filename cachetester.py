@@ -0,0 +1,41 @@
+import sys, os
+import contextlib
+sys.path.append(os.path.abspath(".."))
+
+
+from build_dynamic_prompt import *
+
+# Test for the prompt cache
+# Repeats the same seeded calls with the cache on, every repeat has to be a hit and give the same prompt as the first call.
+# The random preset rewrites userfiles/obp_presets.json on every call, that must not throw the cached prompts away.
+
+def testcache(repeats = 4, seed = 1234):
+
+    calls = [{"insanitylevel": 5, "seed": seed},
+             {"insanitylevel": 7, "imagetype": "artify mode", "seed": seed + 1},
+             {"OBP_preset": OBPresets.RANDOM_PRESET_OBP, "seed": seed + 2}]
+
+    enable_prompt_cache()
+    failures = 0
+    try:
+        for params in calls:
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                before = get_prompt_cache_stats()
+                results = [build_dynamic_prompt(**params) for i in range(repeats)]
+            stats = get_prompt_cache_stats()
+            hits = stats["hits"] - before["hits"]
+            differences = sum(1 for result in results if result != results[0])
+            print(str(params) + ": " + str(hits) + " hits out of " + str(repeats - 1) + " repeats, " + str(differences) + " different")
+            if(hits != repeats - 1 or differences > 0):
+                failures += 1
+    finally:
+        disable_prompt_cache()
+
+    print("")
+    if(failures == 0):
+        print("All done!")
+    else:
+        print(str(failures) + " calls did not hit the cache")
+
+if __name__ == "__main__":
+    testcache(4, 1234)
@@ -0,0 +1,90 @@
+import sys, os
+import time
+import json
+import contextlib
+import random
+sys.path.append(os.path.abspath(".."))
+
+
+from build_dynamic_prompt import *
+import build_dynamic_prompt as dynamicprompt
+
+# Test and benchmark for cleanup()
+# cleanuptester_golden.json holds inputs of cleanup() with the output they gave when it was recorded:
+# the input of every cleanup() call of a batch of prompts, plus strings made out of the pieces the cleanup rules look for,
+# so rules that run into each other are covered as well. cleanup() has to give exactly the same output for all of them.
+# Only record it again (python cleanuptester.py record) when the output of cleanup() is meant to change.
+
+GOLDEN_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cleanuptester_golden.json")
+
+def collectcleanupcalls(amount = 200):
+    # the input of every cleanup() call while building prompts
+    cleanupcalls = []
+    originalcleanup = dynamicprompt.cleanup
+    def recordcleanup(*args):
+        cleanupcalls.append(list(args))
+        return originalcleanup(*args)
+    dynamicprompt.cleanup = recordcleanup
+    try:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            for i in range(0, amount):
+                build_dynamic_prompt(insanitylevel=(i % 10) + 1, seed=i + 1, prompt_g_and_l=(i % 3 == 0))
+    finally:
+        dynamicprompt.cleanup = originalcleanup
+    return cleanupcalls
+
+def rulepiecescalls(amount = 400, seed = 1234):
+    # strings made out of what the rules look for and what they put back, with some words, spaces and punctuation
+    rng = random.Random(seed)
+    pieces = ["a", "e", "the", "art", "of", "2", "x", " ", "  ", ",", ".", ":", "(", ")", "[", "]", "|", "-", "DayGlo", "(:1.2)", "[red|blue]"]
+    for pattern, replacement in CLEANUP_RULES:
+        if(isinstance(pattern, str)):
+            pieces.append(pattern)
+            if(isinstance(replacement, str)):
+                pieces.append(replacement)
+    cleanupcalls = []
+    for i in range(0, amount):
+        text = "".join(rng.choice(pieces) for j in range(0, rng.randint(5, 40)))
+        cleanupcalls.append([text, i % 2 == 0, i % 10])
+    return cleanupcalls
+
+def recordgolden():
+    cleanupcalls = collectcleanupcalls() + rulepiecescalls()
+    golden = [[args, cleanup(*args)] for args in cleanupcalls]
+    with open(GOLDEN_FILE, "w", encoding="utf8") as file:
+        json.dump(golden, file, indent=0)
+    print("Recorded " + str(len(golden)) + " cleanups into " + GOLDEN_FILE)
+
+def testcleanup(rounds = 20):
+    with open(GOLDEN_FILE, "r", encoding="utf8") as file:
+        golden = json.load(file)
+
+    differences = 0
+    for args, expected in golden:
+        result = cleanup(*args)
+        if(result != expected):
+            differences += 1
+            print("DIFFERENT: " + repr(args[0]))
+            print("    expected: " + repr(expected))
+            print("    got:      " + repr(result))
+    print("")
+    print(str(len(golden)) + " cleanups, " + str(differences) + " different")
+
+    start = time.perf_counter()
+    for i in range(0, rounds):
+        for args, expected in golden:
+            cleanup(*args)
+    elapsed = time.perf_counter() - start
+    print("cleanup: " + str(round(elapsed / (rounds * len(golden)) * 1000000, 1)) + " microseconds per cleanup")
+
+    print("")
+    if(differences == 0):
+        print("All done!")
+    else:
+        print(str(differences) + " cleanups did not match the golden file")
+
+if __name__ == "__main__":
+    if(len(sys.argv) > 1 and sys.argv[1] == "record"):
+        recordgolden()
+    else:
+        testcleanup(20)
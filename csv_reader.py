@@ -1,32 +1,577 @@
 import csv
 import random
+import re
 import os
 import shutil
+import io
+import sys
+import json
+import mmap
+import struct
+import hashlib
+import threading
+from array import array
+from collections import namedtuple, UserList
 
-def random_read_from_csv(filename):
+# Thread safety
+# Everything cached in here is built under _corpus_lock, and never changed after it is stored.
+# Looking something up doesn't take the lock, only building it does, so threads can share one corpus.
+# frozen_corpus() and the lazy list stats are per thread. The csv cache stats are shared and counted under their own lock.
+_corpus_lock = threading.RLock()
+_thread_state = threading.local()
+
+# Corpus version
+# Changes whenever a list (.csv or .txt) in one of these directories is edited, added or removed.
+# Other files, like userfiles/obp_presets.json which is rewritten on a random preset, don't count.
+# Anything built from the corpus, and kept around longer than a single prompt, can use it to know when to rebuild.
+_CORPUS_VERSION_DIRECTORIES = ["./csvfiles/", "./csvfiles/special_lists/", "./csvfiles/templates/", "./csvfiles/config/", "./userfiles/"]
+
+def get_corpus_version():
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        stamps = []
+        for directory in _CORPUS_VERSION_DIRECTORIES:
+                try:
+                        entries = os.scandir(os.path.join(script_dir, directory))
+                except OSError:
+                        continue
+                with entries:
+                        for entry in entries:
+                                # the same files compile_corpus takes in
+                                if((entry.name.endswith(".csv") or entry.name.endswith(".txt")) and entry.is_file()):
+                                        filestat = entry.stat()
+                                        stamps.append((directory, entry.name, filestat.st_mtime_ns, filestat.st_size))
+        stamps.sort()
+        return hashlib.sha1(repr(stamps).encode("utf8")).hexdigest()
+
+def random_read_from_csv(filename, rng=random):
     script_dir = os.path.dirname(os.path.abspath(__file__))  # Script directory
     full_path = os.path.join(script_dir, "./csvfiles/" )
-    with open(full_path + filename + ".csv", "r",encoding="utf8") as csv_file:
-            csv_reader = csv.reader(csv_file)
-            output = (random.choice([line[0] for line in csv_reader]))
+    # the rows come from the parsed file cache, so the file is only read once
+    rows = _read_csv_rows(full_path + filename + ".csv", ",")
+    if(rows is None):
+        raise FileNotFoundError(full_path + filename + ".csv")
+    # same draw as random.choice() on the list of all rows
+    output = rng.choice(rows)[0]
     return output
 
-def add_from_csv(completeprompt, csvfilename, addcomma, prefix, suffix):
-        randomreadfromcsv = random_read_from_csv(csvfilename)
+def add_from_csv(completeprompt, csvfilename, addcomma, prefix, suffix, rng=random):
+        randomreadfromcsv = random_read_from_csv(csvfilename, rng)
         #print(csvfilename+ ": " + randomreadfromcsv)
         addtoprompt = prefix + " " + randomreadfromcsv + " " + suffix
         if(addcomma == 1):
                 return ", ".join([completeprompt,addtoprompt])
         return " ".join([completeprompt,addtoprompt])
 
-def csv_to_list(csvfilename, antilist=[], directory="./csvfiles/", lowerandstrip=0, delimiter=";", listoflistmode = False, skipheader = False, gender = "all", insanitylevel = -1):
+# Precompiled corpus
+# compile_corpus() turns every list in csvfiles/ and userfiles/ into one binary file, which is memory mapped on first use.
+# Rows are taken from there, and a csv file is only parsed when it no longer matches the manifest of the compiled corpus.
+# It is built on first use when it is missing, "python csv_reader.py" builds it again after lists were edited.
+#
+# Layout: "OBPC", format version (uint32), manifest length (uint32), manifest (json)
+# followed by the sections listed in the manifest, 4 byte aligned and little endian:
+#   string_offsets  uint32 start of every string in the string table, plus one closing offset
+#   fields          uint32 string id of every field of every row
+#   rows            uint32 offset into fields where every row starts, plus one closing offset
+#   strings         utf8 string table, every distinct value is stored once and closed with a \0
+#   bitmaps         one bit per artist in artists_and_category.csv, for every category column
+CORPUS_ARTIFACT_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "csvfiles", "compiled_corpus.obpc")
+_CORPUS_MAGIC = b"OBPC"
+_CORPUS_FORMAT_VERSION = 1
+_CORPUS_DIRECTORIES = ["./csvfiles/", "./userfiles/"]
+# every file is stored the way each of these delimiters splits it, identical results are only stored once
+_CORPUS_DELIMITERS = [";", "?", ","]
+_ARTIST_CATEGORY_FILE = "csvfiles/artists_and_category.csv"
+
+def _corpus_relative_path(file_path):
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        return os.path.relpath(os.path.normpath(file_path), script_dir).replace(os.sep, "/")
+
+def _uint32_bytes(values):
+        if(sys.byteorder != "little"):
+                values = array("I", values)
+                values.byteswap()
+        return values.tobytes()
+
+def compile_corpus(output_file=CORPUS_ARTIFACT_FILE):
+        global _compiled_corpus, _compiled_corpus_checked
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        strings = []
+        string_ids = {}
+        fields = array("I")
+        rows = array("I")
+        files = {}
+        bitmaps = bytearray()
+        artist_categories = {}
+        artist_categories_rows = 0
+
+        def store_rows(parsed_rows):
+                row_start = len(rows)
+                # the amount of fields when every row has the same amount, else 0
+                columns = len(parsed_rows[0]) if parsed_rows else 0
+                if(any(len(row) != columns for row in parsed_rows)):
+                        columns = 0
+                for row in parsed_rows:
+                        rows.append(len(fields))
+                        for value in row:
+                                string_id = string_ids.get(value)
+                                if(string_id is None):
+                                        string_id = len(strings)
+                                        string_ids[value] = string_id
+                                        strings.append(value.encode("utf8") + b"\0")
+                                fields.append(string_id)
+                return [row_start, len(rows), columns]
+
+        for directory in _CORPUS_DIRECTORIES:
+                for root, dirnames, filenames in os.walk(os.path.join(script_dir, directory)):
+                        dirnames.sort()
+                        for filename in sorted(filenames):
+                                if(not filename.endswith(".csv") and not filename.endswith(".txt")):
+                                        continue
+                                file_path = os.path.join(root, filename)
+                                with open(file_path, "rb") as file:
+                                        data = file.read()
+                                try:
+                                        text = data.decode("utf8")
+                                except UnicodeDecodeError:
+                                        # csv_to_list can't read these either
+                                        continue
+                                relpath = _corpus_relative_path(file_path)
+
+                                tables = {}
+                                parsed = {}
+                                for delimiter in _CORPUS_DELIMITERS:
+                                        parsed[delimiter] = [tuple(row) for row in csv.reader(io.StringIO(text, newline=""), delimiter=delimiter)]
+                                        for earlierdelimiter in tables:
+                                                if(parsed[earlierdelimiter] == parsed[delimiter]):
+                                                        tables[delimiter] = tables[earlierdelimiter]
+                                                        break
+                                        else:
+                                                tables[delimiter] = store_rows(parsed[delimiter])
+
+                                files[relpath] = {"size": len(data), "mtime_ns": os.stat(file_path).st_mtime_ns, "sha1": hashlib.sha1(data).hexdigest(), "tables": tables}
+
+                                if(relpath == _ARTIST_CATEGORY_FILE and parsed[","]):
+                                        header = parsed[","][0]
+                                        artistrows = parsed[","][1:]
+                                        for column, category in enumerate(header):
+                                                bitmap = bytearray((len(artistrows) + 7) // 8)
+                                                for index, row in enumerate(artistrows):
+                                                        if(column < len(row) and row[column] == "1"):
+                                                                bitmap[index >> 3] |= 1 << (index & 7)
+                                                artist_categories[category] = [len(bitmaps), len(bitmap)]
+                                                bitmaps += bitmap
+                                        artist_categories_rows = len(artistrows)
+
+        rows.append(len(fields))
+        string_offsets = array("I", [0])
+        for value in strings:
+                string_offsets.append(string_offsets[-1] + len(value))
+
+        sections = {}
+        data = bytearray()
+        for name, content in [("string_offsets", _uint32_bytes(string_offsets)), ("fields", _uint32_bytes(fields)), ("rows", _uint32_bytes(rows)), ("strings", b"".join(strings)), ("bitmaps", bytes(bitmaps))]:
+                sections[name] = [len(data), len(content)]
+                data += content
+                data += b"\0" * (-len(data) % 4)
+
+        manifest = {"sections": sections, "files": files}
+        if(artist_categories):
+                manifest["artist_categories"] = {"rows": artist_categories_rows, "columns": artist_categories}
+        manifestbytes = json.dumps(manifest).encode("utf8")
+        header = struct.pack("<4sII", _CORPUS_MAGIC, _CORPUS_FORMAT_VERSION, len(manifestbytes)) + manifestbytes
+        header += b"\0" * (-len(header) % 4)
+
+        # write next to it first, and only replace it once it is complete
+        # the temporary file is per process, so workers that build it on first load at the same moment don't write into each other's
+        temp_file = output_file + "." + str(os.getpid()) + ".tmp"
+        with open(temp_file, "wb") as file:
+                file.write(header)
+                file.write(data)
+        with _corpus_lock:
+                # a mapped file can't be replaced on Windows, so unmap the one this process uses first
+                # everything that reads from the compiled corpus does so under _corpus_lock, so no one is using it now
+                if(_compiled_corpus is not None):
+                        _compiled_corpus.close()
+                _compiled_corpus = None
+                _compiled_corpus_checked = False
+                try:
+                        os.replace(temp_file, output_file)
+                except OSError:
+                        # still mapped by another process (Windows), close that one and compile again
+                        os.remove(temp_file)
+                        raise
+
+                # start using the new one
+                clear_csv_cache()
+        print("Compiled " + str(len(files)) + " files into " + output_file)
+        return output_file
+
+class _CompiledCorpus:
+        def __init__(self, file_path):
+                with open(file_path, "rb") as file:
+                        self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                magic, version, manifestlength = struct.unpack_from("<4sII", self._mmap, 0)
+                if(magic != _CORPUS_MAGIC or version != _CORPUS_FORMAT_VERSION):
+                        raise ValueError("not a compiled corpus of this version: " + file_path)
+                self.manifest = json.loads(self._mmap[12:12 + manifestlength].decode("utf8"))
+                datastart = 12 + manifestlength + (-(12 + manifestlength) % 4)
+                view = memoryview(self._mmap)
+                sections = {name: view[datastart + start:datastart + start + length] for name, (start, length) in self.manifest["sections"].items()}
+                self._string_offsets = self._uint32_section(sections["string_offsets"])
+                self._fields = self._uint32_section(sections["fields"])
+                self._rows = self._uint32_section(sections["rows"])
+                self._strings = sections["strings"]
+                self._string_table = None
+                self._bitmaps = sections["bitmaps"]
+                # (relpath, mtime, size) of source files that have been checked against the manifest
+                self._verified = {}
+
+        def close(self):
+                # drops the views on the file and unmaps it, call it under _corpus_lock
+                for section in [self._string_offsets, self._fields, self._rows, self._strings, self._bitmaps]:
+                        if(isinstance(section, memoryview)):
+                                section.release()
+                try:
+                        self._mmap.close()
+                except BufferError:
+                        # someone outside of csv_reader still holds a view on it, it is unmapped when that one is gone
+                        pass
+
+        def _uint32_section(self, section):
+                if(sys.byteorder == "little"):
+                        return section.cast("I")
+                values = array("I", section.tobytes())
+                values.byteswap()
+                return values
+
+        def _matches_source(self, relpath, entry, file_path):
+                filestat = os.stat(file_path)
+                if(filestat.st_size == entry["size"] and filestat.st_mtime_ns == entry["mtime_ns"]):
+                        return True
+                # touched since it was compiled, only a changed hash means we can't use it
+                key = (relpath, filestat.st_mtime_ns, filestat.st_size)
+                if(key not in self._verified):
+                        with open(file_path, "rb") as file:
+                                self._verified[key] = hashlib.sha1(file.read()).hexdigest() == entry["sha1"]
+                return self._verified[key]
+
+        def rows(self, file_path, delimiter):
+                relpath = _corpus_relative_path(file_path)
+                entry = self.manifest["files"].get(relpath)
+                if(entry is None or delimiter not in entry["tables"]):
+                        return None
+                if(not self._matches_source(relpath, entry, file_path)):
+                        return None
+                rowstart, rowend, columns = entry["tables"][delimiter]
+                if(rowstart == rowend):
+                        return []
+                stringtable = self._get_string_table()
+                fieldstart = self._rows[rowstart]
+                fieldend = self._rows[rowend]
+                values = list(map(stringtable.__getitem__, self._fields[fieldstart:fieldend]))
+                if(columns > 0):
+                        # every row has the same amount of fields, most lists are like that
+                        return list(zip(*[iter(values)] * columns))
+                rowoffsets = self._rows[rowstart:rowend + 1].tolist()
+                return [tuple(values[rowoffsets[i] - fieldstart:rowoffsets[i + 1] - fieldstart]) for i in range(rowend - rowstart)]
+
+        def _get_string_table(self):
+                # decoded once, on the first table that is read
+                if(self._string_table is None):
+                        stringtable = str(self._strings, "utf8").split("\0")[:-1]
+                        if(len(stringtable) != len(self._string_offsets) - 1):
+                                # a value with a \0 in it, go by the offsets instead
+                                offsets = self._string_offsets
+                                stringtable = [str(self._strings[offsets[i]:offsets[i + 1] - 1], "utf8") for i in range(len(offsets) - 1)]
+                        self._string_table = stringtable
+                return self._string_table
+
+        def artist_category_bitmap(self, category):
+                # returns the amount of artists, and a bitmap with a bit set for every artist in this category
+                artistcategories = self.manifest.get("artist_categories")
+                if(artistcategories is None or category not in artistcategories["columns"]):
+                        return None
+                entry = self.manifest["files"][_ARTIST_CATEGORY_FILE]
+                if(not self._matches_source(_ARTIST_CATEGORY_FILE, entry, os.path.join(os.path.dirname(os.path.abspath(__file__)), _ARTIST_CATEGORY_FILE))):
+                        return None
+                start, length = artistcategories["columns"][category]
+                return artistcategories["rows"], self._bitmaps[start:start + length]
+
+_compiled_corpus = None
+_compiled_corpus_checked = False
+
+def get_compiled_corpus():
+        # loads the compiled corpus once, and builds it first when it is missing
+        # None when it can't be built (read only install) or is unusable, then the csv files are read instead
+        global _compiled_corpus, _compiled_corpus_checked
+        if(_compiled_corpus_checked == False):
+                with _corpus_lock:
+                        if(_compiled_corpus_checked == False):
+                                if(not os.path.isfile(CORPUS_ARTIFACT_FILE)):
+                                        try:
+                                                compile_corpus(CORPUS_ARTIFACT_FILE)
+                                        except (OSError, csv.Error) as error:
+                                                print("Could not build the compiled corpus, reading the csv files instead: " + str(error))
+                                if(os.path.isfile(CORPUS_ARTIFACT_FILE)):
+                                        try:
+                                                _compiled_corpus = _CompiledCorpus(CORPUS_ARTIFACT_FILE)
+                                        except (OSError, ValueError) as error:
+                                                print("Could not load the compiled corpus, reading the csv files instead: " + str(error))
+                                                _compiled_corpus = None
+                                _compiled_corpus_checked = True
+        return _compiled_corpus
+
+# Parsed rows of every file read through csv_to_list, kept for the lifetime of the process.
+# key: (full file path, delimiter, skipheader) -> (mtime, size, rows)
+# An entry is only reused when the file on disk still has the same mtime and size.
+_csv_rows_cache = {}
+_csv_cache_stats = {"hits": 0, "misses": 0, "compiled": 0, "viewhits": 0, "viewmisses": 0}
+_csv_cache_stats_lock = threading.Lock()
+
+def _count_csv_cache(stat):
+        # its own lock, so threads counting a hit at the same moment don't lose one
+        with _csv_cache_stats_lock:
+                _csv_cache_stats[stat] += 1
+
+# Frozen corpus
+# Within "with frozen_corpus():" files and directories that are already cached are not checked for changes again.
+# For batches, where the corpus is checked once up front instead of for every list of every prompt.
+# Only for the thread that entered it, other threads keep checking.
+class frozen_corpus:
+        def __enter__(self):
+                _thread_state.frozen = getattr(_thread_state, "frozen", 0) + 1
+                return self
+
+        def __exit__(self, exc_type, exc_value, traceback):
+                _thread_state.frozen -= 1
+                return False
+
+def _corpus_is_frozen():
+        return getattr(_thread_state, "frozen", 0) > 0
+
+def _read_csv_rows(file_path, delimiter=";", skipheader=False):
+        # returns None when there is no such file
+        key = (file_path, delimiter, skipheader)
+        if(_corpus_is_frozen()):
+                cached = _csv_rows_cache.get(key)
+                if(cached is not None):
+                        _count_csv_cache("hits")
+                        return cached[2]
+        try:
+                filestat = os.stat(file_path)
+        except OSError:
+                return None
+        cached = _csv_rows_cache.get(key)
+        if(cached is not None and cached[0] == filestat.st_mtime_ns and cached[1] == filestat.st_size):
+                _count_csv_cache("hits")
+                return cached[2]
+
+        with _corpus_lock:
+                # another thread may have read it while this one waited
+                cached = _csv_rows_cache.get(key)
+                if(cached is not None and cached[0] == filestat.st_mtime_ns and cached[1] == filestat.st_size):
+                        _count_csv_cache("hits")
+                        return cached[2]
+                _count_csv_cache("misses")
+                rows = None
+                compiledcorpus = get_compiled_corpus()
+                if(compiledcorpus is not None):
+                        rows = compiledcorpus.rows(file_path, delimiter)
+                if(rows is not None):
+                        _count_csv_cache("compiled")
+                        if(skipheader==True):
+                                rows = rows[1:]
+                else:
+                        with open(file_path, "r", newline="",encoding="utf8") as file:
+                                reader = csv.reader(file, delimiter=delimiter)
+                                if(skipheader==True):
+                                        next(reader)
+                                rows = [tuple(row) for row in reader]
+                rows = _CsvRows(rows)
+                _csv_rows_cache[key] = (filestat.st_mtime_ns, filestat.st_size, rows)
+        return rows
+
+class _CsvRows(list):
+        # the parsed rows of one file, plus the lowercased and stripped first value of every row
+        # the antilist and the deduplication compare against these, so they are made only once per file
+        _lowerkeys = None
+
+        def lowerkeys(self):
+                if(self._lowerkeys is None):
+                        self._lowerkeys = [row[0].lower().strip() if row else None for row in self]
+                return self._lowerkeys
+
+def get_csv_cache_stats():
+        # compiled: misses that were served from the compiled corpus instead of parsing the csv file
+        # viewhits/viewmisses: csv_to_list calls that could or couldn't reuse an already filtered list
+        with _csv_cache_stats_lock:
+                return {"hits": _csv_cache_stats["hits"], "misses": _csv_cache_stats["misses"], "compiled": _csv_cache_stats["compiled"], "files": len(_csv_rows_cache),
+                        "viewhits": _csv_cache_stats["viewhits"], "viewmisses": _csv_cache_stats["viewmisses"], "views": len(_filtered_views)}
+
+def clear_csv_cache():
+        global _artist_rewriter, _negative_word_table
+        with _corpus_lock:
+                _csv_rows_cache.clear()
+                _filtered_views.clear()
+                _antilist_cache.clear()
+                _directory_indexes.clear()
+                _artist_category_indexes.clear()
+                _artist_rewriter = None
+                _negative_word_table = None
+                _config_cache.clear()
+                with _csv_cache_stats_lock:
+                        for stat in _csv_cache_stats:
+                                _csv_cache_stats[stat] = 0
+
+# Filtered views
+# The deduplicated result of csv_to_list, for every list + gender + lowerandstrip + antilist combination that was asked for.
+# key: (file path, directory, delimiter, skipheader, lowerandstrip, gender, antilist) -> (source rows, values)
+# A view is only reused while its source rows are still the ones in the parsed file cache.
+_filtered_views = {}
+_FILTERED_VIEWS_MAX = 4096
+_antilist_cache = {}
+_ANTILIST_CACHE_MAX = 64
+
+def _file_stamp(file_path):
+        try:
+                filestat = os.stat(file_path)
+        except OSError:
+                return None
+        return (filestat.st_mtime_ns, filestat.st_size)
+
+def build_antilist(antivalues=""):
+        # the complete antilist: userfiles/antilist.csv plus the comma separated antivalues string
+        # returned as a frozenset of lowercased and stripped values, which csv_to_list takes as is
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        antilistfile = os.path.join(script_dir, "./userfiles/", "antilist")
+        key = (antivalues, _file_stamp(antilistfile + ".csv"), _file_stamp(antilistfile + ".txt"))
+        antilist = _antilist_cache.get(key)
+        if(antilist is None):
+                antilist = csv_to_list("antilist", [], "./userfiles/", 1) + antivalues.split(",")
+                antilist = frozenset(s.strip().lower() for s in antilist)
+                with _corpus_lock:
+                        if(len(_antilist_cache) >= _ANTILIST_CACHE_MAX):
+                                _antilist_cache.clear()
+                        _antilist_cache[key] = antilist
+        return antilist
+
+def _rows_to_list(rows, antilist, lowerandstrip, gender):
+        csvlist = []
+        for row, lowerkey in zip(rows, rows.lowerkeys()):
+                value = row[0]
+                if( 
+                        gender != "all" and (row[1] == gender or row[1] == "genderless" or row[1] == "both")
+                        or gender == "all"
+                        ):
+                        if(lowerkey not in antilist):
+                                if(lowerandstrip == 1):
+                                        csvlist.append(lowerkey)        
+                                else:
+                                        csvlist.append(value)
+        return csvlist
+
+# Directory index
+# For every directory csv_to_list looks in: list name -> the files of that list in there
+# eg "colors" -> {"csv", "replace", "addon"} when colors.csv, colors_replace.csv and colors_addon.csv exist
+# Rebuilt when the mtime of the directory changes, which happens when a file is added, removed or renamed.
+_directory_indexes = {}
+_LIST_VARIANTS = ["_replace", "_addon", "_light", "_medium"]
+
+def _directory_index(directory_path):
+        if(_corpus_is_frozen()):
+                cached = _directory_indexes.get(directory_path)
+                if(cached is not None):
+                        return cached[1]
+        try:
+                mtime = os.stat(directory_path).st_mtime_ns
+        except OSError:
+                return {}
+        cached = _directory_indexes.get(directory_path)
+        if(cached is not None and cached[0] == mtime):
+                return cached[1]
+
+        # made in full before it is stored, a thread that reads it never sees half an index
+        index = {}
+        for filename in os.listdir(directory_path):
+                name, extension = os.path.splitext(filename)
+                if(extension != ".csv" and extension != ".txt"):
+                        continue
+                index.setdefault(name, set()).add(extension[1:])
+                if(extension == ".csv"):
+                        for variant in _LIST_VARIANTS:
+                                if(name.endswith(variant)):
+                                        index.setdefault(name[:-len(variant)], set()).add(variant[1:])
+        _directory_indexes[directory_path] = (mtime, index)
+        return index
+
+def _list_files(directory_path, csvfilename):
+        return _directory_index(directory_path).get(csvfilename, ())
+
+# Lazy lists
+# csv_to_list(..., lazy=True) decides which file to use straight away, as that may use the random generator.
+# Loading and filtering the list only happens on first use, build_dynamic_prompt loads most of its lists this way.
+# The stats are kept per thread.
+def _lazy_list_stats():
+        stats = getattr(_thread_state, "lazyliststats", None)
+        if(stats is None):
+                stats = {"lists": 0, "materialized": 0, "probed": 0, "loaded": []}
+                _thread_state.lazyliststats = stats
+        return stats
+
+class LazyCsvList(UserList):
+        def __init__(self, initlist=None, name="", loader=None, probe=None):
+                self.name = name
+                self._loader = loader
+                self._probe = probe
+                self._data = None
+                if(loader is None):
+                        self._data = list(initlist) if initlist is not None else []
+                else:
+                        _lazy_list_stats()["lists"] += 1
+
+        @property
+        def data(self):
+                if(self._data is None):
+                        self._data = self._loader()
+                        self._loader = None
+                        self._probe = None
+                        stats = _lazy_list_stats()
+                        stats["materialized"] += 1
+                        stats["loaded"].append(self.name)
+                return self._data
+
+        @data.setter
+        def data(self, value):
+                self._data = value
+                self._loader = None
+                self._probe = None
+
+        def __bool__(self):
+                # checking a generate* flag only needs to know if any value gets past the filters, that doesn't load the list
+                if(self._data is None and self._probe is not None):
+                        _lazy_list_stats()["probed"] += 1
+                        return self._probe()
+                return bool(self.data)
+
+        def __iter__(self):
+                return iter(self.data)
+
+        def is_loaded(self):
+                return self._data is not None
+
+def reset_lazy_list_stats():
+        _thread_state.lazyliststats = None
+
+def get_lazy_list_stats():
+        # lists: lazy lists made since the last reset, materialized: how many of them were actually loaded, loaded: their names
+        # probed: emptiness checks that were answered without loading
+        # all of it for the lists of the calling thread
+        stats = _lazy_list_stats()
+        return {"lists": stats["lists"], "materialized": stats["materialized"], "probed": stats["probed"], "loaded": list(stats["loaded"])}
+
+def csv_to_list(csvfilename, antilist=[], directory="./csvfiles/", lowerandstrip=0, delimiter=";", listoflistmode = False, skipheader = False, gender = "all", insanitylevel = -1, lazy = False, rng=random):
         replacing = False
         userfilesdirectory = "./userfiles/"
-        userfileaddonname = csvfilename + "_addon.csv"
-        userfilereplacename = csvfilename + "_replace.csv"
-        lightfilename = csvfilename + "_light.csv"
-        mediumfilename = csvfilename + "_medium.csv"
-        csvlist = []
         script_dir = os.path.dirname(os.path.abspath(__file__))
         full_path = os.path.join(script_dir, directory )
         userfilesfolder = os.path.join(script_dir, userfilesdirectory )
@@ -34,147 +579,253 @@ def csv_to_list(csvfilename, antilist=[], directory="./csvfiles/", lowerandstrip
         
         # check if there is a replace file
         if(directory=="./csvfiles/" or directory=="./csvfiles/special_lists/" or directory=="./csvfiles/templates/"):      
-                for filename in os.listdir(userfilesfolder):
-                        if(filename == userfilereplacename):
-                                # Just override the parameters, and let it run normally
-                                full_path = os.path.join(script_dir, userfilesdirectory )
-                                csvfilename = csvfilename + "_replace"
-                                replacing = True
+                if("replace" in _list_files(userfilesfolder, csvfilename)):
+                        # Just override the parameters, and let it run normally
+                        full_path = os.path.join(script_dir, userfilesdirectory )
+                        csvfilename = csvfilename + "_replace"
+                        replacing = True
 
 
                 # Go check for light or medium files if there is no override and there is an insanitylevel
                 if(replacing == False and insanitylevel > 0):
+                        directoryfiles = _list_files(directoryfilesfolder, csvfilename)
                         if(insanitylevel < 4):   
-                                for filename in os.listdir(directoryfilesfolder):
-                                        if(filename == mediumfilename):
-                                                # Just override the parameters, and let it run normally
-                                                full_path = os.path.join(script_dir, directory )
-                                                csvfilename = csvfilename + "_light"
-                                                replacing = True
+                                if("medium" in directoryfiles):
+                                        # Just override the parameters, and let it run normally
+                                        full_path = os.path.join(script_dir, directory )
+                                        csvfilename = csvfilename + "_light"
+                                        replacing = True
                         # under 7, than only SOMETIMES take the full list
-                        if(insanitylevel < 7 and random.randint(0,13) < 12 and replacing == False):   
-                                for filename in os.listdir(directoryfilesfolder):
-                                        if(filename == lightfilename):
-                                                # Just override the parameters, and let it run normally
-                                                full_path = os.path.join(script_dir, directory )
-                                                csvfilename = csvfilename + "_medium"
-                                                replacing = True
+                        if(insanitylevel < 7 and rng.randint(0,13) < 12 and replacing == False):   
+                                if("light" in directoryfiles):
+                                        # Just override the parameters, and let it run normally
+                                        full_path = os.path.join(script_dir, directory )
+                                        csvfilename = csvfilename + "_medium"
+                                        replacing = True
                         
                         
 
+        if(lazy == True and listoflistmode == False):
+                return LazyCsvList(name=csvfilename,
+                                   loader=lambda: _load_csv_list(full_path, csvfilename, directory, userfilesfolder, antilist, lowerandstrip, delimiter, listoflistmode, skipheader, gender),
+                                   probe=lambda: _csv_list_has_values(full_path, csvfilename, directory, userfilesfolder, antilist, delimiter, skipheader, gender))
+        return _load_csv_list(full_path, csvfilename, directory, userfilesfolder, antilist, lowerandstrip, delimiter, listoflistmode, skipheader, gender)
+
+def _csv_list_sources(full_path, csvfilename, directory, userfilesfolder, delimiter, skipheader):
         # return empty list if we can't find the file. Build for antilist.csv
-        if(os.path.isfile(full_path + csvfilename + ".csv")):
-                with open(full_path + csvfilename + ".csv", "r", newline="",encoding="utf8") as file:
-                        reader = csv.reader(file, delimiter=delimiter)
-                        if(skipheader==True):
-                                next(reader)
-                        if(listoflistmode==True):
-                                csvlist = list(reader)
-                        else:
-                                for row in reader:
-                                        value = row[0]
-                                        if( 
-                                                gender != "all" and (row[1] == gender or row[1] == "genderless" or row[1] == "both")
-                                                or gender == "all"
-                                                ):
-                                                if(value.lower().strip() not in antilist):
-                                                        if(lowerandstrip == 1):
-                                                                csvlist.append(row[0].lower().strip())        
-                                                        else:
-                                                                csvlist.append(row[0])
+        # rows come from the parsed file cache, so only the filtering is done per call
+        csvrows = _read_csv_rows(full_path + csvfilename + ".csv", delimiter, skipheader)
         # dirty hack for possible .txt files
-        if(os.path.isfile(full_path + csvfilename + ".txt")):
-                with open(full_path + csvfilename + ".txt", "r", newline="",encoding="utf8") as file:
-                        reader = csv.reader(file, delimiter=delimiter)
-                        if(skipheader==True):
-                                next(reader)
-                        if(listoflistmode==True):
-                                csvlist = list(reader)
-                        else:
-                                for row in reader:
-                                        value = row[0]
-                                        if( 
-                                                gender != "all" and (row[1] == gender or row[1] == "genderless" or row[1] == "both")
-                                                or gender == "all"
-                                                ):
-                                                if(value.lower().strip() not in antilist):
-                                                        if(lowerandstrip == 1):
-                                                                csvlist.append(row[0].lower().strip())        
-                                                        else:
-                                                                csvlist.append(row[0])
-
+        txtrows = None
+        if("txt" in _list_files(full_path, csvfilename)):
+                txtrows = _read_csv_rows(full_path + csvfilename + ".txt", delimiter, skipheader)
         # do the add ons!
-        if(directory=="./csvfiles/" or directory=="./csvfiles/special_lists/"):
-                if(os.path.isfile(userfilesfolder + csvfilename + "_addon" + ".csv")):
-                        with open(userfilesfolder + csvfilename + "_addon" + ".csv", "r", newline="",encoding="utf8") as file:
-                                reader = csv.reader(file, delimiter=delimiter)
-                                if(skipheader==True):
-                                        next(reader)
-                                if(listoflistmode==True):
-                                        csvlist.append(list(reader))
-                                else:
-                                        for row in reader:
-                                                value = row[0]
-                                                if( 
-                                                gender != "all" and (row[1] == gender or row[1] == "genderless" or row[1] == "both")
-                                                or gender == "all"
-                                                ):
-                                                        if(value.lower().strip() not in antilist):
-                                                                if(lowerandstrip == 1):
-                                                                        csvlist.append(row[0].lower().strip())        
-                                                                else:
-                                                                        csvlist.append(row[0])
+        addonrows = None
+        if((directory=="./csvfiles/" or directory=="./csvfiles/special_lists/") and "addon" in _list_files(userfilesfolder, csvfilename)):
+                addonrows = _read_csv_rows(userfilesfolder + csvfilename + "_addon" + ".csv", delimiter, skipheader)
+        return csvrows, txtrows, addonrows
+
+def _csv_list_has_values(full_path, csvfilename, directory, userfilesfolder, antilist, delimiter, skipheader, gender):
+        # same filter as _rows_to_list, but stops at the first value that gets through
+        if(not isinstance(antilist, frozenset)):
+                antilist = frozenset(antilist)
+        for rows in _csv_list_sources(full_path, csvfilename, directory, userfilesfolder, delimiter, skipheader):
+                if(rows is not None):
+                        for row, lowerkey in zip(rows, rows.lowerkeys()):
+                                if((gender == "all" or row[1] == gender or row[1] == "genderless" or row[1] == "both") and lowerkey not in antilist):
+                                        return True
+        return False
+
+def _load_csv_list(full_path, csvfilename, directory, userfilesfolder, antilist, lowerandstrip, delimiter, listoflistmode, skipheader, gender):
+        csvlist = []
+        csvrows, txtrows, addonrows = _csv_list_sources(full_path, csvfilename, directory, userfilesfolder, delimiter, skipheader)
+
+        if(listoflistmode==True):
+                if(csvrows is not None):
+                        csvlist = [list(row) for row in csvrows]
+                if(txtrows is not None):
+                        csvlist = [list(row) for row in txtrows]
+                if(addonrows is not None):
+                        csvlist.append([list(row) for row in addonrows])
+                return csvlist
+
+        # the antilist is compared as a set, build_antilist() already gives one
+        if(not isinstance(antilist, frozenset)):
+                antilist = frozenset(antilist)
+
+        sources = (csvrows, txtrows, addonrows)
+        viewkey = (full_path + csvfilename, directory, delimiter, skipheader, lowerandstrip, gender, antilist)
+        cached = _filtered_views.get(viewkey)
+        if(cached is not None and all(cachedrows is rows for cachedrows, rows in zip(cached[0], sources))):
+                _count_csv_cache("viewhits")
+                return list(cached[1])
+        _count_csv_cache("viewmisses")
 
+        for rows in sources:
+                if(rows is not None):
+                        csvlist += _rows_to_list(rows, antilist, lowerandstrip, gender)
 
         # remove duplicates, but check only for lowercase stuff
         deduplicated_list = []
         lowercase_elements = set()
-        if(listoflistmode==False):
-                for element in csvlist:
-                        lowercase_element = element.lower()
-                        if lowercase_element not in lowercase_elements:
-                                lowercase_elements.add(lowercase_element)
-                                deduplicated_list.append(element)
-        else:
-                deduplicated_list = csvlist
-        
+        for element in csvlist:
+                lowercase_element = element.lower()
+                if lowercase_element not in lowercase_elements:
+                        lowercase_elements.add(lowercase_element)
+                        deduplicated_list.append(element)
+
+        with _corpus_lock:
+                if(len(_filtered_views) >= _FILTERED_VIEWS_MAX):
+                        _filtered_views.clear()
+                _filtered_views[viewkey] = (sources, tuple(deduplicated_list))
         return deduplicated_list
 
-def artist_category_by_category_csv_to_list(csvfilename,artist):
-        csvlist = []
-        mediumlist = []
-        descriptionlist = []
+# Artist category index
+# artists_and_category.csv is read once into the list of artists, and per category column a bitmap of the artists in it.
+# The bitmaps are python ints, bit n is the nth artist, so combining categories is a single & or |.
+class ArtistCategoryIndex:
+        def __init__(self, rows, bitmaps=None):
+                # rows: the parsed csv file, header included. bitmaps: category -> (artists, bitmap bytes), from the compiled corpus
+                header = rows[0]
+                # csv.DictReader skips empty lines, the artists are numbered the same way
+                records = [row for row in rows[1:] if row]
+                # like the dict of a DictReader row: a later column with the same name wins, a missing value is None
+                columns = {category: column for column, category in enumerate(header)}
+                def values(category):
+                        column = columns[category]
+                        return tuple(row[column] if column < len(row) else None for row in records)
+                self.artists = values("Artist")
+                self.tags = values("Tags")
+                self.mediums = values("Medium")
+                self.descriptions = values("Description")
+                # artist -> the (tags, medium, description) of every row of that artist
+                self.records = {}
+                for artist, tags, medium, description in zip(self.artists, self.tags, self.mediums, self.descriptions):
+                        self.records.setdefault(artist, []).append((tags, medium, description))
+                self._bitmaps = {}
+                self._categories = {}
+                for column, category in enumerate(header):
+                        bitmap = None
+                        if(bitmaps is not None and len(records) == len(rows) - 1 and category in bitmaps and bitmaps[category][0] == len(self.artists)):
+                                bitmap = int.from_bytes(bitmaps[category][1], "little")
+                        if(bitmap is None):
+                                bitmap = 0
+                                for index, row in enumerate(records):
+                                        if(column < len(row) and row[column] == "1"):
+                                                bitmap |= 1 << index
+                        self._bitmaps[category] = bitmap
+
+        def artist_record(self, artist):
+                # (tags, medium, description) of the artist, None when it isn't in the file
+                records = self.records.get(artist)
+                if(records is None):
+                        return None
+                return records[0]
+
+        def categories(self):
+                return list(self._bitmaps)
+
+        def bitmap(self, category):
+                return self._bitmaps[category]
+
+        def artists_in_bitmap(self, bitmap):
+                # walks the set bits only, in file order
+                artistlist = []
+                while(bitmap):
+                        lowestbit = bitmap & -bitmap
+                        artistlist.append(self.artists[lowestbit.bit_length() - 1])
+                        bitmap ^= lowestbit
+                return artistlist
+
+        def category(self, category):
+                # the artists with a 1 in this category column, raises a KeyError for an unknown category
+                artistlist = self._categories.get(category)
+                if(artistlist is None):
+                        artistlist = tuple(self.artists_in_bitmap(self._bitmaps[category]))
+                        self._categories[category] = artistlist
+                return list(artistlist)
+
+        def query(self, categories, mode="and"):
+                # the artists in all ("and") or any ("or") of the categories, eg query(["fantasy", "portrait"])
+                bitmap = None
+                for category in categories:
+                        if(bitmap is None):
+                                bitmap = self._bitmaps[category]
+                        elif(mode == "and"):
+                                bitmap &= self._bitmaps[category]
+                        else:
+                                bitmap |= self._bitmaps[category]
+                if(bitmap is None):
+                        return []
+                return self.artists_in_bitmap(bitmap)
+
+_artist_category_indexes = {}
+
+def get_artist_category_index(csvfilename="artists_and_category"):
+        # rebuilt only when the parsed rows of the file change
         script_dir = os.path.dirname(os.path.abspath(__file__))
-        full_path = os.path.join(script_dir, "./csvfiles/" )
-        with open(full_path + csvfilename + ".csv", "r", newline="",encoding="utf8") as file:
-                reader = csv.DictReader(file, delimiter=",")
-                for row in reader:
-                        if(row["Artist"] == artist):
-                                csvlist.append(row["Tags"])
-                                mediumlist.append(row["Medium"])
-                                descriptionlist.append(row["Description"])
-        return csvlist, mediumlist, descriptionlist
+        file_path = os.path.join(script_dir, "./csvfiles/" ) + csvfilename + ".csv"
+        rows = _read_csv_rows(file_path, ",")
+        if(rows is None):
+                raise FileNotFoundError(file_path)
+        cached = _artist_category_indexes.get(csvfilename)
+        if(cached is not None and cached[0] is rows):
+                return cached[1]
+
+        with _corpus_lock:
+                cached = _artist_category_indexes.get(csvfilename)
+                if(cached is not None and cached[0] is rows):
+                        return cached[1]
+                bitmaps = None
+                compiledcorpus = get_compiled_corpus()
+                if(compiledcorpus is not None and _corpus_relative_path(file_path) == _ARTIST_CATEGORY_FILE and rows):
+                        bitmaps = {}
+                        for category in rows[0]:
+                                bitmap = compiledcorpus.artist_category_bitmap(category)
+                                if(bitmap is not None):
+                                        bitmaps[category] = bitmap
+                artistcategoryindex = ArtistCategoryIndex(rows, bitmaps)
+                _artist_category_indexes[csvfilename] = (rows, artistcategoryindex)
+        return artistcategoryindex
 
 def artist_category_csv_to_list(csvfilename,category):
-        csvlist = []
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        full_path = os.path.join(script_dir, "./csvfiles/" )
-        with open(full_path + csvfilename + ".csv", "r", newline="",encoding="utf8") as file:
-                reader = csv.DictReader(file, delimiter=",")
-                for row in reader:
-                        if(row[category] == "1"):
-                                csvlist.append(row["Artist"])
-        return csvlist
+        return get_artist_category_index(csvfilename).category(category)
+
+def artist_category_by_category_csv_to_list(csvfilename,artist):
+        records = get_artist_category_index(csvfilename).records.get(artist, [])
+        csvlist = [tags for tags, medium, description in records]
+        mediumlist = [medium for tags, medium, description in records]
+        descriptionlist = [description for tags, medium, description in records]
+        return csvlist, mediumlist, descriptionlist
 
 def artist_descriptions_csv_to_list(csvfilename):
-        csvlist = []
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        full_path = os.path.join(script_dir, "./csvfiles/" )
-        with open(full_path + csvfilename + ".csv", "r", newline="",encoding="utf8") as file:
-                reader = csv.DictReader(file, delimiter=",")
-                for row in reader:
-                        csvlist.append(row["Description"])
-        return csvlist
+        return list(get_artist_category_index(csvfilename).descriptions)
+
+# Template store
+# templates.csv and styles.csv, split once.
+# The templates are grouped per (subject type, environment, source) filter the first time that filter is asked for,
+# so picking a template is a single choice out of a ready list of (prompt, creator, subject).
+class TemplateStore:
+        def __init__(self, templatelist, styleslist):
+                # templatelist: rows of prompt;creator;source;subject type;subject. styleslist: prefix-subject-suffix
+                self.templatelist = tuple(tuple(row) for row in templatelist)
+                self.styles = tuple((style.split("-subject-")[0], style.split("-subject-")[1]) for style in styleslist)
+                # every comma separated part after -subject- of the styles, once, in the order of the file
+                self.stylesuffixes = tuple(dict.fromkeys([value for prefix, suffix in self.styles for value in suffix.split(",")]))
+                self._templates = {}
+
+        def templates(self, subjecttype="all", environment="all", source="all"):
+                key = (subjecttype, environment, source)
+                templates = self._templates.get(key)
+                if(templates is None):
+                        rows = [row for row in self.templatelist if( (row[1] == environment or environment == "all") and (row[2] == source or source == "all") and (row[3] == subjecttype or subjecttype == "all") )]
+                        # a prompt that is in the file more than once always goes with the creator and subject of its first row
+                        first = {}
+                        for row in rows:
+                                first.setdefault(row[0], (row[1], row[4]))
+                        templates = tuple((row[0],) + first[row[0]] for row in rows)
+                        self._templates[key] = templates
+                return templates
 
 def load_config_csv(suffix=""):
         csvlist = []
@@ -198,65 +849,317 @@ def load_config_csv(suffix=""):
                 csvlist = [list(row.values()) for row in reader if not any(value.startswith('#') for value in row.values())]
         return csvlist
 
-def load_negative_list():
-        primerlist = []
-        negativelist = []
-        primeraddonlist = []
-        negativeaddonlist = []
+# Generation config
+# A config file compiled into a GenerationConfig, once per suffix, and again only when the file changes.
+# subject_* settings turn a type of subject on or off, the rest are a chance (see chance_roll) or an amount of repeats.
+_CONFIG_SUBJECTS = {
+        "subject_vehicle": "generatevehicle",
+        "subject_object": "generateobject",
+        "subject_food": "generatefood",
+        "subject_building": "generatebuilding",
+        "subject_space": "generatespace",
+        "subject_flora": "generateflora",
+        "subject_occult": "generateoccult",
+        "subject_animal": "generateanimal",
+        "subject_bird": "generatebird",
+        "subject_cat": "generatecat",
+        "subject_dog": "generatedog",
+        "subject_insect": "generateinsect",
+        "subject_pokemon": "generatepokemon",
+        "subject_marinelife": "generatemarinelife",
+        "subject_manwoman": "generatemanwoman",
+        "subject_manwomanrelation": "generatemanwomanrelation",
+        "subject_manwomanmultiple": "generatemanwomanmultiple",
+        "subject_fictional": "generatefictionalcharacter",
+        "subject_nonfictional": "generatenonfictionalcharacter",
+        "subject_humanoid": "generatehumanoids",
+        "subject_job": "generatejob",
+        "subject_firstnames": "generatefirstnames",
+        "subject_location": "generatelocation",
+        "subject_location_fantasy": "generatelocationfantasy",
+        "subject_location_scifi": "generatelocationscifi",
+        "subject_location_videogame": "generatelocationvideogame",
+        "subject_location_biome": "generatelocationbiome",
+        "subject_location_city": "generatelocationcity",
+        "subject_event": "generateevent",
+        "subject_concept": "generateconcepts",
+        "subject_poemline": "generatepoemline",
+        "subject_songline": "generatesongline",
+        "subject_cardname": "generatecardname",
+        "subject_episodetitle": "generateepisodetitle"
+}
+_CONFIG_REPEATS = ["custominputprefixrepeats", "objectadditionsrepeats", "custominputmidrepeats", "custominputsuffixrepeats"]
+# the values used when the config file does not set them
+_CONFIG_DEFAULTS = {
+        "generatevehicle": True,
+        "generateobject": True,
+        "generatefood": True,
+        "generatebuilding": True,
+        "generatespace": True,
+        "generateflora": True,
+        "generateoccult": True,
+        "generateanimal": True,
+        "generatebird": True,
+        "generatecat": True,
+        "generatedog": True,
+        "generateinsect": True,
+        "generatepokemon": True,
+        "generatemarinelife": True,
+        "generatemanwoman": True,
+        "generatemanwomanrelation": True,
+        "generatemanwomanmultiple": True,
+        "generatefictionalcharacter": True,
+        "generatenonfictionalcharacter": True,
+        "generatehumanoids": True,
+        "generatejob": True,
+        "generatefirstnames": True,
+        "generatelocation": True,
+        "generatelocationfantasy": True,
+        "generatelocationscifi": True,
+        "generatelocationvideogame": True,
+        "generatelocationbiome": True,
+        "generatelocationcity": True,
+        "generateevent": True,
+        "generateconcepts": True,
+        "generatepoemline": True,
+        "generatesongline": True,
+        "generatecardname": True,
+        "generateepisodetitle": True,
+        "custominputprefixrepeats": 2,
+        "custominputprefixchance": "uncommon",
+        "imagetypechance": "normal",
+        "imagetypequalitychance": "rare",
+        "minilocationadditionchance": "unique",
+        "artmovementprefixchance": "unique",
+        "minivomitprefix1chance": "rare",
+        "minivomitprefix2chance": "unique",
+        "shotsizechance": "uncommon",
+        "subjectdescriptor1chance": "common",
+        "subjectdescriptor2chance": "uncommon",
+        "subjectbodytypechance": "normal",
+        "subjectculturechance": "normal",
+        "subjectconceptsuffixchance": "unique",
+        "subjectlandscapeinsideshotchance": "unique",
+        "subjectlandscapeaddonlocationchance": "normal",
+        "subjectlandscapeaddonlocationdescriptorchance": "rare",
+        "subjectlandscapeaddonlocationculturechance": "rare",
+        "objectadditionsrepeats": 2,
+        "objectadditionschance": "uncommon",
+        "humanadditionchance": "rare",
+        "overalladditionchance": "extraordinary",
+        "emojichance": "legendary",
+        "buildfacechance": "legendary",
+        "humanexpressionchance": "rare",
+        "humanvomitchance": "rare",
+        "joboractivitychance": "normal",
+        "custominputmidrepeats": 2,
+        "custominputmidchance": "uncommon",
+        "minivomitmidchance": "unique",
+        "outfitchance": "normal",
+        "posechance": "uncommon",
+        "hairchance": "normal",
+        "accessorychance": "normal",
+        "humanoidinsideshotchance": "legendary",
+        "humanoidbackgroundchance": "uncommon",
+        "landscapeminilocationchance": "uncommon",
+        "generalminilocationchance": "rare",
+        "timperiodchance": "normal",
+        "focuschance": "normal",
+        "directionchance": "normal",
+        "moodchance": "normal",
+        "minivomitsuffixchance": "unique",
+        "artmovementchance": "normal",
+        "lightingchance": "normal",
+        "photoadditionchance": "common",
+        "lenschance": "normal",
+        "colorschemechance": "normal",
+        "vomit1chance": "uncommon",
+        "vomit2chance": "uncommon",
+        "greatworkchance": "novel",
+        "poemlinechance": "novel",
+        "songlinechance": "novel",
+        "quality1chance": "uncommon",
+        "quality2chance": "uncommon",
+        "customstyle1chance": "uncommon",
+        "customstyle2chance": "uncommon",
+        "custominputsuffixrepeats": 2,
+        "custominputsuffixchance": "uncommon",
+        "artistsatbackchance": "uncommon",
+        # False when the chance of it is never
+        "generatecustominputprefix": True,
+        "generateimagetype": True,
+        "generateimagetypequality": True
+}
+GenerationConfig = namedtuple("GenerationConfig", list(_CONFIG_DEFAULTS))
+_config_cache = {}
 
+def load_config(suffix=""):
+        # the GenerationConfig of config.csv or config_<suffix>.csv in userfiles
         script_dir = os.path.dirname(os.path.abspath(__file__))
-        
-        full_path_default_negative_file = os.path.join(script_dir, "./csvfiles/special_lists/" )
-        negative_file = full_path_default_negative_file + 'negativewords.csv'
+        if(suffix != ""):
+                config_file = os.path.join(script_dir, "./userfiles/" ) + 'config_' + suffix + '.csv'
+        else:
+                config_file = os.path.join(script_dir, "./userfiles/" ) + 'config.csv'
+        filestamp = _file_stamp(config_file)
+        cached = _config_cache.get(suffix)
+        if(cached is not None and filestamp is not None and cached[0] == filestamp):
+                return cached[1]
 
-        full_path_replace_negative_file = os.path.join(script_dir, "./userfiles/" )
-        replace_negative_file = full_path_replace_negative_file + 'negativewords_replace.csv'
+        # only one thread at a time, as this can write the config file
+        with _corpus_lock:
+                cached = _config_cache.get(suffix)
+                if(cached is not None and filestamp is not None and cached[0] == filestamp):
+                        return cached[1]
+                # this also creates the config file from the default one when it isn't there yet
+                config = load_config_csv(suffix)
+                values = dict(_CONFIG_DEFAULTS)
+                for item in config:
+                        if(item[0] in _CONFIG_SUBJECTS):
+                                if(item[1] != 'on'):
+                                        values[_CONFIG_SUBJECTS[item[0]]] = False
+                        elif(item[0] in _CONFIG_REPEATS):
+                                values[item[0]] = int(item[1])
+                        elif(item[0] in _CONFIG_DEFAULTS and not item[0].startswith("generate")):
+                                values[item[0]] = item[1]
+                if(values["custominputprefixchance"] == 'never'):
+                        values["generatecustominputprefix"] = False
+                if(values["imagetypechance"] == 'never'):
+                        values["generateimagetype"] = False
+                if(values["imagetypequalitychance"] == 'never'):
+                        values["generateimagetypequality"] = False
 
-        full_path_addon_negative_file = os.path.join(script_dir, "./userfiles/" )
-        addon_negative_file = full_path_addon_negative_file + 'negativewords_addon.csv'
+                generationconfig = GenerationConfig(**values)
+                _config_cache[suffix] = (_file_stamp(config_file), generationconfig)
+        return generationconfig
 
+# Negative word table
+# negativewords.csv (or the _replace file in userfiles), with the _addon file from userfiles after it.
+# primer: a word that triggers the negative, negative: what to put in the negative prompt for it.
+class NegativeWordTable:
+        def __init__(self, primerlist, negativelist):
+                self.primerlist = primerlist
+                self.negativelist = negativelist
+                # primer -> negative, the first row of a primer wins, like list.index() did
+                self.negatives = {}
+                for primer, negative in zip(primerlist, negativelist):
+                        self.negatives.setdefault(primer, negative)
 
-        if(os.path.isfile(replace_negative_file)):
-                negative_file = replace_negative_file
+        def match(self, words):
+                # the negatives of every word that is a primer, in the order of the words
+                negatives = self.negatives
+                return [negatives[word.lower()] for word in words if word.lower() in negatives]
 
-        with open(negative_file, "r", newline="",encoding="utf8") as file:
-                reader = csv.DictReader(file, delimiter=";")
-                primerlist = [row["primer"] for row in reader]
-        with open(negative_file, "r", newline="",encoding="utf8") as file:
-                reader = csv.DictReader(file, delimiter=";")
-                negativelist = [row["negative"] for row in reader]
+def _dict_reader_columns(rows, columns):
+        # the columns of a parsed file like csv.DictReader gives them: header first, no empty rows, None for missing values
+        header = {category: column for column, category in enumerate(rows[0])} if rows else {}
+        result = []
+        for category in columns:
+                column = header[category] if rows else None
+                result.append([row[column] if column < len(row) else None for row in rows[1:] if row])
+        return result
 
+_negative_word_table = None
 
-        if(os.path.isfile(addon_negative_file)):
-                with open(addon_negative_file, "r", newline="",encoding="utf8") as file:
-                        reader = csv.DictReader(file, delimiter=";")
-                        primeraddonlist = [row["primer"] for row in reader]
-                with open(addon_negative_file, "r", newline="",encoding="utf8") as file:
-                        reader = csv.DictReader(file, delimiter=";")
-                        negativeaddonlist = [row["negative"] for row in reader]
-        
-        primerlist += primeraddonlist
-        negativelist += negativeaddonlist
+def get_negative_word_table():
+        # rebuilt when one of the files changes
+        global _negative_word_table
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        userfilesfolder = os.path.join(script_dir, "./userfiles/" )
+        negative_file = os.path.join(script_dir, "./csvfiles/special_lists/" ) + 'negativewords.csv'
+        userfiles = _list_files(userfilesfolder, "negativewords")
+        if("replace" in userfiles):
+                negative_file = userfilesfolder + 'negativewords_replace.csv'
+        negativerows = _read_csv_rows(negative_file, ";")
+        if(negativerows is None):
+                raise FileNotFoundError(negative_file)
+        addonrows = None
+        if("addon" in userfiles):
+                addonrows = _read_csv_rows(userfilesfolder + 'negativewords_addon.csv', ";")
 
+        negativewordtable = _negative_word_table
+        if(negativewordtable is None or negativewordtable[0] is not negativerows or negativewordtable[1] is not addonrows):
+                with _corpus_lock:
+                        primerlist, negativelist = _dict_reader_columns(negativerows, ["primer", "negative"])
+                        if(addonrows is not None):
+                                primeraddonlist, negativeaddonlist = _dict_reader_columns(addonrows, ["primer", "negative"])
+                                primerlist += primeraddonlist
+                                negativelist += negativeaddonlist
+                        negativewordtable = (negativerows, addonrows, NegativeWordTable(primerlist, negativelist))
+                        _negative_word_table = negativewordtable
+        return negativewordtable[2]
 
-        return primerlist, negativelist
+def load_negative_list():
+        negativewordtable = get_negative_word_table()
+        return list(negativewordtable.primerlist), list(negativewordtable.negativelist)
 
 def load_all_artist_and_category():
-        artistlist = []
-        categorylist = []
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        
-        full_path_default_artist_file = os.path.join(script_dir, "./csvfiles/" )
-        artist_file = full_path_default_artist_file + 'artists_and_category.csv'
+        artistcategoryindex = get_artist_category_index("artists_and_category")
+        return list(artistcategoryindex.artists), list(artistcategoryindex.tags)
+
+# Artist rewriter
+# build_dynamic_negative and enhance_positive look at the style of an artist instead of the name.
+# All shorthands and artist names are put in one regex, shaped like a trie so every position of the prompt is only tried once.
+# The prompt is lowercased, and every name is replaced with the tags of the artist, the longest name wins.
+class ArtistRewriter:
+        def __init__(self, artistlist, categorylist, artistshorthands):
+                self.replacements = {}
+                for artist, category in zip(artistlist, categorylist):
+                        artist = artist.strip().lower()
+                        if(artist and artist not in self.replacements):
+                                self.replacements[artist] = category
+                # "van gogh;Vincent van Gogh", goes to the tags of Vincent van Gogh straight away
+                shorthandreplacements = {}
+                for shorthand in artistshorthands:
+                        parts = shorthand.split(';')
+                        if(len(parts) > 1 and parts[0]):
+                                fullname = parts[1].lower()
+                                shorthandreplacements[parts[0].lower()] = self.replacements.get(fullname, fullname)
+                self.replacements.update(shorthandreplacements)
+                self._pattern = re.compile(_trie_pattern(self.replacements)) if self.replacements else None
+
+        def rewrite(self, prompt):
+                prompt = prompt.lower()
+                if(self._pattern is None):
+                        return prompt
+                replacements = self.replacements
+                return self._pattern.sub(lambda match: replacements[match.group(0)], prompt)
+
+def _trie_pattern(words):
+        # regex that matches the longest of the words, eg ["ab", "abc", "ad"] -> a(?:b(?:c)?|d)
+        trie = {}
+        for word in words:
+                node = trie
+                for char in word:
+                        node = node.setdefault(char, {})
+                node[""] = {}
+
+        def node_pattern(node):
+                alternatives = [re.escape(char) + node_pattern(child) for char, child in sorted(node.items()) if char != ""]
+                if(not alternatives):
+                        return ""
+                if(len(alternatives) == 1 and "" not in node):
+                        return alternatives[0]
+                pattern = "(?:" + "|".join(alternatives) + ")"
+                # the word can end here as well, the greedy ? still tries the longer words first
+                if("" in node):
+                        pattern += "?"
+                return pattern
+
+        return node_pattern(trie)
 
-        with open(artist_file, "r", newline="",encoding="utf8") as file:
-                reader = csv.DictReader(file, delimiter=",")
-                artistlist = [row["Artist"] for row in reader]
-        with open(artist_file, "r", newline="",encoding="utf8") as file:
-                reader = csv.DictReader(file, delimiter=",")
-                categorylist = [row["Tags"] for row in reader]
+_artist_rewriter = None
 
-        return artistlist, categorylist
+def get_artist_rewriter():
+        # rebuilt when the artists or the shorthands change
+        global _artist_rewriter
+        artistcategoryindex = get_artist_category_index("artists_and_category")
+        artistshorthands = tuple(csv_to_list(csvfilename="artistshorthands",directory="./csvfiles/special_lists/",delimiter="?"))
+        artistrewriter = _artist_rewriter
+        if(artistrewriter is None or artistrewriter[0] is not artistcategoryindex or artistrewriter[1] != artistshorthands):
+                with _corpus_lock:
+                        artistrewriter = (artistcategoryindex, artistshorthands, ArtistRewriter(artistcategoryindex.artists, artistcategoryindex.tags, artistshorthands))
+                        _artist_rewriter = artistrewriter
+        return artistrewriter[2]
 
 def sort_and_dedupe_csv_file():
         tokenlist = csv_to_list(csvfilename="tokens",skipheader=False)
@@ -284,3 +1187,6 @@ def sort_and_dedupe_csv_file():
 
 # sort_and_dedupe_csv_file()
 
+if __name__ == "__main__":
+        # python csv_reader.py  --> (re)build the compiled corpus
+        compile_corpus()
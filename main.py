@@ -105,7 +105,9 @@ def generateimages(amount = 1, size = "all",model = "currently selected model",s
     else:
         upscalescript="Ultimate SD upscale"
 
-    
+    # the shared prompt generator, so the lists and config stay set up from one run to the next
+    promptgenerator = get_prompt_generator()
+
     while steps < loops:
         # load the base model as a workaround
         if(steps > 0 and increasestability == True):
@@ -136,7 +138,7 @@ def generateimages(amount = 1, size = "all",model = "currently selected model",s
                 
 
             else:    
-                randompromptlist = build_dynamic_prompt(insanitylevel,subject,artist,imagetype, False,antistring,prefixprompt,suffixprompt,promptcompounderlevel, seperator,givensubject,smartsubject,giventypeofimage,imagemodechance, gender, chosensubjectsubtypeobject, chosensubjectsubtypehumanoid, chosensubjectsubtypeconcept,True,False,-1,givenoutfit, prompt_g_and_l=True, base_model=base_model, OBP_preset=OBP_preset, prompt_enhancer=promptenhancer, preset_prefix=presetprefix, preset_suffix=presetsuffix)
+                randompromptlist = promptgenerator.generate(insanitylevel=insanitylevel, forcesubject=subject, artists=artist, imagetype=imagetype, onlyartists=False, antivalues=antistring, prefixprompt=prefixprompt, suffixprompt=suffixprompt, promptcompounderlevel=promptcompounderlevel, seperator=seperator, givensubject=givensubject, smartsubject=smartsubject, giventypeofimage=giventypeofimage, imagemodechance=imagemodechance, gender=gender, subtypeobject=chosensubjectsubtypeobject, subtypehumanoid=chosensubjectsubtypehumanoid, subtypeconcept=chosensubjectsubtypeconcept, advancedprompting=True, hardturnoffemojis=False, seed=-1, overrideoutfit=givenoutfit, prompt_g_and_l=True, base_model=base_model, OBP_preset=OBP_preset, prompt_enhancer=promptenhancer, preset_prefix=presetprefix, preset_suffix=presetsuffix)
                 randomprompt = randompromptlist[0]
                 randomsubject = randompromptlist[1]
 
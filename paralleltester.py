@@ -0,0 +1,38 @@
+import sys, os
+import time
+import contextlib
+sys.path.append(os.path.abspath(".."))
+
+
+from build_dynamic_prompt import *
+
+# Benchmark for build_dynamic_prompts_parallel()
+# Builds the same seeds with build_dynamic_prompts() in this process, and with 1 worker and more workers, checks that all of them give exactly the same prompts and times them.
+
+
+def testparallel(amount = 400, seed = 1000, workerslist = [1, 2, 4, os.cpu_count()]):
+
+    start = time.perf_counter()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        expected = build_dynamic_prompts(amount, seed, insanitylevel = 5)
+    elapsed = time.perf_counter() - start
+    print("sequential: " + str(round(elapsed, 2)) + " seconds, " + str(round(amount / elapsed, 1)) + " prompts per second")
+
+    resultsperworkers = {}
+    for workers in sorted(set(workerslist)):
+        start = time.perf_counter()
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            results = list(build_dynamic_prompts_parallel(amount, seed, workers, insanitylevel = 5))
+        elapsed = time.perf_counter() - start
+        resultsperworkers[workers] = results
+        print(str(workers) + " workers: " + str(round(elapsed, 2)) + " seconds, " + str(round(amount / elapsed, 1)) + " prompts per second")
+
+    for workers, results in resultsperworkers.items():
+        differences = sum(1 for result, expectedresult in zip(results, expected) if result != expectedresult) + abs(len(results) - len(expected))
+        print(str(workers) + " workers: " + str(len(results)) + " prompts, " + str(differences) + " different from sequential")
+
+    print("")
+    print("All done!")
+
+if __name__ == "__main__":
+    testparallel(400, 1000)
@@ -1,45 +1,49 @@
 import random
-def common_dist(insanitylevel):
-    return (random.randint(1, 5)<insanitylevel or insanitylevel >= 10)
 
-def normal_dist(insanitylevel):
-    return (random.randint(1, 10)<insanitylevel or insanitylevel >= 10)
+# every roll takes an optional rng, so a prompt can be generated from its own random.Random
+# instead of the shared module state. Without one, the module random is used as before.
 
-def uncommon_dist(insanitylevel):
-    return (random.randint(1, 18)<insanitylevel or insanitylevel >= 10)
+def common_dist(insanitylevel, rng=random):
+    return (rng.randint(1, 5)<insanitylevel or insanitylevel >= 10)
 
-def rare_dist(insanitylevel):
-    roll = (random.randint(1, 30)<insanitylevel or insanitylevel >= 10)
+def normal_dist(insanitylevel, rng=random):
+    return (rng.randint(1, 10)<insanitylevel or insanitylevel >= 10)
+
+def uncommon_dist(insanitylevel, rng=random):
+    return (rng.randint(1, 18)<insanitylevel or insanitylevel >= 10)
+
+def rare_dist(insanitylevel, rng=random):
+    roll = (rng.randint(1, 30)<insanitylevel or insanitylevel >= 10)
     if(roll):
         print("adding something rare to the prompt")
     return roll
 
-def legendary_dist(insanitylevel):
-        roll = (random.randint(1, 50)<insanitylevel)
+def legendary_dist(insanitylevel, rng=random):
+        roll = (rng.randint(1, 50)<insanitylevel)
         if(roll):
             print("Nice! adding something legendary to the prompt")
         return roll
 
-def unique_dist(insanitylevel):
-        roll = (random.randint(1, 75)<insanitylevel)
+def unique_dist(insanitylevel, rng=random):
+        roll = (rng.randint(1, 75)<insanitylevel)
         if(roll):
             print("Critical hit! Something unique has been added to the prompt")
         return roll
 
-def extraordinary_dist(insanitylevel):
-        roll = (random.randint(1, 200)<insanitylevel)
+def extraordinary_dist(insanitylevel, rng=random):
+        roll = (rng.randint(1, 200)<insanitylevel)
         if(roll):
             print("Extraordinary! Something special has been added to the prompt")
         return roll
 
-def novel_dist(insanitylevel):
-        roll = (random.randint(1, 500)<insanitylevel)
+def novel_dist(insanitylevel, rng=random):
+        roll = (rng.randint(1, 500)<insanitylevel)
         if(roll):
             print("Uh, something novel has been added to the prompt. Interesting.")
         return roll
 
 
-def chance_roll(insanitylevel, chance):
+def chance_roll(insanitylevel, chance, rng=random):
     chance_mapping = {
         'never': {'set_number': 0, 'message': ""},
         'novel': {'set_number': 500, 'message': "Uh, something novel has been added to the prompt. Interesting."},
@@ -63,9 +67,59 @@ def chance_roll(insanitylevel, chance):
             if(message != ""):
                 print(message)
             return True 
-        roll = random.randint(1, set_number) < insanitylevel
+        roll = rng.randint(1, set_number) < insanitylevel
         if(message != "" and roll == True):
                 print(message)
         return roll
     else:
         raise ValueError(f"Invalid chance value: {chance}")
+
+# the random.Random to generate with
+# a seed above 0 (re)seeds the given rng, or a new one, so it never touches the shared module random
+# without a seed, it keeps on working on the given rng, or on the module random based on an earlier set seed
+def get_rng(seed = -1, rng = None):
+    if(rng is None):
+        rng = random
+    if(seed > 0):
+        if(rng is random):
+            rng = random.Random()
+        rng.seed(seed)
+    return rng
+
+# draws values from a list without putting them back, the list itself is never changed
+# A draw swaps the drawn position with the last one still in the deck, only the swapped positions are remembered,
+# so a draw costs the same on a list of 10 or 100000 values, and making a deck costs nothing.
+class Deck:
+    def __init__(self, values, rng=random):
+        self.values = values
+        self.rng = rng
+        self.left = None
+        self.swapped = {}
+
+    def __len__(self):
+        if(self.left is None):
+            self.left = len(self.values)
+        return self.left
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def _pick(self):
+        left = len(self)
+        if(left == 0):
+            raise IndexError("Cannot draw from an empty deck")
+        return self.rng.randrange(left)
+
+    # random value, and take it out of the deck
+    def draw(self):
+        position = self._pick()
+        last = self.left - 1
+        value = self.values[self.swapped.get(position, position)]
+        self.swapped[position] = self.swapped.pop(last, last)
+        self.left = last
+        return value
+
+    # random value, but leave it in the deck
+    def choice(self):
+        position = self._pick()
+        return self.values[self.swapped.get(position, position)]
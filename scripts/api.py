@@ -51,7 +51,7 @@ def one_button_prompt_api(_: gr.Blocks, app: FastAPI):
             for key in keys:
                 payload[key] = locals()[key]
             
-            prompts = [build_dynamic_prompt(**payload) for _ in range(numberofprompts)]
+            prompts = [result[0] for result in build_dynamic_prompts(numberofprompts, **payload)]
             return {"prompts": prompts}
 
 
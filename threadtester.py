@@ -0,0 +1,56 @@
+import sys, os
+import time
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+sys.path.append(os.path.abspath(".."))
+
+
+from build_dynamic_prompt import *
+
+# Stress test for generating from multiple threads
+# Runs build_dynamic_prompt, createpromptvariant and artify_prompt with fixed seeds, first one by one and then from a pool of threads,
+# starting from an empty cache so the threads also load the corpus at the same time. All outputs have to be the same as the serial ones.
+
+imagetypes = ["all", "all - anime", "only templates mode", "art blaster mode", "quality vomit mode", "color cannon mode", "unique art mode", "massive madness mode", "photo fantasy mode", "subject only mode", "fixed styles mode", "dynamic templates mode", "artify mode", "only other types"]
+artifymodes = ["standard", "remix", "super remix turbo", "dynamic"]
+
+def generation(seed):
+    # the same seed always gives the same call
+    kind = seed % 3
+    if(kind == 0):
+        return build_dynamic_prompt(insanitylevel = seed % 10 + 1, imagetype = imagetypes[seed // 3 % len(imagetypes)], seed = seed)
+    if(kind == 1):
+        return createpromptvariant("a beautiful woman with a red dress in a forest, by greg rutkowski", insanitylevel = seed % 10 + 1, seed = seed)
+    return artify_prompt(prompt = "a norwegian forest cat", amountofartists = ["1", "2", "random"][seed // 3 % 3], mode = artifymodes[seed // 3 % 4], seed = seed)
+
+def testthreads(amount = 300, threads = 8, rounds = 3):
+
+    seeds = list(range(1000, 1000 + amount))
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        expected = [generation(seed) for seed in seeds]
+        serialtime = time.perf_counter() - start
+
+    print("serial: " + str(round(serialtime, 2)) + " seconds")
+
+    failures = 0
+    for i in range(0, rounds):
+        clear_csv_cache()
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers = threads) as pool:
+                results = list(pool.map(generation, seeds))
+            threadedtime = time.perf_counter() - start
+        differences = sum(1 for result, expectedresult in zip(results, expected) if result != expectedresult)
+        failures += differences
+        print("round " + str(i + 1) + ", " + str(threads) + " threads: " + str(round(threadedtime, 2)) + " seconds, " + str(differences) + " of " + str(amount) + " different")
+
+    print("")
+    if(failures == 0):
+        print("All done!")
+    else:
+        print(str(failures) + " outputs did not match the serial run")
+
+if __name__ == "__main__":
+    testthreads(300, 8, 3)